@@ -1,5 +1,14 @@
-from .dijkstra import dijkstra, reconstruct_path
-from .bellman_ford import bellman_ford
+from .dijkstra import dijkstra, bidirectional_dijkstra, reconstruct_path
+from .bellman_ford import bellman_ford, bellman_ford_spfa
 from .floyd_warshall import floyd_warshall
+from .astar import astar, euclidean_heuristic
+from .contraction_hierarchies import ContractionHierarchy
+from .alt import LandmarkIndex
+from .johnson import johnson
+from .path_cache import PathCache
+from .k_shortest_paths import k_shortest_paths
+from .scc import SCCIndex
 
-__all__ = ['dijkstra', 'reconstruct_path', 'bellman_ford', 'floyd_warshall']
+__all__ = ['dijkstra', 'bidirectional_dijkstra', 'reconstruct_path', 'bellman_ford', 'bellman_ford_spfa',
+           'floyd_warshall', 'astar', 'euclidean_heuristic', 'ContractionHierarchy', 'LandmarkIndex',
+           'johnson', 'PathCache', 'k_shortest_paths', 'SCCIndex']
@@ -0,0 +1,81 @@
+"""
+Utilidades compartidas para repartir trabajo sobre un CompactGraph entre
+procesos (ProcessPoolExecutor).
+
+El grafo se envía a cada worker una sola vez, en el initializer:
+    - si hay un snapshot en disco se envía solo su ruta y cada worker lo
+      abre con mmap (una única copia física compartida por todos),
+    - si no, se envían los tres buffers del CSR (sin columnas de nodos).
+"""
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from models.compact_graph import CompactGraph
+from models.snapshot import load_snapshot
+
+# Estado de cada proceso worker (lo llena init_worker)
+_worker_state: Dict = {}
+
+
+def graph_payload(graph: CompactGraph, snapshot_path: Optional[str] = None):
+    """Lo mínimo que hay que mandar a un worker para reconstruir el grafo."""
+    if snapshot_path is not None:
+        return ('snapshot', snapshot_path)
+    return ('csr', list(graph.node_ids), _as_array('q', graph.indptr),
+            _as_array('i', graph.indices), _as_array('d', graph.weights))
+
+
+def graph_from_payload(payload) -> CompactGraph:
+    if payload[0] == 'snapshot':
+        return load_snapshot(payload[1], mmap=True)
+    _, node_ids, indptr, indices, weights = payload
+    return CompactGraph(node_ids, indptr, indices, weights)
+
+
+def init_worker(payload, extra=None):
+    """Initializer del pool: deja el grafo (y datos extra) en el estado del proceso."""
+    _worker_state['graph'] = graph_from_payload(payload)
+    _worker_state['extra'] = extra
+
+
+def worker_state() -> Tuple[CompactGraph, object]:
+    return _worker_state['graph'], _worker_state['extra']
+
+
+def imap_ordered(task: Callable, chunks: Iterable, graph: CompactGraph, extra=None,
+                 workers: Optional[int] = None, snapshot_path: Optional[str] = None) -> Iterator:
+    """
+    Ejecuta task(chunk) en un pool de procesos y entrega los resultados en el
+    orden de chunks. task debe ser una función de módulo que lea el grafo con
+    worker_state(). Solo hay unas pocas tareas pendientes a la vez, así la
+    memoria no crece aunque quien consume los resultados sea lento.
+    """
+    payload = graph_payload(graph, snapshot_path)
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(payload, extra)) as executor:
+        window = (workers or os.cpu_count() or 1) * 2
+        pending = deque()
+        remaining = iter(chunks)
+        for chunk in remaining:
+            pending.append(executor.submit(task, chunk))
+            if len(pending) >= window:
+                break
+        while pending:
+            result = pending.popleft().result()
+            next_chunk = next(remaining, None)
+            if next_chunk is not None:
+                pending.append(executor.submit(task, next_chunk))
+            yield result
+
+
+def _as_array(typecode: str, buffer) -> array:
+    # Los memoryview de un snapshot no se pueden serializar con pickle
+    if isinstance(buffer, array):
+        return buffer
+    result = array(typecode)
+    result.frombytes(memoryview(buffer).cast('B'))
+    return result
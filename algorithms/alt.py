@@ -0,0 +1,176 @@
+"""
+ALT: A* + Landmarks + desigualdad triangular.
+
+Se eligen k landmarks por selección del punto más lejano y se guardan las
+distancias desde y hacia cada uno. Para cualquier nodo v y destino t:
+
+    d(v, t) >= d(L, t) - d(L, v)      (distancias desde el landmark)
+    d(v, t) >= d(v, L) - d(t, L)      (distancias hacia el landmark)
+
+El máximo sobre los landmarks es una cota inferior admisible que no depende
+de coordenadas, útil en el grafo por clusters o en los de noticias.
+"""
+
+import pickle
+import random
+from array import array
+from typing import Dict, List, Tuple, Optional
+
+from models.graph import Graph
+from models.compact_graph import CompactGraph
+from .dijkstra import _dijkstra_compact_all
+from .astar import _astar_search
+
+ALT_FORMAT_VERSION = 1
+
+
+class LandmarkIndex:
+
+    def __init__(self, graph: CompactGraph, landmarks: List[int],
+                 from_landmark: List[array], to_landmark: List[array]):
+        """
+        Usar LandmarkIndex.build() o LandmarkIndex.load().
+
+        Args:
+            graph: Grafo compacto sobre el que se calcularon las distancias
+            landmarks: Índices de los landmarks
+            from_landmark: Por landmark, distancias d(L, v) para todo v
+            to_landmark: Por landmark, distancias d(v, L) para todo v
+        """
+        self.graph = graph
+        self.landmarks = landmarks
+        self.from_landmark = from_landmark
+        self.to_landmark = to_landmark
+
+    @classmethod
+    def build(cls, graph: Graph, k: int = 8, seed: Optional[int] = None) -> 'LandmarkIndex':
+        """
+        Elige k landmarks (punto más lejano) y calcula sus distancias.
+
+        Args:
+            graph: Graph o CompactGraph (pesos no negativos)
+            k: Número de landmarks
+            seed: Semilla para elegir el primer landmark
+        """
+        if not isinstance(graph, CompactGraph):
+            graph = graph.to_compact()
+        n = graph.num_nodes
+        reverse = graph.reverse()
+        infinity = float('infinity')
+
+        landmarks: List[int] = []
+        from_landmark: List[array] = []
+        to_landmark: List[array] = []
+        # Distancia mínima (en cualquier sentido) de cada nodo al conjunto de landmarks
+        closest = [infinity] * n
+        candidate = random.Random(seed).randrange(n) if n else None
+
+        while candidate is not None and len(landmarks) < min(k, n):
+            landmarks.append(candidate)
+            forward, _ = _dijkstra_compact_all(graph, candidate)
+            backward, _ = _dijkstra_compact_all(reverse, candidate)
+            from_landmark.append(array('d', forward))
+            to_landmark.append(array('d', backward))
+
+            for v in range(n):
+                closest[v] = min(closest[v], forward[v], backward[v])
+
+            # Siguiente: el nodo más lejano a todos los landmarks (los no
+            # alcanzados tienen infinito y se eligen primero)
+            candidate = max(range(n), key=closest.__getitem__)
+            if closest[candidate] == 0:
+                candidate = None
+
+        return cls(graph, landmarks, from_landmark, to_landmark)
+
+    def lower_bound(self, v: int, t: int) -> float:
+        """Cota inferior de d(v, t) por índices; infinito si t es inalcanzable desde v."""
+        return self._bound_to(t)(v)
+
+    def _bound_to(self, t: int):
+        """Heurística hacia t con los valores d(L, t) y d(t, L) ya extraídos."""
+        infinity = float('infinity')
+        terms = [(from_l, from_l[t], to_l, to_l[t])
+                 for from_l, to_l in zip(self.from_landmark, self.to_landmark)]
+
+        def bound(v: int) -> float:
+            best = 0.0
+            for from_l, l_t, to_l, t_l in terms:
+                l_v = from_l[v]
+                if l_v != infinity:
+                    if l_t == infinity:
+                        return infinity  # L llega a v pero no a t => v no llega a t
+                    if l_t - l_v > best:
+                        best = l_t - l_v
+                if t_l != infinity:
+                    v_l = to_l[v]
+                    if v_l == infinity:
+                        return infinity  # t llega a L pero v no => v no llega a t
+                    if v_l - t_l > best:
+                        best = v_l - t_l
+            return best
+
+        return bound
+
+    def query(self, start: str, end: str, stats: Optional[Dict] = None) -> Tuple[Optional[float], Optional[List[str]]]:
+        """
+        A* guiado por los landmarks.
+
+        Args:
+            start: Nodo inicial
+            end: Nodo final
+            stats: Diccionario opcional donde se deja 'settled' (nodos cerrados),
+                   comparable con el de dijkstra(..., stats)
+
+        Returns:
+            (distancia, camino) o (None, None) si no hay camino, igual que dijkstra
+        """
+        graph = self.graph
+        if not graph.node_exists(start):
+            raise ValueError(f"El nodo inicial '{start}' no existe en el grafo")
+        if not graph.node_exists(end):
+            raise ValueError(f"El nodo final '{end}' no existe en el grafo")
+
+        s, t = graph.index_of(start), graph.index_of(end)
+        bound = self._bound_to(t)
+        if bound(s) == float('infinity'):
+            if stats is not None:
+                stats['settled'] = 0
+            return None, None
+
+        distance, path = _astar_search(s, t, graph.neighbors_of, bound, stats)
+        if path is None:
+            return None, None
+        node_ids = graph.node_ids
+        return distance, [node_ids[i] for i in path]
+
+    def save(self, filepath: str):
+        """Guarda las distancias de los landmarks (por ejemplo junto al snapshot del grafo)."""
+        data = {
+            'version': ALT_FORMAT_VERSION,
+            'node_ids': list(self.graph.node_ids),
+            'landmarks': self.landmarks,
+            'from_landmark': self.from_landmark,
+            'to_landmark': self.to_landmark,
+        }
+        with open(filepath, 'wb') as file:
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, filepath: str, graph: Graph) -> 'LandmarkIndex':
+        """
+        Carga un índice guardado con save().
+
+        Args:
+            filepath: Archivo del índice
+            graph: El mismo grafo con el que se construyó (Graph o CompactGraph)
+        """
+        with open(filepath, 'rb') as file:
+            data = pickle.load(file)
+        if data.get('version') != ALT_FORMAT_VERSION:
+            raise ValueError(f"Versión de índice de landmarks no soportada: {data.get('version')}")
+        if not isinstance(graph, CompactGraph):
+            graph = graph.to_compact()
+        if list(graph.node_ids) != data['node_ids']:
+            raise ValueError("El índice de landmarks no corresponde a este grafo")
+        return cls(graph, data['landmarks'], data['from_landmark'], data['to_landmark'])
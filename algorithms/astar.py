@@ -0,0 +1,148 @@
+import heapq
+import math
+from typing import Callable, Dict, List, Tuple, Optional
+from models.graph import Graph
+from models.compact_graph import CompactGraph
+from .scc import known_unreachable
+
+# En CityGraphGenerator las autopistas cuestan 0.6 x la distancia euclidiana y
+# el resto de calles al menos 0.8 x (ciudad aleatoria). Escalar la distancia en
+# línea recta por el menor factor garantiza que la heurística nunca sobreestime (admisible).
+HIGHWAY_FACTOR = 0.6
+
+
+def euclidean_heuristic(graph: Graph, end: str, scale: float = HIGHWAY_FACTOR) -> Callable[[str], float]:
+    """
+    Heurística de distancia en línea recta hasta end usando node.x / node.y.
+
+    Args:
+        graph: Graph o CompactGraph con coordenadas cargadas
+               (por ejemplo con Graph.load_node_positions); sin ellas la
+               heurística vale 0
+        end: Nodo destino
+        scale: Costo mínimo por unidad de distancia euclidiana en el grafo
+
+    Returns:
+        Función nodo -> cota inferior del costo restante
+    """
+    if isinstance(graph, CompactGraph) and graph.node_table is None:
+        return _zero_heuristic  # Sin coordenadas (CSV sin posiciones o snapshot sin nodos)
+
+    target = graph.get_node(end)
+    target_x, target_y = target.x, target.y
+
+    if isinstance(graph, CompactGraph):
+        xs, ys, index = graph.node_table.x, graph.node_table.y, graph.index
+        return lambda node_id: scale * math.hypot(xs[index[node_id]] - target_x, ys[index[node_id]] - target_y)
+
+    get_node = graph.get_node
+
+    def bound(node_id: str) -> float:
+        node = get_node(node_id)
+        return scale * math.hypot(node.x - target_x, node.y - target_y)
+
+    return bound
+
+
+def _zero_heuristic(node_id: str) -> float:
+    return 0
+
+
+def _default_heuristic(graph: Graph, end: str) -> Callable[[str], float]:
+    """
+    euclidean_heuristic salvo en grafos de noticias: ahí x es la fecha y y es
+    aleatoria, así que la distancia en el plano no acota el costo restante.
+    """
+    target = graph.get_node(end)
+    if target is not None and target.date:
+        return _zero_heuristic
+    return euclidean_heuristic(graph, end)
+
+
+def astar(graph: Graph, start: str, end: str,
+          heuristic: Optional[Callable[[str], float]] = None,
+          stats: Optional[Dict] = None) -> Tuple[Optional[float], Optional[List[str]]]:
+    """
+    Búsqueda A*: Dijkstra guiado por una cota inferior de la distancia restante.
+
+    Args:
+        graph: Graph o CompactGraph (pesos no negativos)
+        start: Nodo inicial
+        end: Nodo final
+        heuristic: Función nodo -> cota inferior hasta end. Por defecto
+                   euclidean_heuristic; si los nodos no tienen coordenadas o
+                   son noticias (x = fecha) vale 0 y A* se comporta igual
+                   que Dijkstra
+        stats: Diccionario opcional donde se deja 'settled' (nodos expandidos)
+
+    Returns:
+        (distancia, camino) o (None, None) si no hay camino, igual que dijkstra
+    """
+    if not graph.node_exists(start):
+        raise ValueError(f"El nodo inicial '{start}' no existe en el grafo")
+    if not graph.node_exists(end):
+        raise ValueError(f"El nodo final '{end}' no existe en el grafo")
+
+    # Con un SCCIndex vigente, "sin camino" se responde sin explorar
+    if known_unreachable(graph, start, end):
+        if stats is not None:
+            stats['settled'] = 0
+        return None, None
+
+    if heuristic is None:
+        heuristic = _default_heuristic(graph, end)
+
+    if isinstance(graph, CompactGraph):
+        node_ids = graph.node_ids
+        distance, path = _astar_search(graph.index_of(start), graph.index_of(end), graph.neighbors_of,
+                                       lambda i: heuristic(node_ids[i]), stats)
+        if path is None:
+            return None, None
+        return distance, [node_ids[i] for i in path]
+
+    return _astar_search(start, end, graph.get_neighbors, heuristic, stats)
+
+
+def _astar_search(start, end, neighbors, heuristic, stats):
+    infinity = float('infinity')
+    g_score = {start: 0}
+    previous = {start: None}
+    settled = 0
+
+    # Cola de prioridad: (g + h, g, nodo)
+    priority_queue = [(heuristic(start), 0, start)]
+    while priority_queue:
+        _, current_distance, current_node = heapq.heappop(priority_queue)
+
+        # Entrada vieja: ya se encontró un camino mejor a este nodo
+        if current_distance > g_score[current_node]:
+            continue
+
+        settled += 1
+        if current_node == end:
+            break
+
+        for neighbor, weight in neighbors(current_node):
+            distance = current_distance + weight
+            if distance < g_score.get(neighbor, infinity):
+                estimate = heuristic(neighbor)
+                if estimate == infinity:
+                    continue  # La heurística asegura que desde aquí no se llega a end
+                g_score[neighbor] = distance
+                previous[neighbor] = current_node
+                heapq.heappush(priority_queue, (distance + estimate, distance, neighbor))
+
+    if stats is not None:
+        stats['settled'] = settled
+
+    if end not in g_score:
+        return None, None
+
+    path = []
+    current = end
+    while current is not None:
+        path.append(current)
+        current = previous[current]
+    path.reverse()
+
+    return g_score[end], path
@@ -1,5 +1,8 @@
+from collections import deque
 from typing import Dict, List, Tuple, Optional
 from models.graph import Graph
+from models.compact_graph import CompactGraph
+from .dijkstra import _reconstruct_index_path
 
 
 def bellman_ford(graph: Graph, start: str, end: str) -> Tuple[Optional[float], Optional[List[str]], bool]:
@@ -7,6 +10,9 @@ def bellman_ford(graph: Graph, start: str, end: str) -> Tuple[Optional[float], O
         raise ValueError(f"El nodo inicial '{start}' no existe en el grafo")
     if not graph.node_exists(end):
         raise ValueError(f"El nodo final '{end}' no existe en el grafo")
+
+    if isinstance(graph, CompactGraph):
+        return _bellman_ford_compact(graph, start, end)
     
     nodes = graph.get_all_nodes()
     distances: Dict[str, float] = {node: float('infinity') for node in nodes}
@@ -15,6 +21,7 @@ def bellman_ford(graph: Graph, start: str, end: str) -> Tuple[Optional[float], O
     previous: Dict[str, Optional[str]] = {node: None for node in nodes}
 
     for _ in range(len(nodes) - 1):
+        changed = False
         for node in nodes:
             if distances[node] == float('infinity'):
                 continue
@@ -23,6 +30,11 @@ def bellman_ford(graph: Graph, start: str, end: str) -> Tuple[Optional[float], O
                 if distances[node] + weight < distances[neighbor]:
                     distances[neighbor] = distances[node] + weight
                     previous[neighbor] = node
+                    changed = True
+
+        # Una pasada sin cambios: las distancias ya convergieron
+        if not changed:
+            break
 
     has_negative_cycle = False
     for node in nodes:
@@ -62,3 +74,142 @@ def _reconstruct_path(previous: Dict[str, Optional[str]], start: str, end: str)
         return []
     
     return path
+
+
+def _bellman_ford_compact(graph: CompactGraph, start: str, end: str) -> Tuple[Optional[float], Optional[List[str]], bool]:
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    n = graph.num_nodes
+    s, t = graph.index_of(start), graph.index_of(end)
+    infinity = float('infinity')
+
+    distances = [infinity] * n
+    distances[s] = 0
+    previous = [-1] * n
+
+    for _ in range(n - 1):
+        changed = False
+        for u in range(n):
+            du = distances[u]
+            if du == infinity:
+                continue
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                if du + weights[k] < distances[v]:
+                    distances[v] = du + weights[k]
+                    previous[v] = u
+                    changed = True
+        if not changed:
+            break
+
+    for u in range(n):
+        du = distances[u]
+        if du == infinity:
+            continue
+        for k in range(indptr[u], indptr[u + 1]):
+            if du + weights[k] < distances[indices[k]]:
+                return None, None, True
+
+    if distances[t] == infinity:
+        return None, None, False
+
+    node_ids = graph.node_ids
+    return distances[t], [node_ids[i] for i in _reconstruct_index_path(previous, s, t)], False
+
+
+def bellman_ford_spfa(graph: Graph, start: str, end: str) -> Tuple[Optional[float], Optional[List[str]], bool]:
+    """
+    Bellman-Ford con cola (SPFA): solo se vuelven a procesar los nodos cuya
+    distancia bajó, y termina en cuanto la cola se vacía (convergencia).
+
+    Cada n relajaciones se revisa el grafo de predecesores: si tiene un
+    ciclo, ese ciclo es negativo (recorrido de padres amortizado), así un
+    ciclo negativo se detecta sin esperar |V| - 1 pasadas.
+
+    Args:
+        graph: Graph o CompactGraph
+        start: Nodo inicial
+        end: Nodo final
+
+    Returns:
+        Igual que bellman_ford: (distancia, camino, False), (None, None, False)
+        si no hay camino, o (None, ciclo, True) si hay un ciclo negativo
+        alcanzable desde start; ciclo es cerrado, p. ej. ['A', 'B', 'C', 'A']
+    """
+    if not graph.node_exists(start):
+        raise ValueError(f"El nodo inicial '{start}' no existe en el grafo")
+    if not graph.node_exists(end):
+        raise ValueError(f"El nodo final '{end}' no existe en el grafo")
+
+    if isinstance(graph, CompactGraph):
+        node_ids = graph.node_ids
+        distance, path, has_negative_cycle = _spfa(graph.index_of(start), graph.index_of(end),
+                                                   graph.num_nodes, graph.neighbors_of)
+        if path is not None:
+            path = [node_ids[i] for i in path]
+        return distance, path, has_negative_cycle
+
+    return _spfa(start, end, len(graph.get_all_nodes()), graph.get_neighbors)
+
+
+def _spfa(start, end, num_nodes: int, neighbors):
+    infinity = float('infinity')
+    distances = {start: 0}
+    previous = {start: None}
+    queue = deque([start])
+    in_queue = {start}
+    relaxations = 0
+
+    while queue:
+        node = queue.popleft()
+        in_queue.discard(node)
+        current_distance = distances[node]
+
+        for neighbor, weight in neighbors(node):
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, infinity):
+                distances[neighbor] = distance
+                previous[neighbor] = node
+
+                relaxations += 1
+                if relaxations % num_nodes == 0:
+                    cycle = _find_predecessor_cycle(previous)
+                    if cycle is not None:
+                        return None, cycle, True
+
+                if neighbor not in in_queue:
+                    queue.append(neighbor)
+                    in_queue.add(neighbor)
+
+    if end not in distances:
+        return None, None, False
+
+    path = []
+    current = end
+    while current is not None:
+        path.append(current)
+        current = previous[current]
+    path.reverse()
+    return distances[end], path, False
+
+
+def _find_predecessor_cycle(previous: Dict) -> Optional[List]:
+    """Busca un ciclo en el grafo de predecesores en O(V); lo devuelve en orden de recorrido."""
+    walked_from = {}
+    for root in previous:
+        node = root
+        while node is not None and node not in walked_from:
+            walked_from[node] = root
+            node = previous[node]
+
+        # Volver a un nodo de este mismo recorrido cierra un ciclo
+        if node is not None and walked_from[node] == root:
+            cycle = [node]
+            current = previous[node]
+            while current != node:
+                cycle.append(current)
+                current = previous[current]
+            cycle.append(node)
+            cycle.reverse()
+            return cycle
+
+    return None
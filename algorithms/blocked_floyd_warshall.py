@@ -0,0 +1,233 @@
+"""
+Floyd-Warshall por bloques (tiles) con matrices en disco (np.memmap).
+
+Para grafos cuya matriz n x n no entra en RAM: las distancias (float64) y
+los siguientes saltos (int32) viven en archivos dentro de workdir y se
+procesan bloque a bloque con el esquema clásico de tres fases por ronda:
+
+    1. bloque diagonal (kb, kb)
+    2. bloques de la fila kb y de la columna kb
+    3. el resto de bloques, usando los de las fases 1 y 2
+
+Solo hay unos pocos bloques en memoria a la vez. Al terminar cada ronda se
+guarda el progreso en meta.json; si el proceso se interrumpe, una nueva
+llamada continúa desde la última ronda completa (repetir una ronda a medias
+es seguro porque las distancias solo bajan y siempre son caminos reales; cada
+bloque escribe next_hop antes que dist, ver _store_tile).
+
+Requiere NumPy (pip install numpy).
+"""
+
+import hashlib
+import json
+import os
+from typing import List, Optional
+
+import numpy as np
+
+from models.graph import Graph
+from models.compact_graph import CompactGraph
+from .floyd_warshall_matrix import relax_through
+
+BLOCKED_FW_FORMAT_VERSION = 1
+
+
+class OutOfCoreAPSP:
+    """Resultado de blocked_floyd_warshall: matrices en disco abiertas bajo demanda."""
+
+    def __init__(self, workdir: str):
+        with open(os.path.join(workdir, 'meta.json'), 'r', encoding='utf-8') as file:
+            meta = json.load(file)
+        if meta['status'] != 'done':
+            raise ValueError(f"El cálculo en '{workdir}' no terminó (ronda {meta['completed_rounds']})")
+
+        self.workdir = workdir
+        self.node_ids: List[str] = meta['node_ids']
+        self.index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        n = len(self.node_ids)
+        self.dist = np.memmap(os.path.join(workdir, 'dist.f64'), dtype=np.float64, mode='r', shape=(n, n))
+        self.next_hop = np.memmap(os.path.join(workdir, 'next.i32'), dtype=np.int32, mode='r', shape=(n, n))
+
+    def distance(self, start: str, end: str) -> float:
+        return float(self.dist[self.index[start], self.index[end]])
+
+    def path(self, start: str, end: str) -> Optional[List[str]]:
+        """Camino de start a end leyendo solo las celdas necesarias del archivo."""
+        i, j = self.index[start], self.index[end]
+        if self.next_hop[i, j] < 0:
+            return None
+        path = [start]
+        while i != j:
+            i = int(self.next_hop[i, j])
+            if i < 0:
+                return None
+            path.append(self.node_ids[i])
+        return path
+
+
+def blocked_floyd_warshall(graph: Graph, workdir: str, block_size: int = 512,
+                           resume: bool = True) -> OutOfCoreAPSP:
+    """
+    Floyd-Warshall por bloques sobre archivos mapeados en memoria.
+
+    Args:
+        graph: Graph o CompactGraph
+        workdir: Carpeta donde se guardan dist.f64, next.i32 y meta.json
+        block_size: Lado de cada bloque (3 bloques float64 de 512 = 6 MB)
+        resume: Continuar un cálculo previo del mismo grafo si existe
+
+    Returns:
+        OutOfCoreAPSP con distancias y caminos consultables
+    """
+    if not isinstance(graph, CompactGraph):
+        graph = graph.to_compact()
+    os.makedirs(workdir, exist_ok=True)
+
+    n = graph.num_nodes
+    num_blocks = (n + block_size - 1) // block_size
+    fingerprint = _fingerprint(graph)
+    meta_path = os.path.join(workdir, 'meta.json')
+    dist_path = os.path.join(workdir, 'dist.f64')
+    next_path = os.path.join(workdir, 'next.i32')
+
+    meta = None
+    if resume and os.path.exists(meta_path):
+        with open(meta_path, 'r', encoding='utf-8') as file:
+            meta = json.load(file)
+        if (meta.get('version') != BLOCKED_FW_FORMAT_VERSION or meta.get('fingerprint') != fingerprint
+                or meta.get('block_size') != block_size):
+            meta = None  # Es de otro grafo o de otra configuración: empezar de cero
+
+    if meta is not None and meta['status'] == 'done':
+        return OutOfCoreAPSP(workdir)
+
+    if meta is None:
+        meta = {
+            'version': BLOCKED_FW_FORMAT_VERSION,
+            'fingerprint': fingerprint,
+            'block_size': block_size,
+            'node_ids': list(graph.node_ids),
+            'completed_rounds': 0,
+            'status': 'running',
+        }
+        dist = np.memmap(dist_path, dtype=np.float64, mode='w+', shape=(n, n))
+        next_hop = np.memmap(next_path, dtype=np.int32, mode='w+', shape=(n, n))
+        _initialize(graph, dist, next_hop, block_size)
+        dist.flush()
+        next_hop.flush()
+        _write_meta(meta_path, meta)
+    else:
+        dist = np.memmap(dist_path, dtype=np.float64, mode='r+', shape=(n, n))
+        next_hop = np.memmap(next_path, dtype=np.int32, mode='r+', shape=(n, n))
+
+    def block(b: int) -> slice:
+        return slice(b * block_size, min((b + 1) * block_size, n))
+
+    for kb in range(meta['completed_rounds'], num_blocks):
+        k_range = block(kb)
+
+        # Fase 1: bloque diagonal
+        diag, diag_next = dist[k_range, k_range].copy(), next_hop[k_range, k_range].copy()
+        _relax_tile(diag, diag_next, diag, diag, diag_next)
+        _store_tile(dist, next_hop, k_range, k_range, diag, diag_next)
+
+        # Fase 2: fila kb y columna kb
+        for b in range(num_blocks):
+            if b == kb:
+                continue
+            other = block(b)
+            row, row_next = dist[k_range, other].copy(), next_hop[k_range, other].copy()
+            _relax_tile(row, row_next, diag, row, diag_next)
+            _store_tile(dist, next_hop, k_range, other, row, row_next)
+
+            col, col_next = dist[other, k_range].copy(), next_hop[other, k_range].copy()
+            _relax_tile(col, col_next, col, diag, col_next)
+            _store_tile(dist, next_hop, other, k_range, col, col_next)
+
+        # Fase 3: el resto de bloques
+        for bi in range(num_blocks):
+            if bi == kb:
+                continue
+            rows = block(bi)
+            col, col_next = dist[rows, k_range].copy(), next_hop[rows, k_range].copy()
+            for bj in range(num_blocks):
+                if bj == kb:
+                    continue
+                cols = block(bj)
+                tile, tile_next = dist[rows, cols].copy(), next_hop[rows, cols].copy()
+                _relax_tile(tile, tile_next, col, dist[k_range, cols].copy(), col_next)
+                _store_tile(dist, next_hop, rows, cols, tile, tile_next)
+
+        dist.flush()
+        next_hop.flush()
+        meta['completed_rounds'] = kb + 1
+        _write_meta(meta_path, meta)
+
+    meta['status'] = 'done'
+    _write_meta(meta_path, meta)
+    del dist, next_hop
+    return OutOfCoreAPSP(workdir)
+
+
+def _store_tile(dist: np.memmap, next_hop: np.memmap, rows: slice, cols: slice,
+                tile: np.ndarray, tile_next: np.ndarray):
+    """
+    Escribe un bloque relajado: primero next_hop y después dist. Si el proceso
+    se corta entre las dos escrituras queda un dist viejo (más grande) con el
+    next_hop nuevo; al repetir la ronda esa celda se vuelve a mejorar y se
+    reescriben las dos. Al revés quedaría un dist mejorado con un next_hop
+    viejo que ninguna relajación corrige (path() y distance() no coincidirían).
+    """
+    next_hop[rows, cols] = tile_next
+    dist[rows, cols] = tile
+
+
+def _relax_tile(tile: np.ndarray, tile_next: np.ndarray, k_cols: np.ndarray, k_rows: np.ndarray,
+                k_cols_next: np.ndarray):
+    """
+    Relaja tile con los k del bloque actual: tile[i, j] vs k_cols[i, k] + k_rows[k, j].
+    k_cols / k_rows pueden ser el propio tile (fases 1 y 2).
+    """
+    candidate = np.empty_like(tile)
+    improved = np.empty(tile.shape, dtype=bool)
+    for k in range(k_rows.shape[0]):
+        relax_through(tile, tile_next, k_cols[:, k].copy(), k_rows[k, :].copy(),
+                      k_cols_next[:, k].copy(), candidate, improved)
+
+
+def _initialize(graph: CompactGraph, dist: np.memmap, next_hop: np.memmap, block_size: int):
+    """Llena las matrices en disco por franjas de filas (infinito, diagonal 0 y aristas)."""
+    n = graph.num_nodes
+    indptr, indices, weights = graph.to_numpy()
+    for start in range(0, n, block_size):
+        end = min(start + block_size, n)
+        dist_rows = np.full((end - start, n), np.inf, dtype=np.float64)
+        next_rows = np.full((end - start, n), -1, dtype=np.int32)
+        local = np.arange(end - start)
+        dist_rows[local, local + start] = 0.0
+
+        begin, finish = indptr[start], indptr[end]
+        rows = np.repeat(local, np.diff(indptr[start:end + 1]))
+        dist_rows[rows, indices[begin:finish]] = weights[begin:finish]
+        next_rows[rows, indices[begin:finish]] = indices[begin:finish]
+
+        dist[start:end] = dist_rows
+        next_hop[start:end] = next_rows
+
+
+def _fingerprint(graph: CompactGraph) -> str:
+    digest = hashlib.sha1()
+    for node_id in graph.node_ids:
+        digest.update(node_id.encode('utf-8'))
+        digest.update(b'\x00')
+    for buffer in (graph.indptr, graph.indices, graph.weights):
+        digest.update(memoryview(buffer).cast('B'))
+    return digest.hexdigest()
+
+
+def _write_meta(meta_path: str, meta: dict):
+    # Escritura atómica para que una interrupción no deje meta.json a medias
+    tmp_path = meta_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(meta, file)
+    os.replace(tmp_path, meta_path)
@@ -0,0 +1,317 @@
+"""
+Contraction Hierarchies (CH) para consultas punto a punto repetidas sobre
+un grafo estático.
+
+Preprocesamiento: los nodos se contraen uno a uno en orden de importancia
+(diferencia de aristas + vecinos ya contraídos). Al contraer v, para cada
+par u -> v -> w se agrega un atajo u -> w salvo que una búsqueda local
+(witness search) encuentre un camino igual o más corto que no pase por v.
+
+Consulta: Dijkstra bidireccional que solo sube de rango (hacia adelante
+desde start, hacia atrás desde end). Los atajos del camino resultante se
+desempaquetan recursivamente para devolver la ruta con aristas originales,
+que es lo que espera GraphVisualizer.visualize_path.
+"""
+
+import heapq
+import pickle
+from array import array
+from typing import Dict, List, Tuple, Optional
+
+from models.graph import Graph
+from models.compact_graph import CompactGraph
+
+CH_FORMAT_VERSION = 1
+
+
+class ContractionHierarchy:
+
+    def __init__(self, node_ids: List[str], rank, up_out: Tuple, up_in: Tuple,
+                 middle: Dict[Tuple[int, int], int]):
+        """
+        Usar ContractionHierarchy.build() o ContractionHierarchy.load().
+
+        Args:
+            node_ids: IDs de los nodos (la posición es el índice interno)
+            rank: Orden de contracción de cada nodo
+            up_out: CSR (indptr, indices, weights) de aristas hacia nodos de mayor rango
+            up_in: CSR de aristas entrantes desde nodos de mayor rango
+            middle: Nodo intermedio de cada atajo (a, b)
+        """
+        self.node_ids = node_ids
+        self.index = {node_id: i for i, node_id in enumerate(node_ids)}
+        self.rank = rank
+        self.up_out = up_out
+        self.up_in = up_in
+        self.middle = middle
+
+    @property
+    def num_shortcuts(self) -> int:
+        return len(self.middle)
+
+    # ------------------------------------------------------------------
+    # Preprocesamiento
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, graph: Graph, settle_limit: int = 60) -> 'ContractionHierarchy':
+        """
+        Preprocesa un Graph o CompactGraph (pesos no negativos).
+
+        Args:
+            graph: Grafo a preprocesar
+            settle_limit: Máximo de nodos cerrados por witness search. Más
+                          bajo = preprocesamiento más rápido pero más atajos
+
+        Returns:
+            ContractionHierarchy lista para consultar
+        """
+        if not isinstance(graph, CompactGraph):
+            graph = graph.to_compact()
+        n = graph.num_nodes
+
+        # Grafo restante (sin nodos contraídos): v -> {vecino: (peso, intermedio)}
+        out_edges: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(n)]
+        in_edges: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(n)]
+        for u in range(n):
+            for v, weight in graph.neighbors_of(u):
+                if u == v:
+                    continue
+                if v not in out_edges[u] or weight < out_edges[u][v][0]:
+                    out_edges[u][v] = (weight, -1)
+                    in_edges[v][u] = (weight, -1)
+
+        builder = _Contractor(out_edges, in_edges, settle_limit)
+        deleted_neighbors = [0] * n
+        priority_queue = [(builder.priority(v, 0), v) for v in range(n)]
+        heapq.heapify(priority_queue)
+
+        rank = array('i', [-1]) * n
+        up_out_lists: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+        up_in_lists: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+        middle: Dict[Tuple[int, int], int] = {}
+        next_rank = 0
+
+        while priority_queue:
+            _, v = heapq.heappop(priority_queue)
+            if rank[v] != -1:
+                continue
+
+            # Actualización perezosa: recalcular y reinsertar si ya no es el mínimo
+            current = builder.priority(v, deleted_neighbors[v])
+            if priority_queue and current > priority_queue[0][0]:
+                heapq.heappush(priority_queue, (current, v))
+                continue
+
+            for u, w, weight in builder.shortcuts(v):
+                existing = out_edges[u].get(w)
+                if existing is None or weight < existing[0]:
+                    out_edges[u][w] = (weight, v)
+                    in_edges[w][u] = (weight, v)
+
+            # Las aristas que quedan en v apuntan a nodos de mayor rango
+            for w, (weight, mid) in out_edges[v].items():
+                up_out_lists[v].append((w, weight))
+                if mid != -1:
+                    middle[(v, w)] = mid
+                del in_edges[w][v]
+                deleted_neighbors[w] += 1
+            for u, (weight, mid) in in_edges[v].items():
+                up_in_lists[v].append((u, weight))
+                if mid != -1:
+                    middle[(u, v)] = mid
+                del out_edges[u][v]
+                deleted_neighbors[u] += 1
+            out_edges[v] = {}
+            in_edges[v] = {}
+
+            rank[v] = next_rank
+            next_rank += 1
+
+        return cls(list(graph.node_ids), rank, _to_csr(up_out_lists), _to_csr(up_in_lists), middle)
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def query(self, start: str, end: str, stats: Optional[Dict] = None) -> Tuple[Optional[float], Optional[List[str]]]:
+        """
+        Camino más corto entre start y end.
+
+        Args:
+            start: Nodo inicial
+            end: Nodo final
+            stats: Diccionario opcional donde se deja 'settled' (nodos cerrados)
+
+        Returns:
+            (distancia, camino con aristas originales) o (None, None) si no hay camino
+        """
+        if start not in self.index:
+            raise ValueError(f"El nodo inicial '{start}' no existe en el grafo")
+        if end not in self.index:
+            raise ValueError(f"El nodo final '{end}' no existe en el grafo")
+
+        s, t = self.index[start], self.index[end]
+        infinity = float('infinity')
+        graphs = (self.up_out, self.up_in)
+        distances = ({s: 0}, {t: 0})
+        parents = ({s: -1}, {t: -1})
+        queues = ([(0, s)], [(0, t)])
+        settled = 0
+        best, meeting = (0, s) if s == t else (infinity, -1)
+
+        while queues[0] or queues[1]:
+            # Cada lado sigue mientras su mínimo pueda mejorar best
+            side = 0 if queues[0] and (not queues[1] or queues[0][0][0] <= queues[1][0][0]) else 1
+            current_distance, current_node = heapq.heappop(queues[side])
+            if current_distance >= best:
+                queues[side].clear()
+                continue
+            if current_distance > distances[side][current_node]:
+                continue
+            settled += 1
+
+            other_distance = distances[1 - side].get(current_node)
+            if other_distance is not None and current_distance + other_distance < best:
+                best, meeting = current_distance + other_distance, current_node
+
+            indptr, indices, weights = graphs[side]
+            dist_side = distances[side]
+            for k in range(indptr[current_node], indptr[current_node + 1]):
+                neighbor = indices[k]
+                distance = current_distance + weights[k]
+                if distance < dist_side.get(neighbor, infinity):
+                    dist_side[neighbor] = distance
+                    parents[side][neighbor] = current_node
+                    heapq.heappush(queues[side], (distance, neighbor))
+
+        if stats is not None:
+            stats['settled'] = settled
+
+        if meeting == -1:
+            return None, None
+
+        # Camino en la jerarquía: s -> meeting -> t (puede contener atajos)
+        up_path = []
+        current = meeting
+        while current != -1:
+            up_path.append(current)
+            current = parents[0][current]
+        up_path.reverse()
+        current = parents[1][meeting]
+        while current != -1:
+            up_path.append(current)
+            current = parents[1][current]
+
+        node_ids = self.node_ids
+        return best, [node_ids[i] for i in self._unpack(up_path)]
+
+    def _unpack(self, up_path: List[int]) -> List[int]:
+        path = [up_path[0]]
+        middle = self.middle
+        for a, b in zip(up_path, up_path[1:]):
+            stack = [(a, b)]
+            while stack:
+                x, y = stack.pop()
+                mid = middle.get((x, y))
+                if mid is None:
+                    path.append(y)
+                else:
+                    stack.append((mid, y))
+                    stack.append((x, mid))
+        return path
+
+    # ------------------------------------------------------------------
+    # Persistencia
+    # ------------------------------------------------------------------
+
+    def save(self, filepath: str):
+        """Guarda la jerarquía preprocesada para no tener que recalcularla."""
+        data = {
+            'version': CH_FORMAT_VERSION,
+            'node_ids': self.node_ids,
+            'rank': self.rank,
+            'up_out': self.up_out,
+            'up_in': self.up_in,
+            'middle': self.middle,
+        }
+        with open(filepath, 'wb') as file:
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, filepath: str) -> 'ContractionHierarchy':
+        with open(filepath, 'rb') as file:
+            data = pickle.load(file)
+        if data.get('version') != CH_FORMAT_VERSION:
+            raise ValueError(f"Versión de jerarquía no soportada: {data.get('version')}")
+        return cls(data['node_ids'], data['rank'], data['up_out'], data['up_in'], data['middle'])
+
+
+class _Contractor:
+    """Witness search y cálculo de atajos sobre el grafo restante."""
+
+    def __init__(self, out_edges, in_edges, settle_limit: int):
+        self.out_edges = out_edges
+        self.in_edges = in_edges
+        self.settle_limit = settle_limit
+
+    def shortcuts(self, v: int) -> List[Tuple[int, int, float]]:
+        result = []
+        outs = self.out_edges[v]
+        if not outs:
+            return result
+        max_out = max(weight for weight, _ in outs.values())
+
+        for u, (weight_uv, _) in self.in_edges[v].items():
+            targets = {w for w in outs if w != u}
+            if not targets:
+                continue
+            witness = self._witness_search(u, v, weight_uv + max_out, targets)
+            for w in targets:
+                candidate = weight_uv + outs[w][0]
+                if witness.get(w, float('infinity')) > candidate:
+                    result.append((u, w, candidate))
+        return result
+
+    def priority(self, v: int, deleted_neighbors: int) -> int:
+        edge_difference = len(self.shortcuts(v)) - len(self.in_edges[v]) - len(self.out_edges[v])
+        return edge_difference + deleted_neighbors
+
+    def _witness_search(self, source: int, excluded: int, max_distance: float, targets) -> Dict[int, float]:
+        infinity = float('infinity')
+        out_edges = self.out_edges
+        distances = {source: 0}
+        pending = set(targets)
+        priority_queue = [(0, source)]
+        settled = 0
+
+        while priority_queue and pending and settled < self.settle_limit:
+            current_distance, current_node = heapq.heappop(priority_queue)
+            if current_distance > distances[current_node]:
+                continue
+            if current_distance > max_distance:
+                break
+            pending.discard(current_node)
+            settled += 1
+
+            for neighbor, (weight, _) in out_edges[current_node].items():
+                if neighbor == excluded:
+                    continue
+                distance = current_distance + weight
+                if distance < distances.get(neighbor, infinity):
+                    distances[neighbor] = distance
+                    heapq.heappush(priority_queue, (distance, neighbor))
+
+        return distances
+
+
+def _to_csr(adjacency: List[List[Tuple[int, float]]]) -> Tuple[array, array, array]:
+    indptr = array('q', [0])
+    indices = array('i')
+    weights = array('d')
+    for neighbors in adjacency:
+        for neighbor, weight in neighbors:
+            indices.append(neighbor)
+            weights.append(weight)
+        indptr.append(len(indices))
+    return indptr, indices, weights
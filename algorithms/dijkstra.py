@@ -1,20 +1,40 @@
 import heapq
 from typing import Dict, List, Tuple, Optional
 from models.graph import Graph
+from models.compact_graph import CompactGraph
+from .priority_queues import dijkstra_radix, dijkstra_indexed, dijkstra_delta_stepping
+from .scc import known_unreachable
 
+# Estrategias de cola de prioridad para dijkstra_all_paths (además de 'heapq')
+STRATEGIES = {
+    'radix': dijkstra_radix,
+    'delta': dijkstra_delta_stepping,
+    'indexed': dijkstra_indexed,
+}
 
-def dijkstra(graph: Graph, start: str, end: str) -> Tuple[Optional[float], Optional[List[str]]]:
+
+def dijkstra(graph: Graph, start: str, end: str,
+             stats: Optional[Dict] = None) -> Tuple[Optional[float], Optional[List[str]]]:
     # Validar que los nodos existen
     if not graph.node_exists(start):
         raise ValueError(f"El nodo inicial '{start}' no existe en el grafo")
     if not graph.node_exists(end):
         raise ValueError(f"El nodo final '{end}' no existe en el grafo")
+
+    # Con un SCCIndex vigente, "sin camino" se responde sin explorar
+    if known_unreachable(graph, start, end):
+        if stats is not None:
+            stats['settled'] = 0
+        return None, None
+
+    if isinstance(graph, CompactGraph):
+        return _dijkstra_compact(graph, start, end, stats)
     
-    # Inicializar estructuras de datos
-    distances: Dict[str, float] = {node: float('infinity') for node in graph.get_all_nodes()}
-    distances[start] = 0
-    
-    previous: Dict[str, Optional[str]] = {node: None for node in graph.get_all_nodes()}
+    # Inicializar estructuras de datos (solo para los nodos alcanzados,
+    # así una consulta corta no paga O(V) en inicialización)
+    distances: Dict[str, float] = {start: 0}
+    previous: Dict[str, Optional[str]] = {start: None}
+    infinity = float('infinity')
     
     # Cola de prioridad: (distancia, nodo)
     priority_queue = [(0, start)]
@@ -42,19 +62,119 @@ def dijkstra(graph: Graph, start: str, end: str) -> Tuple[Optional[float], Optio
             distance = current_distance + weight
             
             # Si encontramos un camino más corto, actualizarlo
-            if distance < distances[neighbor]:
+            if distance < distances.get(neighbor, infinity):
                 distances[neighbor] = distance
                 previous[neighbor] = current_node
                 heapq.heappush(priority_queue, (distance, neighbor))
+
+    if stats is not None:
+        stats['settled'] = len(visited)
     
     # Reconstruir el camino
-    if distances[end] == float('infinity'):
+    if end not in distances:
         return None, None
     
     path = reconstruct_path(previous, start, end)
     return distances[end], path
 
 
+def bidirectional_dijkstra(graph: Graph, start: str, end: str,
+                           stats: Optional[Dict] = None) -> Tuple[Optional[float], Optional[List[str]]]:
+    """
+    Dijkstra bidireccional para consultas punto a punto.
+
+    Avanza a la vez desde start (aristas salientes) y desde end (aristas
+    entrantes) y se detiene cuando la suma de los mínimos de ambas colas
+    ya no puede mejorar el mejor camino encontrado. Las distancias se
+    guardan solo para los nodos alcanzados.
+
+    Args:
+        graph: Graph o CompactGraph (pesos no negativos)
+        start: Nodo inicial
+        end: Nodo final
+        stats: Diccionario opcional donde se deja 'settled' (nodos cerrados)
+
+    Returns:
+        (distancia, camino) o (None, None) si no hay camino, igual que dijkstra
+    """
+    if not graph.node_exists(start):
+        raise ValueError(f"El nodo inicial '{start}' no existe en el grafo")
+    if not graph.node_exists(end):
+        raise ValueError(f"El nodo final '{end}' no existe en el grafo")
+
+    # Con un SCCIndex vigente, "sin camino" se responde sin explorar
+    if known_unreachable(graph, start, end):
+        if stats is not None:
+            stats['settled'] = 0
+        return None, None
+
+    if isinstance(graph, CompactGraph):
+        reverse = graph.reverse()
+        s, t = graph.index_of(start), graph.index_of(end)
+        distance, path = _bidirectional_search(s, t, graph.neighbors_of, reverse.neighbors_of, stats)
+        if path is None:
+            return None, None
+        node_ids = graph.node_ids
+        return distance, [node_ids[i] for i in path]
+
+    return _bidirectional_search(start, end, graph.get_neighbors, graph.get_predecessors, stats)
+
+
+def _bidirectional_search(start, end, forward_neighbors, backward_neighbors, stats):
+    infinity = float('infinity')
+    distances = ({start: 0}, {end: 0})
+    parents = ({start: None}, {end: None})
+    settled = (set(), set())
+    queues = ([(0, start)], [(0, end)])
+    neighbor_functions = (forward_neighbors, backward_neighbors)
+
+    best = 0 if start == end else infinity
+    meeting = start if start == end else None
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+
+        # Expandir el lado cuyo mínimo es menor
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        other = 1 - side
+        current_distance, current_node = heapq.heappop(queues[side])
+        if current_node in settled[side]:
+            continue
+        settled[side].add(current_node)
+
+        dist_side, dist_other = distances[side], distances[other]
+        for neighbor, weight in neighbor_functions[side](current_node):
+            distance = current_distance + weight
+            if distance < dist_side.get(neighbor, infinity):
+                dist_side[neighbor] = distance
+                parents[side][neighbor] = current_node
+                heapq.heappush(queues[side], (distance, neighbor))
+            if neighbor in dist_other and dist_side[neighbor] + dist_other[neighbor] < best:
+                best = dist_side[neighbor] + dist_other[neighbor]
+                meeting = neighbor
+
+    if stats is not None:
+        stats['settled'] = len(settled[0]) + len(settled[1])
+
+    if meeting is None:
+        return None, None
+
+    # start -> meeting con los padres hacia adelante, meeting -> end con los de atrás
+    path = []
+    current = meeting
+    while current is not None:
+        path.append(current)
+        current = parents[0][current]
+    path.reverse()
+    current = parents[1][meeting]
+    while current is not None:
+        path.append(current)
+        current = parents[1][current]
+
+    return best, path
+
+
 def reconstruct_path(previous: Dict[str, Optional[str]], start: str, end: str) -> List[str]:
     path = []
     current = end
@@ -71,9 +191,35 @@ def reconstruct_path(previous: Dict[str, Optional[str]], start: str, end: str) -
     return path
 
 
-def dijkstra_all_paths(graph: Graph, start: str) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+def dijkstra_all_paths(graph: Graph, start: str,
+                       strategy: str = 'heapq') -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+    """
+    Distancias y previos desde start hacia todos los nodos.
+
+    Args:
+        graph: Graph o CompactGraph
+        start: Nodo inicial
+        strategy: Cola de prioridad: 'heapq' (por defecto, con duplicados),
+                  'radix' (radix heap), 'delta' (delta-stepping) o 'indexed'
+                  (montículo con decrease-key). Las tres últimas trabajan sobre
+                  el CSR; con un Graph se convierte primero con to_compact()
+    """
     if not graph.node_exists(start):
         raise ValueError(f"El nodo inicial '{start}' no existe en el grafo")
+    if strategy != 'heapq' and strategy not in STRATEGIES:
+        raise ValueError(f"Estrategia desconocida: '{strategy}'")
+
+    if strategy != 'heapq' and not isinstance(graph, CompactGraph):
+        graph = graph.to_compact()
+
+    if isinstance(graph, CompactGraph):
+        kernel = STRATEGIES.get(strategy, _dijkstra_compact_all)
+        distances_idx, previous_idx = kernel(graph, graph.index_of(start))
+        node_ids = graph.node_ids
+        return (
+            {node_ids[i]: d for i, d in enumerate(distances_idx)},
+            {node_ids[i]: (node_ids[p] if p >= 0 else None) for i, p in enumerate(previous_idx)}
+        )
 
     distances: Dict[str, float] = {node: float('infinity') for node in graph.get_all_nodes()}
     distances[start] = 0
@@ -103,3 +249,68 @@ def dijkstra_all_paths(graph: Graph, start: str) -> Tuple[Dict[str, float], Dict
                 heapq.heappush(priority_queue, (distance, neighbor))
     
     return distances, previous
+
+
+# --- Núcleos sobre CompactGraph (índices enteros, listas planas) ---
+
+def _dijkstra_compact_all(graph: CompactGraph, start: int, end: int = -1,
+                          stats: Optional[Dict] = None) -> Tuple[List[float], List[int]]:
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    n = graph.num_nodes
+
+    distances = [float('infinity')] * n
+    distances[start] = 0
+    previous = [-1] * n
+    visited = bytearray(n)
+
+    priority_queue = [(0, start)]
+    while priority_queue:
+        current_distance, current_node = heapq.heappop(priority_queue)
+
+        if visited[current_node]:
+            continue
+        visited[current_node] = 1
+
+        if current_node == end:
+            break
+
+        for k in range(indptr[current_node], indptr[current_node + 1]):
+            neighbor = indices[k]
+            distance = current_distance + weights[k]
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                previous[neighbor] = current_node
+                heapq.heappush(priority_queue, (distance, neighbor))
+
+    if stats is not None:
+        stats['settled'] = sum(visited)
+
+    return distances, previous
+
+
+def _dijkstra_compact(graph: CompactGraph, start: str, end: str,
+                      stats: Optional[Dict] = None) -> Tuple[Optional[float], Optional[List[str]]]:
+    s, t = graph.index_of(start), graph.index_of(end)
+    distances, previous = _dijkstra_compact_all(graph, s, t, stats)
+
+    if distances[t] == float('infinity'):
+        return None, None
+
+    node_ids = graph.node_ids
+    return distances[t], [node_ids[i] for i in _reconstruct_index_path(previous, s, t)]
+
+
+def _reconstruct_index_path(previous: List[int], start: int, end: int) -> List[int]:
+    path = []
+    current = end
+
+    while current != -1:
+        path.append(current)
+        current = previous[current]
+
+    path.reverse()
+
+    if path[0] != start:
+        return []
+
+    return path
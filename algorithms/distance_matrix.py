@@ -0,0 +1,111 @@
+"""
+Matriz de costos origen x destino (muchos a muchos).
+
+En lugar de un dijkstra(graph, s, t) por par (que reinicia diccionarios de
+tamaño V en cada llamada), se hace una búsqueda de uno a muchos por origen
+sobre el CompactGraph, que se detiene en cuanto todos los destinos quedan
+cerrados. Los orígenes se reparten entre procesos que reciben el grafo una
+sola vez.
+
+Requiere NumPy (pip install numpy).
+"""
+
+import heapq
+from array import array
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from models.graph import Graph
+from models.compact_graph import CompactGraph
+from ._parallel import imap_ordered, worker_state
+
+
+def distance_matrix(graph: Graph, sources: Sequence[str], targets: Sequence[str],
+                    workers: Optional[int] = None, snapshot_path: Optional[str] = None,
+                    chunk_size: int = 16) -> np.ndarray:
+    """
+    Distancias más cortas de cada origen a cada destino.
+
+    Args:
+        graph: Graph o CompactGraph (pesos no negativos)
+        sources: IDs de los orígenes (filas)
+        targets: IDs de los destinos (columnas)
+        workers: Procesos a usar; None = número de CPUs, 1 = en el proceso actual
+        snapshot_path: Snapshot del mismo grafo para que los workers lo abran con mmap
+        chunk_size: Orígenes por tarea enviada a un worker
+
+    Returns:
+        Matriz float64 de len(sources) x len(targets); inf donde no hay camino
+    """
+    if not isinstance(graph, CompactGraph):
+        graph = graph.to_compact()
+
+    for node in sources:
+        if not graph.node_exists(node):
+            raise ValueError(f"El nodo inicial '{node}' no existe en el grafo")
+    for node in targets:
+        if not graph.node_exists(node):
+            raise ValueError(f"El nodo final '{node}' no existe en el grafo")
+
+    source_indices = [graph.index_of(node) for node in sources]
+    target_indices = array('i', [graph.index_of(node) for node in targets])
+    chunks = [source_indices[i:i + chunk_size] for i in range(0, len(source_indices), chunk_size)]
+
+    if workers == 1 or len(chunks) <= 1:
+        rows = [one_to_many(graph, source, target_indices) for source in source_indices]
+    else:
+        rows = []
+        for chunk_rows in imap_ordered(_one_to_many_chunk, chunks, graph, target_indices,
+                                       workers, snapshot_path):
+            rows.extend(chunk_rows)
+
+    matrix = np.full((len(source_indices), len(target_indices)), np.inf, dtype=np.float64)
+    for i, row in enumerate(rows):
+        matrix[i] = np.frombuffer(row, dtype=np.float64)
+    return matrix
+
+
+def one_to_many(graph: CompactGraph, source: int, targets: Sequence[int]) -> array:
+    """
+    Dijkstra desde source que termina al cerrar todos los destinos.
+
+    Returns:
+        array('d') con la distancia a cada destino, en el orden de targets
+    """
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    n = graph.num_nodes
+    infinity = float('infinity')
+
+    is_target = bytearray(n)
+    for t in targets:
+        is_target[t] = 1
+    remaining = sum(is_target)
+
+    distances = [infinity] * n
+    distances[source] = 0
+    visited = bytearray(n)
+    priority_queue = [(0, source)]
+
+    while priority_queue and remaining:
+        current_distance, current_node = heapq.heappop(priority_queue)
+
+        if visited[current_node]:
+            continue
+        visited[current_node] = 1
+        if is_target[current_node]:
+            remaining -= 1
+
+        for k in range(indptr[current_node], indptr[current_node + 1]):
+            neighbor = indices[k]
+            distance = current_distance + weights[k]
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                heapq.heappush(priority_queue, (distance, neighbor))
+
+    return array('d', [distances[t] for t in targets])
+
+
+def _one_to_many_chunk(sources: List[int]) -> List[array]:
+    graph, targets = worker_state()
+    return [one_to_many(graph, source, targets) for source in sources]
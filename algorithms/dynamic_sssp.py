@@ -0,0 +1,168 @@
+"""
+Caminos más cortos desde un origen mantenidos incrementalmente.
+
+DynamicSSSP se suscribe a los cambios del Graph (add_edge, add_edges,
+update_edge_weight, remove_edge) y repara solo la parte afectada del árbol
+de caminos más cortos, al estilo de Ramalingam-Reps:
+
+    - Si una arista baja de peso o aparece, se propaga la mejora con un
+      Dijkstra que arranca en su destino y solo sigue por nodos que mejoran.
+    - Si una arista del árbol sube de peso o desaparece, los afectados son
+      su subárbol. Se les asigna la mejor distancia que ofrecen los
+      predecesores no afectados y se corre Dijkstra solo entre ellos.
+      Si la arista no estaba en el árbol no hay nada que hacer.
+
+Requiere pesos no negativos. last_update_touched indica cuántos nodos
+revisó la última actualización (comparar con el total de nodos).
+"""
+
+import heapq
+from typing import Dict, List, Optional, Set
+
+from models.graph import Graph
+from .dijkstra import dijkstra_all_paths, reconstruct_path
+
+
+class DynamicSSSP:
+
+    def __init__(self, graph: Graph, source: str):
+        """
+        Calcula el árbol inicial con dijkstra_all_paths y queda suscrito a
+        los cambios del grafo (usar close() para dejar de escuchar).
+        """
+        self.graph = graph
+        self.source = source
+        self.distances, self.previous = dijkstra_all_paths(graph, source)
+        self.children: Dict[str, Set[str]] = {node: set() for node in self.distances}
+        for node, parent in self.previous.items():
+            if parent is not None:
+                self.children[parent].add(node)
+
+        # Predecesores propios: el índice inverso de Graph se reconstruye
+        # entero tras cada cambio, aquí se mantiene con los eventos
+        self.predecessors: Dict[str, Dict[str, float]] = {node: {} for node in self.distances}
+        for node in graph.get_all_nodes():
+            for neighbor, weight in graph.get_neighbors(node):
+                self.predecessors[neighbor][node] = weight
+
+        self.last_update_touched = 0
+        self.total_touched = 0
+        graph.subscribe(self._on_edge_change)
+
+    def close(self):
+        self.graph.unsubscribe(self._on_edge_change)
+
+    def distance(self, node: str) -> Optional[float]:
+        distance = self.distances.get(node, float('infinity'))
+        return None if distance == float('infinity') else distance
+
+    def path(self, node: str) -> Optional[List[str]]:
+        if self.distance(node) is None:
+            return None
+        return reconstruct_path(self.previous, self.source, node)
+
+    # --- Actualizaciones ---
+
+    def _on_edge_change(self, source: str, destination: str,
+                        old_weight: Optional[float], new_weight: Optional[float]):
+        for node in (source, destination):
+            if node not in self.distances:
+                self._add_node(node)
+
+        if new_weight is None:
+            del self.predecessors[destination][source]
+        else:
+            self.predecessors[destination][source] = new_weight
+
+        touched = 0
+        if new_weight is not None and (old_weight is None or new_weight < old_weight):
+            touched = self._decrease(source, destination, new_weight)
+        elif self.previous[destination] == source:
+            touched = self._increase(destination)
+
+        self.last_update_touched = touched
+        self.total_touched += touched
+
+    def _add_node(self, node: str):
+        self.distances[node] = float('infinity')
+        self.previous[node] = None
+        self.children[node] = set()
+        self.predecessors[node] = {}
+
+    def _set_parent(self, node: str, parent: Optional[str]):
+        old_parent = self.previous[node]
+        if old_parent is not None:
+            self.children[old_parent].discard(node)
+        self.previous[node] = parent
+        if parent is not None:
+            self.children[parent].add(node)
+
+    def _decrease(self, source: str, destination: str, weight: float) -> int:
+        """La arista source -> destination mejoró: propagar desde destination."""
+        distances = self.distances
+        candidate = distances[source] + weight
+        if candidate >= distances[destination]:
+            return 0
+
+        distances[destination] = candidate
+        self._set_parent(destination, source)
+        touched = 0
+        priority_queue = [(candidate, destination)]
+        while priority_queue:
+            current_distance, node = heapq.heappop(priority_queue)
+            if current_distance > distances[node]:
+                continue
+            touched += 1
+            for neighbor, edge_weight in self.graph.get_neighbors(node):
+                distance = current_distance + edge_weight
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    self._set_parent(neighbor, node)
+                    heapq.heappush(priority_queue, (distance, neighbor))
+        return touched
+
+    def _increase(self, root: str) -> int:
+        """La arista que llega a root en el árbol empeoró: recalcular su subárbol."""
+        distances, infinity = self.distances, float('infinity')
+
+        affected = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            affected.append(node)
+            stack.extend(self.children[node])
+        affected_set = set(affected)
+
+        # Mejor entrada desde fuera del subárbol (distancias que siguen siendo válidas)
+        priority_queue = []
+        for node in affected:
+            best, best_parent = infinity, None
+            if node == self.source:
+                best = 0
+            else:
+                for parent, weight in self.predecessors[node].items():
+                    if parent not in affected_set and distances[parent] + weight < best:
+                        best, best_parent = distances[parent] + weight, parent
+            distances[node] = best
+            self._set_parent(node, best_parent)
+            if best != infinity:
+                priority_queue.append((best, node))
+        heapq.heapify(priority_queue)
+
+        # Dijkstra restringido a los nodos afectados
+        done = set()
+        while priority_queue:
+            current_distance, node = heapq.heappop(priority_queue)
+            if node in done or current_distance > distances[node]:
+                continue
+            done.add(node)
+            for neighbor, weight in self.graph.get_neighbors(node):
+                if neighbor not in affected_set:
+                    continue
+                distance = current_distance + weight
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    self._set_parent(neighbor, node)
+                    heapq.heappush(priority_queue, (distance, neighbor))
+
+        return len(affected)
@@ -1,8 +1,13 @@
 from typing import Dict, Tuple, Optional, List
 from models.graph import Graph
+from models.compact_graph import CompactGraph
+from .scc import SCCIndex
 
 
 def floyd_warshall(graph: Graph) -> Tuple[Dict[Tuple[str, str], float], Dict[Tuple[str, str], Optional[str]]]:
+    if isinstance(graph, CompactGraph):
+        return _floyd_warshall_compact(graph)
+
     nodes = graph.get_all_nodes()
     n = len(nodes)
     
@@ -26,10 +31,14 @@ def floyd_warshall(graph: Graph) -> Tuple[Dict[Tuple[str, str], float], Dict[Tup
             dist[(node, neighbor)] = weight
             next_node[(node, neighbor)] = neighbor
     
-    # Algoritmo principal de Floyd-Warshall
+    # Algoritmo principal de Floyd-Warshall. Con un SCCIndex vigente
+    # (SCCIndex.for_graph) cada k solo se combina con los nodos que llegan a
+    # su componente y los que se alcanzan desde ella
+    relevant = _relevant_nodes(graph)
     for k in nodes:
-        for i in nodes:
-            for j in nodes:
+        sources, targets = relevant(k) if relevant else (nodes, nodes)
+        for i in sources:
+            for j in targets:
                 if dist[(i, k)] + dist[(k, j)] < dist[(i, j)]:
                     dist[(i, j)] = dist[(i, k)] + dist[(k, j)]
                     next_node[(i, j)] = next_node[(i, k)]
@@ -56,3 +65,76 @@ def get_path_floyd_warshall(
         path.append(current)
     
     return path
+
+
+
+def _floyd_warshall_compact(graph: CompactGraph) -> Tuple[Dict[Tuple[str, str], float], Dict[Tuple[str, str], Optional[str]]]:
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    n = graph.num_nodes
+    infinity = float('infinity')
+
+    # Matrices densas como listas de filas indexadas por entero
+    dist = [[infinity] * n for _ in range(n)]
+    next_node = [[-1] * n for _ in range(n)]
+    for i in range(n):
+        dist[i][i] = 0
+        for k in range(indptr[i], indptr[i + 1]):
+            j = indices[k]
+            dist[i][j] = weights[k]
+            next_node[i][j] = j
+
+    relevant = _relevant_nodes(graph)
+    all_nodes = range(n)
+    for k in range(n):
+        sources, targets = relevant(k) if relevant else (all_nodes, all_nodes)
+        row_k = dist[k]
+        for i in sources:
+            row_i = dist[i]
+            d_ik = row_i[k]
+            if d_ik == infinity:
+                continue
+            next_i = next_node[i]
+            next_ik = next_i[k]
+            for j in targets:
+                if d_ik + row_k[j] < row_i[j]:
+                    row_i[j] = d_ik + row_k[j]
+                    next_i[j] = next_ik
+
+    # Traducción al formato por pares de IDs
+    node_ids = graph.node_ids
+    dist_result: Dict[Tuple[str, str], float] = {}
+    next_result: Dict[Tuple[str, str], Optional[str]] = {}
+    for i, a in enumerate(node_ids):
+        for j, b in enumerate(node_ids):
+            dist_result[(a, b)] = dist[i][j]
+            next_result[(a, b)] = node_ids[next_node[i][j]] if next_node[i][j] >= 0 else None
+
+    return dist_result, next_result
+
+
+def _relevant_nodes(graph: Graph):
+    """
+    Con un SCCIndex vigente, función k -> (nodos que llegan a k, nodos
+    alcanzables desde k), en IDs para Graph o índices para CompactGraph.
+    Sin índice retorna None. Los pares fuera de esas listas no pueden
+    mejorar pasando por k.
+    """
+    index = SCCIndex.cached(graph)
+    if index is None:
+        return None
+
+    compact = isinstance(graph, CompactGraph)
+    node_ids = index.node_ids
+    by_component = {}
+
+    def relevant(k):
+        c = index.component[k] if compact else index.component_of(k)
+        if c not in by_component:
+            sources, targets = index.reaching_nodes(c), index.reachable_nodes(c)
+            if not compact:
+                sources = [node_ids[i] for i in sources]
+                targets = [node_ids[i] for i in targets]
+            by_component[c] = (sources, targets)
+        return by_component[c]
+
+    return relevant
@@ -0,0 +1,151 @@
+"""
+Floyd-Warshall vectorizado con NumPy.
+
+Los IDs se mapean a índices 0..n-1 y las distancias / siguiente salto se
+guardan en matrices densas float64 / int32. Cada iteración k es una sola
+operación vectorizada (columna k + fila k difundidas sobre la matriz) en
+lugar de n² accesos a un diccionario de tuplas.
+
+Requiere NumPy (pip install numpy).
+"""
+
+from collections.abc import Mapping
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from models.graph import Graph
+from models.compact_graph import CompactGraph
+
+
+class FloydWarshallMatrix:
+
+    def __init__(self, node_ids: List[str], dist: np.ndarray, next_hop: np.ndarray):
+        """
+        Args:
+            node_ids: IDs de los nodos (la posición es el índice en las matrices)
+            dist: Matriz n x n de distancias (inf si no hay camino)
+            next_hop: Matriz n x n con el índice del siguiente nodo (-1 si no hay)
+        """
+        self.node_ids = node_ids
+        self.index = {node_id: i for i, node_id in enumerate(node_ids)}
+        self.dist = dist
+        self.next_hop = next_hop
+
+    def distance(self, start: str, end: str) -> float:
+        return float(self.dist[self.index[start], self.index[end]])
+
+    def path(self, start: str, end: str) -> Optional[List[str]]:
+        """Camino de start a end, o None si no existe (igual que get_path_floyd_warshall)."""
+        i, j = self.index[start], self.index[end]
+        if self.next_hop[i, j] < 0:
+            return None
+        path = [start]
+        while i != j:
+            i = int(self.next_hop[i, j])
+            if i < 0:
+                return None
+            path.append(self.node_ids[i])
+        return path
+
+    def as_dicts(self) -> Tuple['DistanceView', 'NextNodeView']:
+        """
+        Vistas con la misma interfaz que el resultado de floyd_warshall():
+        dist[(a, b)] y next_node[(a, b)], sin materializar n² tuplas.
+        """
+        return DistanceView(self), NextNodeView(self)
+
+
+class DistanceView(Mapping):
+    """dist[(a, b)] -> float, leído directamente de la matriz."""
+
+    def __init__(self, result: FloydWarshallMatrix):
+        self._result = result
+
+    def __getitem__(self, key: Tuple[str, str]) -> float:
+        a, b = key
+        return self._result.distance(a, b)
+
+    def __iter__(self):
+        node_ids = self._result.node_ids
+        return ((a, b) for a in node_ids for b in node_ids)
+
+    def __len__(self) -> int:
+        return len(self._result.node_ids) ** 2
+
+
+class NextNodeView(Mapping):
+    """next_node[(a, b)] -> ID del siguiente salto o None; compatible con get_path_floyd_warshall."""
+
+    def __init__(self, result: FloydWarshallMatrix):
+        self._result = result
+
+    def __getitem__(self, key: Tuple[str, str]) -> Optional[str]:
+        a, b = key
+        result = self._result
+        hop = result.next_hop[result.index[a], result.index[b]]
+        return result.node_ids[hop] if hop >= 0 else None
+
+    def __iter__(self):
+        node_ids = self._result.node_ids
+        return ((a, b) for a in node_ids for b in node_ids)
+
+    def __len__(self) -> int:
+        return len(self._result.node_ids) ** 2
+
+
+def build_matrices(graph: CompactGraph) -> Tuple[np.ndarray, np.ndarray]:
+    """Matrices iniciales (distancia, siguiente salto) a partir de las aristas."""
+    n = graph.num_nodes
+    indptr, indices, weights = graph.to_numpy()
+
+    dist = np.full((n, n), np.inf, dtype=np.float64)
+    np.fill_diagonal(dist, 0.0)
+    next_hop = np.full((n, n), -1, dtype=np.int32)
+
+    rows = np.repeat(np.arange(n, dtype=np.int32), np.diff(indptr))
+    dist[rows, indices] = weights
+    next_hop[rows, indices] = indices
+    return dist, next_hop
+
+
+def relax_through(dist: np.ndarray, next_hop: np.ndarray,
+                  dist_k_col: np.ndarray, dist_k_row: np.ndarray, next_k_col: np.ndarray,
+                  candidate: np.ndarray = None, improved: np.ndarray = None):
+    """
+    Una iteración k de Floyd-Warshall sobre (un bloque de) las matrices:
+    dist[i, j] = min(dist[i, j], dist[i, k] + dist[k, j]), y donde mejora
+    el siguiente salto pasa a ser next_hop[i, k].
+
+    candidate / improved son buffers opcionales (float64 / bool, misma forma
+    que dist) para no reservar memoria en cada iteración.
+    """
+    candidate = np.add(dist_k_col[:, None], dist_k_row[None, :], out=candidate)
+    improved = np.less(candidate, dist, out=improved)
+    np.minimum(dist, candidate, out=dist)
+    np.copyto(next_hop, np.broadcast_to(next_k_col[:, None], next_hop.shape), where=improved)
+
+
+def floyd_warshall_matrix(graph: Graph) -> FloydWarshallMatrix:
+    """
+    Floyd-Warshall sobre matrices NumPy.
+
+    Args:
+        graph: Graph o CompactGraph
+
+    Returns:
+        FloydWarshallMatrix; usar .as_dicts() para obtener (dist, next_node)
+        compatibles con floyd_warshall() y get_path_floyd_warshall()
+    """
+    if not isinstance(graph, CompactGraph):
+        graph = graph.to_compact()
+
+    dist, next_hop = build_matrices(graph)
+    candidate = np.empty_like(dist)
+    improved = np.empty(dist.shape, dtype=bool)
+    for k in range(graph.num_nodes):
+        # Copias para no leer la fila/columna k mientras se escribe la matriz
+        relax_through(dist, next_hop, dist[:, k].copy(), dist[k, :].copy(), next_hop[:, k].copy(),
+                      candidate, improved)
+
+    return FloydWarshallMatrix(list(graph.node_ids), dist, next_hop)
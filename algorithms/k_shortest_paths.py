@@ -0,0 +1,165 @@
+"""
+Los k caminos más cortos sin ciclos (algoritmo de Yen).
+
+En vez de copiar el grafo y borrarle aristas para cada búsqueda de desvío,
+las búsquedas miran el grafo a través de una vista que oculta los nodos de
+la raíz y las aristas ya usadas por los caminos aceptados.
+
+Todas las búsquedas de desvío comparten un mismo estado precalculado: las
+distancias exactas de cada nodo hacia el destino (un Dijkstra sobre el
+grafo invertido). Ocultar aristas solo puede alargar los caminos, así que
+esas distancias son una heurística admisible y consistente para A*, y cada
+desvío cierra apenas unos pocos nodos más que los de su propio camino. Con
+el árbol de ese mismo Dijkstra, si el camino del árbol desde el nodo de
+desvío no toca nada oculto ya es el desvío óptimo y no hace falta buscar.
+
+Además (mejora de Lawler) cada camino solo genera desvíos desde su punto
+de desvío en adelante: los anteriores ya los generó el camino del que salió.
+"""
+
+import heapq
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from models.graph import Graph
+from models.compact_graph import CompactGraph
+from .astar import _astar_search
+from .dijkstra import _dijkstra_compact_all
+from .scc import known_unreachable
+
+
+def k_shortest_paths(graph: Graph, start: str, end: str, k: int) -> List[Tuple[float, List[str]]]:
+    """
+    Hasta k caminos de start a end sin nodos repetidos, de menor a mayor costo.
+
+    Args:
+        graph: Graph o CompactGraph (pesos no negativos)
+        start: Nodo inicial
+        end: Nodo final
+        k: Cantidad máxima de caminos
+
+    Returns:
+        Lista de (distancia, camino); vacía si no hay camino
+    """
+    if not graph.node_exists(start):
+        raise ValueError(f"El nodo inicial '{start}' no existe en el grafo")
+    if not graph.node_exists(end):
+        raise ValueError(f"El nodo final '{end}' no existe en el grafo")
+    if k < 1 or known_unreachable(graph, start, end):
+        return []
+
+    if isinstance(graph, CompactGraph):
+        to_target, next_hop = _dijkstra_compact_all(graph.reverse(), graph.index_of(end))
+        node_ids = graph.node_ids
+        paths = _yen(graph.index_of(start), graph.index_of(end), k, graph.neighbors_of,
+                     to_target.__getitem__, next_hop.__getitem__)
+        return [(distance, [node_ids[i] for i in path]) for distance, path in paths]
+
+    to_target, next_hop = _distances_to(graph, end)
+    infinity = float('infinity')
+    return _yen(start, end, k, graph.get_neighbors,
+                lambda node: to_target.get(node, infinity), lambda node: next_hop.get(node, -1))
+
+
+def _distances_to(graph: Graph, end: str) -> Tuple[Dict[str, float], Dict[str, str]]:
+    """
+    Distancia de cada nodo a end (Dijkstra sobre las aristas entrantes) y el
+    siguiente salto hacia end en el árbol de esos caminos.
+    """
+    distances = {end: 0}
+    next_hop = {}
+    visited = set()
+    priority_queue = [(0, end)]
+    while priority_queue:
+        current_distance, current_node = heapq.heappop(priority_queue)
+        if current_node in visited:
+            continue
+        visited.add(current_node)
+        for predecessor, weight in graph.get_predecessors(current_node):
+            distance = current_distance + weight
+            if distance < distances.get(predecessor, float('infinity')):
+                distances[predecessor] = distance
+                next_hop[predecessor] = current_node
+                heapq.heappush(priority_queue, (distance, predecessor))
+    return distances, next_hop
+
+
+def _yen(start, end, k: int, neighbors: Callable, to_target: Callable,
+         next_hop: Callable) -> List[Tuple[float, list]]:
+    infinity = float('infinity')
+    if to_target(start) == infinity:
+        return []
+
+    def cost_prefix(path: list) -> List[float]:
+        """Costo acumulado hasta cada posición del camino."""
+        costs = [0.0]
+        for u, v in zip(path, path[1:]):
+            costs.append(costs[-1] + min(w for node, w in neighbors(u) if node == v))
+        return costs
+
+    first_distance, first_path = _astar_search(start, end, neighbors, to_target, None)
+    accepted: List[Tuple[float, list]] = [(first_distance, first_path)]
+    deviations = [0]  # Posición donde cada camino aceptado se separa de su padre
+    candidates: List[Tuple[float, int, int, list]] = []
+    seen: Set[tuple] = {tuple(first_path)}
+    counter = 0  # Desempate estable en el montículo
+
+    while len(accepted) < k:
+        _, last_path = accepted[-1]
+        prefix = cost_prefix(last_path)
+
+        for i in range(deviations[-1], len(last_path) - 1):
+            spur_node = last_path[i]
+            root = last_path[:i + 1]
+
+            # Vista del grafo: sin los nodos de la raíz (salvo el de desvío) y
+            # sin las aristas que usan los caminos aceptados con esta raíz
+            hidden_nodes = set(root[:-1])
+            hidden_edges = {path[i + 1] for _, path in accepted
+                            if len(path) > i + 1 and path[:i + 1] == root}
+
+            spur_path = _tree_path(spur_node, end, next_hop, hidden_nodes, hidden_edges)
+            if spur_path is not None:
+                spur_distance = to_target(spur_node)
+            else:
+                def masked_neighbors(node, spur_node=spur_node, hidden_nodes=hidden_nodes,
+                                     hidden_edges=hidden_edges):
+                    if node == spur_node:
+                        return [(v, w) for v, w in neighbors(node)
+                                if v not in hidden_nodes and v not in hidden_edges]
+                    return [(v, w) for v, w in neighbors(node) if v not in hidden_nodes]
+
+                spur_distance, spur_path = _astar_search(spur_node, end, masked_neighbors, to_target, None)
+                if spur_path is None:
+                    continue
+
+            path = root[:-1] + spur_path
+            key = tuple(path)
+            if key in seen:
+                continue
+            seen.add(key)
+            counter += 1
+            heapq.heappush(candidates, (prefix[i] + spur_distance, counter, i, path))
+
+        if not candidates:
+            break
+        distance, _, deviation, path = heapq.heappop(candidates)
+        accepted.append((distance, path))
+        deviations.append(deviation)
+
+    return accepted
+
+
+def _tree_path(spur_node, end, next_hop: Callable, hidden_nodes: Set, hidden_edges: Set) -> Optional[list]:
+    """Camino del árbol hacia end desde spur_node, o None si pasa por algo oculto."""
+    node = next_hop(spur_node)
+    if node in hidden_edges:
+        return None
+    path = [spur_node]
+    while node != -1 and node is not None:
+        if node in hidden_nodes:
+            return None
+        path.append(node)
+        if node == end:
+            return path
+        node = next_hop(node)
+    return None if spur_node != end else path
@@ -0,0 +1,167 @@
+"""
+Bellman-Ford con la relajación repartida entre procesos.
+
+Se trabaja sobre el CSR transpuesto (aristas entrantes): los nodos destino
+se parten en rangos contiguos con un número parecido de aristas y cada
+worker relaja solo las aristas que llegan a su rango. Así cada proceso
+escribe únicamente su parte del arreglo de distancias, que vive en
+multiprocessing.shared_memory junto con el de predecesores, y no hacen
+falta locks.
+
+El proceso principal sincroniza las rondas: en cada una todos los workers
+relajan su rango y se detiene cuando ninguno cambió nada. Las distancias
+solo bajan y siempre corresponden a caminos reales, por lo que leer valores
+de otros rangos ya actualizados en la misma ronda es seguro (no hace falta
+más rondas que una pasada clásica). Si la ronda |V| todavía cambia
+algo, hay un ciclo negativo: mismo resultado que bellman_ford().
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+from models.graph import Graph
+from models.compact_graph import CompactGraph
+from .dijkstra import _reconstruct_index_path
+from ._parallel import graph_payload, init_worker, worker_state
+
+# Memoria compartida ya abierta en cada worker: nombre -> (shm dist, shm previous, dist, previous)
+_attached = {}
+
+
+def parallel_bellman_ford(graph: Graph, start: str, end: str,
+                          workers: Optional[int] = None) -> Tuple[Optional[float], Optional[List[str]], bool]:
+    """
+    Bellman-Ford con rondas de relajación en paralelo.
+
+    Args:
+        graph: Graph o CompactGraph (admite pesos negativos)
+        start: Nodo inicial
+        end: Nodo final
+        workers: Procesos a usar; None = número de CPUs, 1 = en el proceso actual
+
+    Returns:
+        Igual que bellman_ford: (distancia, camino, tiene_ciclo_negativo)
+    """
+    if not graph.node_exists(start):
+        raise ValueError(f"El nodo inicial '{start}' no existe en el grafo")
+    if not graph.node_exists(end):
+        raise ValueError(f"El nodo final '{end}' no existe en el grafo")
+
+    if not isinstance(graph, CompactGraph):
+        graph = graph.to_compact()
+
+    n = graph.num_nodes
+    s, t = graph.index_of(start), graph.index_of(end)
+    reverse = graph.reverse()
+
+    if workers == 1:
+        distances = array('d', [float('infinity')]) * n
+        previous = array('i', [-1]) * n
+        distances[s] = 0.0
+
+        def run_round() -> bool:
+            return _relax_range(reverse, distances, previous, 0, n)
+
+        has_negative_cycle = _run_rounds(n, run_round)
+        return _result(graph, distances, previous, s, t, has_negative_cycle)
+
+    dist_shm = shared_memory.SharedMemory(create=True, size=8 * n)
+    prev_shm = shared_memory.SharedMemory(create=True, size=4 * n)
+    distances = dist_shm.buf.cast('d')
+    previous = prev_shm.buf.cast('i')
+    try:
+        distances[:] = array('d', [float('infinity')]) * n
+        previous[:] = array('i', [-1]) * n
+        distances[s] = 0.0
+
+        ranges = partition_by_edges(reverse, workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=len(ranges), initializer=init_worker,
+                                 initargs=(graph_payload(reverse), (dist_shm.name, prev_shm.name))) as executor:
+
+            def run_round() -> bool:
+                # Esperar a todos los rangos antes de combinar: any() sobre el
+                # iterador cortaría en el primer True y la ronda siguiente
+                # correría junto a tareas viejas que escriben el mismo rango
+                changed = list(executor.map(_relax_task, ranges))
+                return any(changed)
+
+            has_negative_cycle = _run_rounds(n, run_round)
+
+        return _result(graph, distances, previous, s, t, has_negative_cycle)
+    finally:
+        # Las vistas deben liberarse antes de cerrar la memoria compartida
+        distances.release()
+        previous.release()
+        dist_shm.close()
+        dist_shm.unlink()
+        prev_shm.close()
+        prev_shm.unlink()
+
+
+def partition_by_edges(graph: CompactGraph, parts: int) -> List[Tuple[int, int]]:
+    """Rangos contiguos de nodos [lo, hi) con aproximadamente m / parts aristas cada uno."""
+    n, m = graph.num_nodes, graph.num_edges
+    indptr = graph.indptr
+    ranges = []
+    lo = 0
+    for p in range(1, parts + 1):
+        goal = m * p // parts
+        hi = lo
+        while hi < n and (indptr[hi + 1] <= goal or p == parts):
+            hi += 1
+        if hi > lo:
+            ranges.append((lo, hi))
+        lo = hi
+    return ranges
+
+
+def _run_rounds(n: int, run_round) -> bool:
+    """Hasta n - 1 rondas o hasta que no haya cambios; True si la ronda n todavía cambia algo."""
+    for _ in range(n - 1):
+        if not run_round():
+            return False
+    return run_round()
+
+
+def _relax_range(reverse: CompactGraph, distances, previous, lo: int, hi: int) -> bool:
+    """Relaja las aristas que llegan a los nodos [lo, hi); True si alguna distancia bajó."""
+    indptr, indices, weights = reverse.indptr, reverse.indices, reverse.weights
+    infinity = float('infinity')
+    changed = False
+    for v in range(lo, hi):
+        best = distances[v]
+        best_previous = -1
+        for k in range(indptr[v], indptr[v + 1]):
+            du = distances[indices[k]]
+            if du != infinity and du + weights[k] < best:
+                best = du + weights[k]
+                best_previous = indices[k]
+        if best_previous >= 0:
+            distances[v] = best
+            previous[v] = best_previous
+            changed = True
+    return changed
+
+
+def _relax_task(node_range: Tuple[int, int]) -> bool:
+    reverse, (dist_name, prev_name) = worker_state()
+    if dist_name not in _attached:
+        _attached.clear()
+        dist_shm = shared_memory.SharedMemory(name=dist_name)
+        prev_shm = shared_memory.SharedMemory(name=prev_name)
+        _attached[dist_name] = (dist_shm, prev_shm, dist_shm.buf.cast('d'), prev_shm.buf.cast('i'))
+    _, _, distances, previous = _attached[dist_name]
+    return _relax_range(reverse, distances, previous, node_range[0], node_range[1])
+
+
+def _result(graph: CompactGraph, distances, previous, s: int, t: int,
+            has_negative_cycle: bool) -> Tuple[Optional[float], Optional[List[str]], bool]:
+    if has_negative_cycle:
+        return None, None, True
+    if distances[t] == float('infinity'):
+        return None, None, False
+    node_ids = graph.node_ids
+    return distances[t], [node_ids[i] for i in _reconstruct_index_path(list(previous), s, t)], False
@@ -0,0 +1,123 @@
+"""
+Caché de resultados de rutas para consultas repetidas sobre el mismo grafo.
+
+LRU acotado (OrderedDict) con TTL opcional. Cada resultado queda asociado a
+graph.version: cuando add_node / add_edge cambian el grafo la versión sube
+y todo lo guardado se descarta en la siguiente consulta.
+
+Los árboles completos de dijkstra_all_paths también se guardan: una vez
+calculado el árbol de un origen, cualquier consulta desde ese origen se
+responde reconstruyendo el camino, en O(largo del camino).
+"""
+
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from models.graph import Graph
+from .dijkstra import dijkstra, dijkstra_all_paths, reconstruct_path
+from .bellman_ford import bellman_ford
+
+
+class PathCache:
+
+    def __init__(self, graph: Graph, maxsize: int = 1024, ttl: Optional[float] = None):
+        """
+        Args:
+            graph: Graph o CompactGraph sobre el que se consulta
+            maxsize: Máximo de resultados guardados (se descarta el menos usado)
+            ttl: Segundos de validez de cada resultado (None = sin vencimiento)
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize debe ser al menos 1")
+        self.graph = graph
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._version = graph.version
+
+    def dijkstra(self, start: str, end: str) -> Tuple[Optional[float], Optional[List[str]]]:
+        """Igual que dijkstra(graph, start, end), usando el árbol de start si ya está guardado."""
+        tree = self._get(('tree', start), count_miss=False)
+        if tree is not None:
+            return self._from_tree(tree, start, end)
+
+        key = ('dijkstra', start, end)
+        result = self._get(key)
+        if result is None:
+            result = dijkstra(self.graph, start, end)
+            self._put(key, result)
+        return result[0], _copy(result[1])
+
+    def bellman_ford(self, start: str, end: str) -> Tuple[Optional[float], Optional[List[str]], bool]:
+        """Igual que bellman_ford(graph, start, end)."""
+        key = ('bellman_ford', start, end)
+        result = self._get(key)
+        if result is None:
+            result = bellman_ford(self.graph, start, end)
+            self._put(key, result)
+        return result[0], _copy(result[1]), result[2]
+
+    def all_paths(self, start: str) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+        """
+        Árbol de caminos más cortos desde start (dijkstra_all_paths). Los
+        diccionarios devueltos son los guardados: no deben modificarse.
+        """
+        key = ('tree', start)
+        tree = self._get(key)
+        if tree is None:
+            tree = dijkstra_all_paths(self.graph, start)
+            self._put(key, tree)
+        return tree
+
+    def path(self, start: str, end: str) -> Tuple[Optional[float], Optional[List[str]]]:
+        """Como dijkstra() pero calculando y guardando el árbol completo de start."""
+        return self._from_tree(self.all_paths(start), start, end)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _from_tree(self, tree, start: str, end: str) -> Tuple[Optional[float], Optional[List[str]]]:
+        distances, previous = tree
+        if end not in distances:
+            raise ValueError(f"El nodo final '{end}' no existe en el grafo")
+        if distances[end] == float('infinity'):
+            return None, None
+        return distances[end], reconstruct_path(previous, start, end)
+
+    def _get(self, key, count_miss: bool = True):
+        if self.graph.version != self._version:
+            # El grafo cambió: nada de lo guardado es válido
+            self._entries.clear()
+            self._version = self.graph.version
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += count_miss
+            return None
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[key]
+            self.misses += count_miss
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def _put(self, key, value):
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def _copy(path: Optional[List[str]]) -> Optional[List[str]]:
+    # Copia para que quien llama no modifique el camino guardado
+    return list(path) if path is not None else None
@@ -0,0 +1,256 @@
+"""
+Colas de prioridad alternativas a heapq para Dijkstra de un origen.
+
+    - RadixHeap: cola monótona con 65 cubetas según el bit más alto en que
+      la clave difiere del último mínimo. Las distancias (float >= 0) se
+      usan como enteros de 64 bits (su representación IEEE conserva el
+      orden), así sirve tanto para pesos enteros como con decimales.
+    - IndexedBinaryHeap: montículo binario con posición por nodo; cada nodo
+      está a lo sumo una vez y las mejoras son decrease-key, por lo que el
+      montículo no pasa de V elementos (con heapq llega a O(E)).
+    - Delta-stepping: cubetas de ancho delta; dentro de una cubeta se
+      relajan primero las aristas livianas (peso <= delta) hasta vaciarla y
+      luego, una sola vez, las pesadas.
+
+Cada núcleo trabaja sobre un CompactGraph y devuelve (distancias, previos)
+por índice, igual que _dijkstra_compact_all.
+"""
+
+import struct
+from typing import List, Optional, Tuple
+
+from models.compact_graph import CompactGraph
+
+_DOUBLE = struct.Struct('<d')
+_INT64 = struct.Struct('<q')
+
+
+def float_key(value: float) -> int:
+    """Entero con el mismo orden que value (válido para value >= 0)."""
+    return _INT64.unpack(_DOUBLE.pack(value))[0]
+
+
+class RadixHeap:
+    """Cola de prioridad monótona: nunca se inserta una clave menor que el último mínimo."""
+
+    def __init__(self):
+        self.buckets: List[list] = [[] for _ in range(65)]
+        self.last = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def push(self, key: int, item):
+        if key < self.last:
+            raise ValueError("RadixHeap solo admite claves no menores al último mínimo")
+        self.buckets[(key ^ self.last).bit_length()].append((key, item))
+        self.size += 1
+
+    def pop(self) -> Tuple[int, object]:
+        """Saca un elemento con la clave mínima."""
+        buckets = self.buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            # Redistribuir la primera cubeta no vacía alrededor de su mínimo
+            bucket = buckets[i]
+            buckets[i] = []
+            last = min(bucket)[0]
+            self.last = last
+            for entry in bucket:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+        self.size -= 1
+        return buckets[0].pop()
+
+
+class IndexedBinaryHeap:
+    """Montículo binario de mínimos sobre los nodos 0..n-1 con decrease-key."""
+
+    def __init__(self, n: int):
+        self.keys = [0.0] * n
+        self.heap: List[int] = []
+        self.position = [-1] * n  # -1: no está en el montículo
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, node: int) -> bool:
+        return self.position[node] >= 0
+
+    def push_or_decrease(self, node: int, key: float):
+        """Inserta node o baja su clave (la nueva clave debe ser menor)."""
+        self.keys[node] = key
+        if self.position[node] < 0:
+            self.position[node] = len(self.heap)
+            self.heap.append(node)
+        self._sift_up(self.position[node])
+
+    def pop(self) -> Tuple[float, int]:
+        heap, position = self.heap, self.position
+        top = heap[0]
+        last = heap.pop()
+        position[top] = -1
+        if heap:
+            heap[0] = last
+            position[last] = 0
+            self._sift_down(0)
+        return self.keys[top], top
+
+    def _sift_up(self, i: int):
+        heap, position, keys = self.heap, self.position, self.keys
+        node = heap[i]
+        key = keys[node]
+        while i > 0:
+            parent = (i - 1) >> 1
+            parent_node = heap[parent]
+            if keys[parent_node] <= key:
+                break
+            heap[i] = parent_node
+            position[parent_node] = i
+            i = parent
+        heap[i] = node
+        position[node] = i
+
+    def _sift_down(self, i: int):
+        heap, position, keys = self.heap, self.position, self.keys
+        size = len(heap)
+        node = heap[i]
+        key = keys[node]
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[heap[child + 1]] < keys[heap[child]]:
+                child += 1
+            if keys[heap[child]] >= key:
+                break
+            heap[i] = heap[child]
+            position[heap[i]] = i
+            i = child
+        heap[i] = node
+        position[node] = i
+
+
+def _check_non_negative(graph: CompactGraph):
+    if graph.num_edges and min(graph.weights) < 0:
+        raise ValueError("Esta estrategia requiere pesos no negativos")
+
+
+def dijkstra_radix(graph: CompactGraph, start: int) -> Tuple[List[float], List[int]]:
+    _check_non_negative(graph)
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    n = graph.num_nodes
+
+    distances = [float('infinity')] * n
+    distances[start] = 0.0
+    previous = [-1] * n
+    visited = bytearray(n)
+
+    queue = RadixHeap()
+    queue.push(float_key(0.0), start)
+    while queue.size:
+        _, current_node = queue.pop()
+        if visited[current_node]:
+            continue
+        visited[current_node] = 1
+
+        current_distance = distances[current_node]
+        for k in range(indptr[current_node], indptr[current_node + 1]):
+            neighbor = indices[k]
+            distance = current_distance + weights[k]
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                previous[neighbor] = current_node
+                queue.push(float_key(distance), neighbor)
+
+    return distances, previous
+
+
+def dijkstra_indexed(graph: CompactGraph, start: int) -> Tuple[List[float], List[int]]:
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    n = graph.num_nodes
+
+    distances = [float('infinity')] * n
+    distances[start] = 0.0
+    previous = [-1] * n
+    visited = bytearray(n)
+
+    queue = IndexedBinaryHeap(n)
+    queue.push_or_decrease(start, 0.0)
+    while queue.heap:
+        current_distance, current_node = queue.pop()
+        visited[current_node] = 1
+
+        for k in range(indptr[current_node], indptr[current_node + 1]):
+            neighbor = indices[k]
+            distance = current_distance + weights[k]
+            if distance < distances[neighbor] and not visited[neighbor]:
+                distances[neighbor] = distance
+                previous[neighbor] = current_node
+                queue.push_or_decrease(neighbor, distance)
+
+    return distances, previous
+
+
+def dijkstra_delta_stepping(graph: CompactGraph, start: int,
+                            delta: Optional[float] = None) -> Tuple[List[float], List[int]]:
+    """
+    Delta-stepping secuencial.
+
+    Args:
+        delta: Ancho de cubeta; por defecto el peso medio de las aristas
+    """
+    _check_non_negative(graph)
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    n = graph.num_nodes
+    infinity = float('infinity')
+    if delta is None:
+        delta = (sum(weights) / len(weights)) if len(weights) else 1.0
+    if delta <= 0:
+        delta = 1.0
+
+    distances = [infinity] * n
+    previous = [-1] * n
+    bucket_of = [-1] * n
+    buckets = {}
+
+    def relax(node: int, distance: float, parent: int):
+        if distance < distances[node]:
+            old = bucket_of[node]
+            if old >= 0:
+                buckets[old].discard(node)
+            index = int(distance / delta)
+            buckets.setdefault(index, set()).add(node)
+            bucket_of[node] = index
+            distances[node] = distance
+            previous[node] = parent
+
+    relax(start, 0.0, -1)
+    while buckets:
+        i = min(buckets)
+        settled = set()
+        # Fase liviana: puede volver a llenar la cubeta i
+        while buckets.get(i):
+            frontier = buckets.pop(i)
+            requests = []
+            for u in frontier:
+                bucket_of[u] = -1
+                settled.add(u)
+                du = distances[u]
+                for k in range(indptr[u], indptr[u + 1]):
+                    if weights[k] <= delta:
+                        requests.append((indices[k], du + weights[k], u))
+            for node, distance, parent in requests:
+                relax(node, distance, parent)
+        buckets.pop(i, None)
+
+        # Fase pesada: una vez por nodo cerrado en la cubeta
+        for u in settled:
+            du = distances[u]
+            for k in range(indptr[u], indptr[u + 1]):
+                if weights[k] > delta:
+                    relax(indices[k], du + weights[k], u)
+
+    return distances, previous
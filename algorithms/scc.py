@@ -0,0 +1,258 @@
+"""
+Índice de componentes fuertemente conexas (SCC) y alcanzabilidad.
+
+Tarjan iterativo (sin recursión, así no hay límite de profundidad) agrupa
+los nodos en componentes; el grafo de componentes (condensación) es un DAG.
+Tarjan numera las componentes en orden topológico inverso: cada arista de
+la condensación va de un número mayor a uno menor, así que si b > a la
+componente a no llega a b, sin mirar nada más.
+
+Con pocas componentes (hasta CLOSURE_LIMIT) se precalcula la clausura
+transitiva en una sola pasada:
+
+    alcanzables(c) = {c} ∪ alcanzables(d) para cada sucesora d de c
+
+con un bitset (bytes) por componente, y "¿llega a?" es O(1); la memoria es
+C² / 8 bytes. Por encima del límite (grafos de noticias: casi todas las
+componentes son de un nodo) la clausura costaría gigas y minutos, así que
+se recorre el DAG bajo demanda y se recuerdan los conjuntos de las últimas
+componentes de origen consultadas.
+
+El índice se construye una vez por versión del grafo con
+SCCIndex.for_graph(graph). Los algoritmos consultan SCCIndex.cached(graph):
+si ya hay un índice vigente responden "sin camino" sin explorar nada.
+"""
+
+import weakref
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set
+
+from models.graph import Graph
+from models.compact_graph import CompactGraph
+
+# Índice construido para cada grafo (se libera junto con el grafo)
+_indexes: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+# Máximo de componentes con clausura precalculada (4096² / 8 = 2 MB)
+CLOSURE_LIMIT = 4096
+
+# Conjuntos de alcanzables recordados sin clausura (por componente de origen)
+REACH_MEMO_SIZE = 256
+
+
+class SCCIndex:
+
+    def __init__(self, node_ids: List[str], component: List[int], num_components: int,
+                 successors: List[List[int]], reach: Optional[List[bytes]], version: int):
+        """
+        Usar SCCIndex.build() o SCCIndex.for_graph().
+
+        Args:
+            node_ids: IDs de los nodos (la posición es el índice en component)
+            component: Componente de cada nodo
+            num_components: Cantidad de componentes
+            successors: Componentes sucesoras de cada componente en la condensación
+            reach: Bitset de componentes alcanzables desde cada componente,
+                   o None si hay más de CLOSURE_LIMIT componentes
+            version: graph.version con la que se construyó
+        """
+        self.node_ids = node_ids
+        self.index: Dict[str, int] = {node_id: i for i, node_id in enumerate(node_ids)}
+        self.component = component
+        self.num_components = num_components
+        self.successors = successors
+        self.reach = reach
+        self.version = version
+        self._members: Optional[List[List[int]]] = None
+        self._predecessors: Optional[List[List[int]]] = None
+        self._reach_memo: 'OrderedDict[int, Set[int]]' = OrderedDict()
+
+    @classmethod
+    def build(cls, graph: Graph, closure_limit: int = CLOSURE_LIMIT) -> 'SCCIndex':
+        if isinstance(graph, CompactGraph):
+            node_ids = list(graph.node_ids)
+            indptr, indices = graph.indptr, graph.indices
+            adjacency = [indices[indptr[i]:indptr[i + 1]] for i in range(graph.num_nodes)]
+        else:
+            node_ids = graph.get_all_nodes()
+            index = {node_id: i for i, node_id in enumerate(node_ids)}
+            adjacency = [[index[neighbor] for neighbor, _ in graph.get_neighbors(node_id)]
+                         for node_id in node_ids]
+
+        component, num_components = _tarjan(adjacency)
+
+        successor_sets = [set() for _ in range(num_components)]
+        for u, neighbors in enumerate(adjacency):
+            cu = component[u]
+            for v in neighbors:
+                if component[v] != cu:
+                    successor_sets[cu].add(component[v])
+        successors = [sorted(s) for s in successor_sets]
+
+        reach: Optional[List[bytes]] = None
+        if num_components <= closure_limit:
+            # Las sucesoras siempre tienen número menor: recorrer de menor a mayor
+            num_bytes = (num_components + 7) // 8
+            reach_bits = [0] * num_components
+            reach = []
+            for c in range(num_components):
+                bits = 1 << c
+                for d in successors[c]:
+                    bits |= reach_bits[d]
+                reach_bits[c] = bits
+                reach.append(bits.to_bytes(num_bytes, 'little'))
+
+        return cls(node_ids, component, num_components, successors, reach, graph.version)
+
+    @classmethod
+    def for_graph(cls, graph: Graph) -> 'SCCIndex':
+        """Índice vigente del grafo; lo construye si no existe o si el grafo cambió."""
+        index = cls.cached(graph)
+        if index is None:
+            index = cls.build(graph)
+            _indexes[graph] = index
+        return index
+
+    @staticmethod
+    def cached(graph: Graph) -> Optional['SCCIndex']:
+        """Índice ya construido y vigente para graph, o None (nunca lo construye)."""
+        index = _indexes.get(graph)
+        if index is not None and index.version == graph.version:
+            return index
+        return None
+
+    def component_of(self, node_id: str) -> int:
+        return self.component[self.index[node_id]]
+
+    def can_reach(self, start: str, end: str) -> bool:
+        """True si existe algún camino de start a end (O(1))."""
+        return self._component_reaches(self.component_of(start), self.component_of(end))
+
+    def components(self) -> List[List[str]]:
+        """Nodos de cada componente, en orden topológico inverso (la 0 no apunta a otras)."""
+        node_ids = self.node_ids
+        return [[node_ids[i] for i in members] for members in self._component_members()]
+
+    def topological_order(self) -> List[int]:
+        """Componentes en orden topológico (cada una antes que sus sucesoras)."""
+        return list(range(self.num_components - 1, -1, -1))
+
+    def reachable_nodes(self, c: int) -> List[int]:
+        """Índices de los nodos alcanzables desde la componente c."""
+        members = self._component_members()
+        return [i for d in sorted(_walk(c, self.successors)) for i in members[d]]
+
+    def reaching_nodes(self, c: int) -> List[int]:
+        """Índices de los nodos desde los que se alcanza la componente c."""
+        members = self._component_members()
+        return [i for a in sorted(_walk(c, self._component_predecessors())) for i in members[a]]
+
+    def _component_reaches(self, a: int, b: int) -> bool:
+        if a == b:
+            return True
+        if b > a:
+            return False  # Las aristas de la condensación bajan de número
+        if self.reach is not None:
+            return (self.reach[a][b >> 3] >> (b & 7)) & 1 == 1
+
+        memo = self._reach_memo
+        reachable = memo.get(a)
+        if reachable is None:
+            reachable = _walk(a, self.successors)
+            memo[a] = reachable
+            if len(memo) > REACH_MEMO_SIZE:
+                memo.popitem(last=False)
+        else:
+            memo.move_to_end(a)
+        return b in reachable
+
+    def _component_members(self) -> List[List[int]]:
+        if self._members is None:
+            members: List[List[int]] = [[] for _ in range(self.num_components)]
+            for i, c in enumerate(self.component):
+                members[c].append(i)
+            self._members = members
+        return self._members
+
+    def _component_predecessors(self) -> List[List[int]]:
+        if self._predecessors is None:
+            predecessors: List[List[int]] = [[] for _ in range(self.num_components)]
+            for c, successors in enumerate(self.successors):
+                for d in successors:
+                    predecessors[d].append(c)
+            self._predecessors = predecessors
+        return self._predecessors
+
+
+def _walk(c: int, adjacency: List[List[int]]) -> Set[int]:
+    """Componentes alcanzables desde c siguiendo adjacency (incluye a c)."""
+    seen = {c}
+    stack = [c]
+    while stack:
+        for d in adjacency[stack.pop()]:
+            if d not in seen:
+                seen.add(d)
+                stack.append(d)
+    return seen
+
+
+def known_unreachable(graph: Graph, start: str, end: str) -> bool:
+    """True solo si hay un SCCIndex vigente para graph y dice que end no es alcanzable."""
+    index = _indexes.get(graph)
+    return index is not None and index.version == graph.version and not index.can_reach(start, end)
+
+
+def _tarjan(adjacency: List) -> tuple:
+    """Tarjan iterativo. Retorna (componente de cada nodo, cantidad de componentes)."""
+    n = len(adjacency)
+    order = [-1] * n
+    low = [0] * n
+    on_stack = bytearray(n)
+    component = [-1] * n
+    stack: List[int] = []
+    counter = 0
+    num_components = 0
+
+    for root in range(n):
+        if order[root] != -1:
+            continue
+        # Pila de trabajo: (nodo, próxima arista a revisar)
+        work = [(root, 0)]
+        while work:
+            v, edge = work[-1]
+            if edge == 0 and order[v] == -1:
+                order[v] = low[v] = counter
+                counter += 1
+                stack.append(v)
+                on_stack[v] = 1
+
+            neighbors = adjacency[v]
+            descended = False
+            while edge < len(neighbors):
+                w = neighbors[edge]
+                edge += 1
+                if order[w] == -1:
+                    work[-1] = (v, edge)
+                    work.append((w, 0))
+                    descended = True
+                    break
+                if on_stack[w] and order[w] < low[v]:
+                    low[v] = order[w]
+            if descended:
+                continue
+
+            work.pop()
+            if low[v] == order[v]:
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    component[w] = num_components
+                    if w == v:
+                        break
+                num_components += 1
+            if work:
+                parent = work[-1][0]
+                if low[v] < low[parent]:
+                    low[parent] = low[v]
+
+    return component, num_components
@@ -0,0 +1,64 @@
+"""
+Benchmark de la matriz origen x destino contra el bucle de dijkstra por par.
+
+Uso: python benchmarks/bench_distance_matrix.py [num_origenes] [num_destinos] [workers]
+"""
+
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from models.graph import Graph
+from algorithms.dijkstra import dijkstra
+from algorithms.distance_matrix import distance_matrix
+
+DATASET = 'city_random_1500'
+
+
+def pairwise_matrix(graph: Graph, sources, targets) -> np.ndarray:
+    """La forma actual: un dijkstra() por cada par."""
+    matrix = np.full((len(sources), len(targets)), np.inf)
+    for i, start in enumerate(sources):
+        for j, end in enumerate(targets):
+            distance, _ = dijkstra(graph, start, end)
+            if distance is not None:
+                matrix[i, j] = distance
+    return matrix
+
+
+def run_benchmark(num_sources: int, num_targets: int, workers: int):
+    graph = Graph.from_edge_csv(os.path.join(ROOT, 'data', f'{DATASET}.csv'))
+    random.seed(42)
+    nodes = graph.get_all_nodes()
+    sources = random.sample(nodes, num_sources)
+    targets = random.sample(nodes, num_targets)
+
+    print(f"\n=== {DATASET}: {num_sources} x {num_targets} ===")
+
+    start_time = time.perf_counter()
+    reference = pairwise_matrix(graph, sources, targets)
+    pairwise_time = time.perf_counter() - start_time
+    print(f"  {'dijkstra por par':<28} {pairwise_time:8.2f} s")
+
+    compact = graph.to_compact()
+    for label, num_workers in (('distance_matrix (1 proceso)', 1),
+                               (f'distance_matrix ({workers} procesos)', workers)):
+        start_time = time.perf_counter()
+        matrix = distance_matrix(compact, sources, targets, workers=num_workers)
+        elapsed = time.perf_counter() - start_time
+        same = np.allclose(matrix, reference)
+        print(f"  {label:<28} {elapsed:8.2f} s  x{pairwise_time / elapsed:6.1f}  "
+              f"{'OK' if same else 'DISTANCIAS DISTINTAS'}")
+
+
+if __name__ == '__main__':
+    num_sources = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    num_targets = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 2)
+    run_benchmark(num_sources, num_targets, workers)
@@ -0,0 +1,87 @@
+"""
+Benchmark de consultas punto a punto sobre los datasets de ciudades.
+Compara tiempo y nodos cerrados de cada algoritmo contra Dijkstra.
+
+Uso: python benchmarks/bench_point_to_point.py [num_consultas]
+"""
+
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from models.graph import Graph
+from algorithms.dijkstra import dijkstra, bidirectional_dijkstra
+from algorithms.astar import astar
+from algorithms.contraction_hierarchies import ContractionHierarchy
+from algorithms.alt import LandmarkIndex
+
+DATASETS = ['city_grid_1500', 'city_random_1500', 'city_clustered_1500']
+
+
+def load_dataset(name: str) -> Graph:
+    graph = Graph.from_edge_csv(os.path.join(ROOT, 'data', f'{name}.csv'))
+    positions = os.path.join(ROOT, 'data', f'{name}_nodes.csv')
+    if os.path.exists(positions):
+        graph.load_node_positions(positions)
+    return graph
+
+
+def get_algorithms(graph: Graph):
+    """Algoritmos a comparar: nombre -> función (graph, start, end, stats)."""
+    start_time = time.perf_counter()
+    hierarchy = ContractionHierarchy.build(graph)
+    print(f"  Preprocesamiento CH: {time.perf_counter() - start_time:.2f} s "
+          f"({hierarchy.num_shortcuts} atajos)")
+    start_time = time.perf_counter()
+    landmarks = LandmarkIndex.build(graph, k=8, seed=42)
+    print(f"  Preprocesamiento ALT: {time.perf_counter() - start_time:.2f} s "
+          f"({len(landmarks.landmarks)} landmarks)")
+
+    return {
+        'Dijkstra': dijkstra,
+        'Bidireccional': bidirectional_dijkstra,
+        'A*': lambda g, s, t, stats: astar(g, s, t, stats=stats),
+        'CH': lambda g, s, t, stats: hierarchy.query(s, t, stats),
+        'ALT': lambda g, s, t, stats: landmarks.query(s, t, stats),
+    }
+
+
+def run_benchmark(name: str, num_queries: int):
+    graph = load_dataset(name)
+    random.seed(42)
+    nodes = graph.get_all_nodes()
+    queries = [tuple(random.sample(nodes, 2)) for _ in range(num_queries)]
+
+    print(f"\n=== {name} ({graph.get_stats()['num_edges']} aristas, {num_queries} consultas) ===")
+    reference = None
+    for algo_name, algorithm in get_algorithms(graph).items():
+        settled = 0
+        distances = []
+        start_time = time.perf_counter()
+        for start, end in queries:
+            stats = {}
+            distance, _ = algorithm(graph, start, end, stats)
+            settled += stats['settled']
+            distances.append(distance)
+        elapsed = time.perf_counter() - start_time
+
+        if reference is None:
+            reference = (distances, settled, elapsed)
+        same = all(
+            (a is None and b is None) or (a is not None and b is not None and abs(a - b) < 1e-6)
+            for a, b in zip(reference[0], distances)
+        )
+        print(f"  {algo_name:<15} {elapsed * 1000 / num_queries:8.3f} ms/consulta  "
+              f"{settled / num_queries:8.1f} nodos cerrados  "
+              f"x{reference[2] / elapsed:5.2f} vs Dijkstra  "
+              f"{'OK' if same else 'DISTANCIAS DISTINTAS'}")
+
+
+if __name__ == '__main__':
+    queries = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for dataset in DATASETS:
+        run_benchmark(dataset, queries)
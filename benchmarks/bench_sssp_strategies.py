@@ -0,0 +1,47 @@
+"""
+Benchmark de las estrategias de cola de prioridad de dijkstra_all_paths.
+
+Uso: python benchmarks/bench_sssp_strategies.py [num_origenes]
+"""
+
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from models.graph import Graph
+from algorithms.dijkstra import dijkstra_all_paths
+
+DATASETS = ['city_grid_1500', 'city_random_1500', 'city_clustered_1500']
+STRATEGIES = ['heapq', 'radix', 'delta', 'indexed']
+
+
+def run_benchmark(name: str, num_sources: int):
+    graph = Graph.from_edge_csv(os.path.join(ROOT, 'data', f'{name}.csv')).to_compact()
+    random.seed(42)
+    sources = random.sample(graph.get_all_nodes(), num_sources)
+
+    print(f"\n=== {name} ({graph.num_edges} aristas, {num_sources} orígenes) ===")
+    reference = None
+    for strategy in STRATEGIES:
+        results = []
+        start_time = time.perf_counter()
+        for source in sources:
+            results.append(dijkstra_all_paths(graph, source, strategy=strategy)[0])
+        elapsed = time.perf_counter() - start_time
+
+        if reference is None:
+            reference = (results, elapsed)
+        same = all(abs(a[node] - b[node]) < 1e-6 or a[node] == b[node]
+                   for a, b in zip(reference[0], results) for node in a)
+        print(f"  {strategy:<10} {elapsed * 1000 / num_sources:8.2f} ms/origen  "
+              f"x{reference[1] / elapsed:5.2f} vs heapq  {'OK' if same else 'DISTANCIAS DISTINTAS'}")
+
+
+if __name__ == '__main__':
+    num_sources = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    for dataset in DATASETS:
+        run_benchmark(dataset, num_sources)
@@ -7,7 +7,7 @@ import random
 import csv
 import json
 import math
-from typing import List, Tuple, Set
+from typing import List, Tuple, Set, Dict
 
 
 class CityGraphGenerator:
@@ -24,6 +24,8 @@ class CityGraphGenerator:
             seed: Semilla para reproducibilidad (opcional)
         """
         self.num_nodes = num_nodes
+        # Coordenadas (x, y) de los nodos del último grafo generado
+        self.positions: Dict[str, Tuple[float, float]] = {}
         if seed is not None:
             random.seed(seed)
     
@@ -55,6 +57,7 @@ class CityGraphGenerator:
         
         # Crear diccionario de posiciones
         positions = {node[0]: (node[1], node[2]) for node in nodes}
+        self.positions = positions
         
         # Generar conexiones horizontales y verticales
         for i in range(grid_size):
@@ -119,6 +122,7 @@ class CityGraphGenerator:
             nodes.append((node_id, x, y))
         
         positions = {node[0]: (node[1], node[2]) for node in nodes}
+        self.positions = positions
         
         # Para cada nodo, conectar con los k vecinos más cercanos
         for node_id, x, y in nodes:
@@ -187,6 +191,8 @@ class CityGraphGenerator:
                         dist = math.sqrt((x - other_x)**2 + (y - other_y)**2)
                         edges.append((node_id, other_id, round(dist, 2)))
         
+        self.positions = {node[0]: (node[1], node[2]) for node in all_nodes}
+
         # Conectar clusters entre sí (carreteras principales)
         for cluster_id in range(num_clusters):
             # Conectar con 2-3 clusters vecinos
@@ -230,6 +236,20 @@ class CityGraphGenerator:
             for source, destination, weight in edges:
                 writer.writerow([source, destination, weight])
     
+    def save_positions_to_csv(self, filepath: str):
+        """
+        Guarda las coordenadas de los nodos del último grafo generado
+        (las usa la heurística euclidiana de A*).
+        
+        Args:
+            filepath: Ruta del archivo de salida (nodo,x,y)
+        """
+        with open(filepath, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(['nodo', 'x', 'y'])
+            for node_id, (x, y) in self.positions.items():
+                writer.writerow([node_id, round(x, 4), round(y, 4)])
+    
     def save_to_json(self, edges: List[Tuple[str, str, float]], filepath: str):
         """
         Guarda las aristas en un archivo JSON.
@@ -259,6 +279,7 @@ def main():
     generator = CityGraphGenerator(num_nodes=1500, seed=42)
     edges = generator.generate_grid_based_city()
     generator.save_to_csv(edges, 'data/city_grid_1500.csv')
+    generator.save_positions_to_csv('data/city_grid_1500_nodes.csv')
     print(f"✓ Generado: city_grid_1500.csv ({len(edges)} aristas)")
     
     # Generar dataset con clusters
@@ -266,6 +287,7 @@ def main():
     generator = CityGraphGenerator(num_nodes=1500, seed=42)
     edges = generator.generate_clustered_city(num_clusters=15)
     generator.save_to_csv(edges, 'data/city_clustered_1500.csv')
+    generator.save_positions_to_csv('data/city_clustered_1500_nodes.csv')
     print(f"✓ Generado: city_clustered_1500.csv ({len(edges)} aristas)")
     
     # Generar dataset aleatorio
@@ -273,6 +295,7 @@ def main():
     generator = CityGraphGenerator(num_nodes=1500, seed=42)
     edges = generator.generate_random_city(avg_connections=4)
     generator.save_to_csv(edges, 'data/city_random_1500.csv')
+    generator.save_positions_to_csv('data/city_random_1500_nodes.csv')
     print(f"✓ Generado: city_random_1500.csv ({len(edges)} aristas)")
     
     # Generar dataset pequeño para pruebas
@@ -281,6 +304,7 @@ def main():
     edges = generator.generate_grid_based_city()
     generator.save_to_csv(edges, 'data/city_test_50.csv')
     generator.save_to_json(edges, 'data/city_test_50.json')
+    generator.save_positions_to_csv('data/city_test_50_nodes.csv')
     print(f"✓ Generado: city_test_50.csv y city_test_50.json ({len(edges)} aristas)")
     
     print("\n¡Datasets generados exitosamente!")
@@ -0,0 +1,227 @@
+"""
+Caché columnar binaria de un export de GDELT ya parseado.
+
+Se guarda junto al archivo fuente (<export>.cache) con el mismo esquema de
+secciones que los snapshots de grafo (models/snapshot.py):
+
+    Cabecera   '<8sIIQQq20s'  magic, versión, flags, num_eventos,
+               tamaño y mtime (ns) del archivo fuente, huella del clasificador
+    Secciones  ids, días, títulos y urls (StringTable), latitud, longitud, tono
+
+Las fechas se guardan como días desde 1970-01-01 (int32) y el tono como
+int8. content no se guarda: se rearma con título y url igual que el parser.
+La caché deja de valer sola si cambia el tamaño o el mtime del archivo
+fuente, o si el clasificador de tono es otro. Si no cubre todo el archivo
+(flag FLAG_COMPLETE apagada) solo sirve para pedidos de hasta num_eventos.
+"""
+
+import datetime
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import List, Optional, Sequence
+
+from models.snapshot import StringTable, read_sections, write_sections
+
+MAGIC = b'GDCACHE\x00'
+CACHE_VERSION = 1
+
+FLAG_COMPLETE = 1
+FLAG_BIG_ENDIAN = 2
+
+SECTIONS = [
+    'id_offsets', 'id_blob', 'days',
+    'headline_offsets', 'headline_blob', 'url_offsets', 'url_blob',
+    'latitude', 'longitude', 'tone',
+]
+
+_HEADER = struct.Struct('<8sIIQQq20s')
+_EPOCH = datetime.date(1970, 1, 1).toordinal()
+
+
+def cache_path_for(source_path: str) -> str:
+    return source_path + '.cache'
+
+
+class EventColumns(Sequence):
+    """
+    Eventos de la caché como columnas sobre el archivo mapeado. Los
+    GDELTEvent se crean solo al pedirlos (events[i] o events[a:b]).
+    """
+
+    def __init__(self, ids: StringTable, days, headlines: StringTable, urls: StringTable,
+                 latitudes, longitudes, tones, complete: bool):
+        self.ids = ids
+        self.days = days
+        self.headlines = headlines
+        self.urls = urls
+        self.latitudes = latitudes
+        self.longitudes = longitudes
+        self.tones = tones
+        self.complete = complete
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step == 1:
+                return self._events(start, stop)
+            return [self[j] for j in range(start, stop, step)]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self._events(i, i + 1)[0]
+
+    def __iter__(self):
+        # Por bloques: no se crean todos los eventos juntos
+        for start in range(0, len(self), 4096):
+            yield from self._events(start, min(start + 4096, len(self)))
+
+    def _events(self, start: int, stop: int) -> List:
+        """GDELTEvent de las filas [start, stop), leyendo las columnas en bloque."""
+        # Import local: gdelt_parser importa este módulo
+        from data.gdelt_parser import GDELTEvent
+
+        def strings(table: StringTable) -> List[str]:
+            offsets, blob = table.offsets, table.blob
+            return [bytes(blob[offsets[j]:offsets[j + 1]]).decode('utf-8') for j in range(start, stop)]
+
+        ids, headlines, urls = strings(self.ids), strings(self.headlines), strings(self.urls)
+        days, latitudes, longitudes, tones = self.days, self.latitudes, self.longitudes, self.tones
+        dates = {}  # Casi todos los eventos de un export comparten el día
+        events = []
+        for k, j in enumerate(range(start, stop)):
+            day = days[j]
+            date_obj = dates.get(day)
+            if date_obj is None:
+                date_obj = dates[day] = datetime.datetime.fromordinal(day + _EPOCH)
+            headline, url = headlines[k], urls[k]
+            events.append(GDELTEvent(ids[k], date_obj, headline, url, f"{headline} - Fuente: {url}",
+                                     latitudes[j], longitudes[j], tones[j]))
+        return events
+
+    def covers(self, max_rows: Optional[int]) -> bool:
+        """True si alcanza para un pedido de max_rows eventos (None = todo el archivo)."""
+        return self.complete or (max_rows is not None and max_rows <= len(self))
+
+
+class CacheWriter:
+    """
+    Junta los eventos en columnas a medida que se parsean (mucho menos
+    memoria que los GDELTEvent) y al final escribe la caché.
+
+    Crearlo antes de leer el primer byte: el tamaño y el mtime de la fuente
+    se toman al construirlo, así si el archivo crece durante el parseo la
+    caché queda vieja en vez de marcarse completa sin las filas nuevas.
+    """
+
+    def __init__(self, source_path: str, signature: bytes):
+        self.source_path = source_path
+        self.signature = signature
+        try:
+            self.source_stat = os.stat(source_path)
+        except OSError:
+            self.source_stat = None
+        self.ids: List[str] = []
+        self.headlines: List[str] = []
+        self.urls: List[str] = []
+        self.days = array('i')
+        self.latitudes = array('d')
+        self.longitudes = array('d')
+        self.tones = array('b')
+        self.valid = self.source_stat is not None
+
+    def add(self, event) -> None:
+        if not self.valid:
+            return
+        try:
+            self.tones.append(event.tone)
+        except OverflowError:
+            self.valid = False  # Tono fuera de int8: esta fuente queda sin caché
+            return
+        self.ids.append(event.event_id)
+        self.headlines.append(event.headline)
+        self.urls.append(event.url)
+        self.days.append(event.date_obj.toordinal() - _EPOCH)
+        self.latitudes.append(event.latitude)
+        self.longitudes.append(event.longitude)
+
+    def finish(self, complete: bool) -> bool:
+        """
+        Escribe la caché. Retorna False si no se pudo (directorio de solo
+        lectura, tono fuera de int8, fuente inexistente): la caché es opcional
+        y el parser sigue sin ella.
+
+        Args:
+            complete: True si los eventos cubren todo el archivo fuente
+        """
+        if not self.valid:
+            return False
+
+        id_table = StringTable.build(self.ids)
+        headline_table = StringTable.build(self.headlines)
+        url_table = StringTable.build(self.urls)
+        sections = {
+            'id_offsets': id_table.offsets, 'id_blob': id_table.blob, 'days': self.days,
+            'headline_offsets': headline_table.offsets, 'headline_blob': headline_table.blob,
+            'url_offsets': url_table.offsets, 'url_blob': url_table.blob,
+            'latitude': self.latitudes, 'longitude': self.longitudes, 'tone': self.tones,
+        }
+
+        flags = FLAG_COMPLETE if complete else 0
+        if sys.byteorder == 'big':
+            flags |= FLAG_BIG_ENDIAN
+
+        cache_path = cache_path_for(self.source_path)
+        temp_path = f'{cache_path}.{os.getpid()}.tmp'
+        try:
+            stat = self.source_stat
+            header = _HEADER.pack(MAGIC, CACHE_VERSION, flags, len(self.ids),
+                                  stat.st_size, stat.st_mtime_ns, self.signature)
+            with open(temp_path, 'wb') as file:
+                write_sections(file, header, [sections[name] for name in SECTIONS])
+            # Reemplazo atómico: quien tenga mapeada la caché vieja no ve un archivo a medias
+            os.replace(temp_path, cache_path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+        return True
+
+
+def load_cache(source_path: str, signature: bytes) -> Optional[EventColumns]:
+    """Caché vigente de source_path mapeada en memoria, o None si no existe o quedó vieja."""
+    cache_path = cache_path_for(source_path)
+    try:
+        stat = os.stat(source_path)
+        with open(cache_path, 'rb') as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):  # ValueError: archivo vacío
+        return None
+
+    view = memoryview(buffer)
+    if len(view) < _HEADER.size:
+        return None
+    magic, version, flags, count, size, mtime_ns, cached_signature = _HEADER.unpack_from(view, 0)
+    if (magic != MAGIC or version != CACHE_VERSION
+            or bool(flags & FLAG_BIG_ENDIAN) != (sys.byteorder == 'big')
+            or size != stat.st_size or mtime_ns != stat.st_mtime_ns
+            or cached_signature != signature):
+        return None
+
+    sections = dict(zip(SECTIONS, read_sections(view, _HEADER.size, len(SECTIONS))))
+    return EventColumns(
+        StringTable(sections['id_offsets'].cast('q'), sections['id_blob']),
+        sections['days'].cast('i'),
+        StringTable(sections['headline_offsets'].cast('q'), sections['headline_blob']),
+        StringTable(sections['url_offsets'].cast('q'), sections['url_blob']),
+        sections['latitude'].cast('d'),
+        sections['longitude'].cast('d'),
+        sections['tone'].cast('b'),
+        complete=bool(flags & FLAG_COMPLETE),
+    )
@@ -0,0 +1,191 @@
+"""
+Ingesta incremental de exports de GDELT (se publica uno cada 15 minutos).
+
+GDELTIngestor vigila un directorio (o una lista de archivos) y parsea solo
+lo que no leyó antes: archivos nuevos o bytes agregados al final de uno ya
+conocido. Solo se avanza sobre líneas completas, así una línea que se está
+escribiendo se lee entera en la pasada siguiente.
+
+Por archivo el checkpoint JSON guarda el offset leído y la identidad del
+archivo (dispositivo + inodo y un hash del comienzo del archivo). Si el
+archivo se achicó o la identidad cambió (se rotó o se reemplazó, aunque el
+nuevo sea igual de grande o más) se relee desde el principio. Los archivos
+que desaparecen se borran del checkpoint; si desaparecen en medio de una
+pasada se saltean y su entrada se borra en la pasada siguiente.
+
+El trabajo se hace por bloques de chunk_bytes: cada bloque se entrega (a un
+Graph existente con load_from_news_dataset y/o a un event store con extend,
+p. ej. una lista) y recién entonces se guarda el checkpoint, así la memoria
+no depende de cuánto haya pendiente y un corte pierde a lo sumo un bloque.
+Ese bloque se repite al reanudar (Graph.add_node ignora IDs repetidos).
+"""
+
+import glob
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+from models.graph import Graph
+from data.gdelt_parser import DEFAULT_CLASSIFIER, GDELTEvent, GDELTParser, event_to_record
+from data.tone_classifier import ToneClassifier
+
+CHECKPOINT_VERSION = 2
+
+# Bytes del comienzo del archivo que forman parte de su identidad
+HEAD_BYTES = 4096
+
+
+class GDELTIngestor:
+
+    def __init__(self, sources: Union[str, Sequence[str]], checkpoint_path: Optional[str] = None,
+                 classifier: Optional[ToneClassifier] = None, pattern: str = '*.export.CSV',
+                 chunk_bytes: int = 8 * 1024 * 1024):
+        """
+        Args:
+            sources: Directorio a vigilar o lista de archivos
+            checkpoint_path: JSON con lo leído de cada archivo (None = solo en memoria)
+            classifier: Clasificador de tono (por defecto el del parser)
+            pattern: Archivos del directorio a considerar
+            chunk_bytes: Bytes que se parsean y entregan de una vez (acota la memoria)
+        """
+        self.sources = sources
+        self.checkpoint_path = checkpoint_path
+        self.classifier = classifier or DEFAULT_CLASSIFIER
+        self.pattern = pattern
+        self.chunk_bytes = chunk_bytes
+        # Por archivo: {'offset', 'device', 'inode', 'head'}
+        self.checkpoint: Dict[str, Dict] = {}
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            self.checkpoint = _load_checkpoint(checkpoint_path)
+
+    def files(self) -> List[str]:
+        """Archivos a revisar, en orden (los nombres de GDELT empiezan con la fecha)."""
+        if isinstance(self.sources, str):
+            if not os.path.isdir(self.sources):
+                raise ValueError(f"El directorio '{self.sources}' no existe")
+            return sorted(glob.glob(os.path.join(self.sources, self.pattern)))
+        return [path for path in self.sources if os.path.isfile(path)]
+
+    def iter_batches(self) -> Iterator[List[GDELTEvent]]:
+        """
+        Entrega los eventos nuevos por bloques, en orden de archivo y de
+        línea. El checkpoint de un bloque se guarda cuando quien consume pide
+        el siguiente: si deja de iterar, ese bloque se vuelve a entregar.
+        """
+        files = self.files()
+        keys = {os.path.abspath(path) for path in files}
+        stale = [key for key in self.checkpoint if key not in keys]
+        for key in stale:
+            del self.checkpoint[key]  # El archivo ya no existe
+        if stale:
+            self._save()
+
+        for path in files:
+            try:
+                yield from self._file_batches(path)
+            except FileNotFoundError:
+                # Se borró o rotó después de listarlo: su entrada la limpia la pasada siguiente
+                continue
+
+    def _file_batches(self, path: str) -> Iterator[List[GDELTEvent]]:
+        """Bloques nuevos de un archivo, guardando el checkpoint tras cada uno."""
+        key = os.path.abspath(path)
+        stat = os.stat(path)
+        entry = self.checkpoint.get(key)
+        offset = entry['offset'] if entry is not None and _same_file(path, stat, entry) else 0
+
+        end = _last_line_end(path, offset, stat.st_size)
+        if end == offset:
+            return
+        parser = GDELTParser(path, classifier=self.classifier, use_cache=False)
+        for chunk_end, events in parser.iter_chunks(offset, end, self.chunk_bytes):
+            if events:
+                yield events
+            self.checkpoint[key] = {'offset': chunk_end, 'device': stat.st_dev,
+                                    'inode': stat.st_ino, 'head': _head_signature(path, chunk_end)}
+            self._save()
+
+    def poll(self, graph: Optional[Graph] = None, store=None) -> int:
+        """
+        Agrega lo nuevo de cada archivo a graph y/o store, bloque por bloque.
+        Retorna la cantidad de eventos nuevos.
+        """
+        count = 0
+        for batch in self.iter_batches():
+            _deliver(batch, graph, store)
+            count += len(batch)
+        return count
+
+    def follow(self, graph: Optional[Graph] = None, store=None, interval: float = 60.0,
+               max_polls: Optional[int] = None) -> Iterator[List[GDELTEvent]]:
+        """
+        Revisa los archivos cada interval segundos, agrega cada bloque nuevo
+        a graph y/o store y lo entrega. Corre hasta max_polls pasadas (None =
+        sin fin) o hasta que quien lo consume deja de iterar.
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            if polls:
+                time.sleep(interval)
+            polls += 1
+            for batch in self.iter_batches():
+                _deliver(batch, graph, store)
+                yield batch
+
+    def _save(self):
+        if self.checkpoint_path is not None:
+            _save_checkpoint(self.checkpoint_path, self.checkpoint)
+
+
+def _deliver(batch: List[GDELTEvent], graph: Optional[Graph], store):
+    if graph is not None:
+        graph.load_from_news_dataset(event_to_record(e) for e in batch)
+    if store is not None:
+        store.extend(batch)
+
+
+def _same_file(path: str, stat: os.stat_result, entry: Dict) -> bool:
+    """True si path sigue siendo el archivo del checkpoint (y no se achicó)."""
+    return (stat.st_size >= entry['offset']
+            and stat.st_dev == entry['device'] and stat.st_ino == entry['inode']
+            and _head_signature(path, entry['offset']) == entry['head'])
+
+
+def _head_signature(path: str, offset: int) -> str:
+    """Hash de los primeros bytes ya leídos (hasta HEAD_BYTES)."""
+    with open(path, 'rb') as file:
+        return hashlib.sha1(file.read(min(offset, HEAD_BYTES))).hexdigest()
+
+
+def _last_line_end(path: str, start: int, size: int, block: int = 64 * 1024) -> int:
+    """Posición justo después del último '\\n' en [start, size), o start si no hay ninguno."""
+    with open(path, 'rb') as file:
+        position = size
+        while position > start:
+            block_start = max(start, position - block)
+            file.seek(block_start)
+            data = file.read(position - block_start)
+            newline = data.rfind(b'\n')
+            if newline != -1:
+                return block_start + newline + 1
+            position = block_start
+    return start
+
+
+def _load_checkpoint(path: str) -> Dict[str, Dict]:
+    with open(path, 'r', encoding='utf-8') as file:
+        checkpoint = json.load(file)
+    if checkpoint.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"Versión de checkpoint no soportada: {checkpoint.get('version')} "
+                         f"(se esperaba {CHECKPOINT_VERSION})")
+    return checkpoint['files']
+
+
+def _save_checkpoint(path: str, files: Dict[str, Dict]):
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump({'version': CHECKPOINT_VERSION, 'files': files}, file, indent=2)
+    # Reemplazo atómico: un corte a mitad de escritura deja el checkpoint anterior
+    os.replace(temp_path, path)
@@ -1,8 +1,34 @@
 import csv
-from typing import List, Dict, Tuple, Optional
+import io
+import os
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 import datetime
 
+from data.gdelt_cache import CacheWriter, EventColumns, load_cache
+from data.tone_classifier import ToneClassifier
+
+# Palabras para detectar el sentimiento del título (ver ToneClassifier)
+POSITIVE_WORDS = [
+    'Peace', 'Treaty', 'Aid', 'Help', 'Support', 'Win', 'Grow',
+    'Agreement', 'Rescue', 'Save', 'Award', 'Success', 'Clear', 'Safe']
+
+NEGATIVE_WORDS = [
+    'War', 'Kill', 'Attack', 'Crisis', 'Death', 'Conflict', 'Shot',
+    'Dead', 'Murder', 'Crash', 'Disaster', 'Fight', 'Fail', 'Injure',
+    'Overdose', 'Arrest', 'Prison'
+]
+
+# Clasificador por defecto (el autómata se compila una sola vez)
+DEFAULT_CLASSIFIER = ToneClassifier(POSITIVE_WORDS, NEGATIVE_WORDS)
+
+# Campos de cada registro de get_data_for_graph / iter_graph_records
+GRAPH_RECORD_FIELDS = ('id', 'headline', 'date', 'content', 'url', 'tone')
+
+
 @dataclass
 class GDELTEvent:
     """
@@ -14,7 +40,7 @@ class GDELTEvent:
     headline: str                # CAMBIO: Usamos esto como título
     url: str
     content: str                 # CAMBIO: Texto para comparar similitud
-    
+
     # Mantenemos coordenadas solo por si acaso, pero no son el foco
     latitude: float = 0.0
     longitude: float = 0.0
@@ -25,116 +51,324 @@ class GDELTEvent:
 class GDELTParser:
     """
     Parser adaptado para extraer NARRATIVAS y TENDENCIAS de GDELT.
+
+    parse() carga los eventos en self.events (lista). Para archivos grandes
+    usar iter_events() / iter_graph_records(), que leen fila por fila y
+    mantienen la memoria constante.
+
+    El tono de cada título lo calcula un ToneClassifier (por defecto con
+    POSITIVE_WORDS / NEGATIVE_WORDS; se puede pasar uno cargado con
+    ToneClassifier.from_file).
+
+    Con use_cache=True lo parseado por parse() / parse_parallel() se guarda
+    en una caché columnar junto al archivo (data/gdelt_cache.py) y las
+    corridas siguientes la leen con mmap en vez de volver a parsear, mientras
+    el archivo no cambie. iter_events() la usa si existe pero solo la llena
+    con fill_cache=True (llenarla ocupa memoria proporcional al archivo).
     """
-    
-    def __init__(self, filepath: str):
+
+    def __init__(self, filepath: str, classifier: Optional[ToneClassifier] = None,
+                 use_cache: bool = True):
         self.filepath = filepath
+        self.classifier = classifier or DEFAULT_CLASSIFIER
+        self.use_cache = use_cache
         self.events: List[GDELTEvent] = []
-    
+
+    def load_cached(self, max_rows: Optional[int] = None) -> Optional[EventColumns]:
+        """Caché vigente que alcanza para max_rows eventos, o None."""
+        if not self.use_cache:
+            return None
+        columns = load_cache(self.filepath, self.classifier.signature)
+        if columns is None or not columns.covers(max_rows):
+            return None
+        return columns
+
     def parse(self, max_rows: int = 3000) -> int:
         """
         Parsea el archivo GDELT limitando a max_rows para rendimiento.
         Retorna la cantidad de eventos cargados.
         """
+        self.events = []
+        cached = self.load_cached(max_rows)
+        if cached is not None:
+            self.events = cached[:max_rows]
+            print(f"⚡ Cargados {len(self.events)} eventos desde la caché.")
+            return len(self.events)
+
         print(f"📂 Procesando {self.filepath}...")
+        try:
+            self.events = list(self.iter_events(max_rows=max_rows, fill_cache=True))
+        except Exception as e:
+            print(f"❌ Error crítico leyendo archivo: {e}")
+            return 0
+
+        print(f"✅ Parseados {len(self.events)} eventos exitosamente.")
+        return len(self.events)
+
+    def parse_parallel(self, workers: Optional[int] = None, max_rows: Optional[int] = None,
+                       chunk_bytes: int = 8 * 1024 * 1024) -> int:
+        """
+        Como parse() pero repartiendo el archivo entre procesos.
+
+        El archivo se corta en rangos de bytes alineados a fin de línea; cada
+        proceso parsea su rango y los resultados se unen en el orden del
+        archivo, así self.events queda igual que con parse().
+
+        Args:
+            workers: Procesos a usar (None = número de CPUs)
+            max_rows: Máximo de eventos (None = todo el archivo)
+            chunk_bytes: Tamaño aproximado de cada rango
+
+        Retorna la cantidad de eventos cargados.
+        """
         self.events = []
-        count = 0
-        
+        cached = self.load_cached(max_rows)
+        if cached is not None:
+            self.events = cached[:max_rows]
+            print(f"⚡ Cargados {len(self.events)} eventos desde la caché.")
+            return len(self.events)
+
+        print(f"📂 Procesando {self.filepath} en paralelo...")
+        # Antes de leer: la caché guarda el tamaño y mtime de este momento
+        writer = CacheWriter(self.filepath, self.classifier.signature) if self.use_cache else None
+        # Se junta aparte: si un rango falla, self.events queda vacío como en parse()
+        events: List[GDELTEvent] = []
         try:
-            with (open(self.filepath, 'r', encoding='utf-8', errors='ignore') as file):
-                # GDELT usa Tabs (\t)
-                reader = csv.reader(file, delimiter='\t')
-                
-                for row in reader:
-                    if count >= max_rows:
+            complete = True
+            ranges = iter(_byte_ranges(self.filepath, chunk_bytes))
+            # El clasificador viaja una sola vez a cada worker (initializer) y
+            # solo hay unos pocos rangos pendientes a la vez: al llegar a
+            # max_rows no se sigue parseando el resto del archivo
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_parse_worker,
+                                     initargs=(self.classifier,)) as executor:
+                window = (workers or os.cpu_count() or 1) * 2
+                pending = deque(executor.submit(_parse_range_worker, self.filepath, byte_range)
+                                for byte_range in islice(ranges, window))
+                while pending:
+                    rows = pending.popleft().result()
+                    events.extend(GDELTEvent(*fields) for fields in rows)
+                    if max_rows is not None and len(events) >= max_rows:
+                        del events[max_rows:]
+                        complete = False
+                        for future in pending:
+                            future.cancel()
                         break
-                    
-                    # Validación básica de longitud
-                    if len(row) < 58: continue
-                    
-                    try:
-                        # --- EXTRACCIÓN DE DATOS ---
-                        # ID (Col 0)
-                        e_id = row[0]
-                        
-                        # Fecha (Col 1: YYYYMMDD)
-                        raw_date = row[1]
-                        try:
-                            date_obj = datetime.datetime.strptime(raw_date, "%Y%m%d")
-                        except:
-                            continue # Si no hay fecha válida, saltamos
-                            
-                        # Título/Actor (Col 6 o Col 16) - Truco para tener un texto legible
-                        title = row[6] if row[6] else (row[16] if row[16] else "Evento Internacional")
-                        title = title.replace("_", " ").title()
-
-                        # --- NUEVO: DETECCIÓN SIMPLE DE SENTIMIENTO ---
-                        # Si usamos la columna real de GDELT es complejo porque varía.
-                        # Simularemos sentimiento analizando el título (Algoritmo de Fuerza Bruta en Strings)
-                        tone = 0  # Neutral
-                        positive_words = [
-                            'Peace', 'Treaty', 'Aid', 'Help', 'Support', 'Win', 'Grow',
-                            'Agreement', 'Rescue', 'Save', 'Award', 'Success', 'Clear', 'Safe']
-
-                        negative_words = [
-                            'War', 'Kill', 'Attack', 'Crisis', 'Death', 'Conflict', 'Shot',
-                            'Dead', 'Murder', 'Crash', 'Disaster', 'Fight', 'Fail', 'Injure',
-                            'Overdose', 'Arrest', 'Prison'
-                        ]
-
-                        title_lower = title.lower()
-                        if any(w.lower() in title_lower for w in positive_words):
-                            tone = 5  # Positivo
-                        elif any(w.lower() in title_lower for w in negative_words):
-                            tone = -5  # Negativo
-                        # ---------------------------------------------
-
-                        # URL (Col 57)
-                        url = row[57]
-                        
-                        # Creamos el objeto
-                        event = GDELTEvent(
-                            event_id=e_id,
-                            date_obj=date_obj,
-                            headline=title,
-                            url=url,
-                            content=f"{title} - Fuente: {url}",
-                            latitude=float(row[43]) if row[43] else 0,
-                            longitude=float(row[44]) if row[44] else 0,
-
-                            # --- CORRECCIÓN 2: Guardamos el tono calculado ---
-                            tone=tone
-
-
-                        )
-
-                        self.events.append(event)
-                        count += 1
-                        
-                    except Exception as e:
-                        continue # Error en una fila, seguimos
-                        
+                    byte_range = next(ranges, None)
+                    if byte_range is not None:
+                        pending.append(executor.submit(_parse_range_worker, self.filepath, byte_range))
         except Exception as e:
             print(f"❌ Error crítico leyendo archivo: {e}")
             return 0
-            
+
+        self.events = events
+        if writer is not None:
+            for event in self.events:
+                writer.add(event)
+            writer.finish(complete)
+
         print(f"✅ Parseados {len(self.events)} eventos exitosamente.")
         return len(self.events)
 
+    def iter_events(self, max_rows: Optional[int] = None,
+                    filters: Optional[Iterable[Callable[[GDELTEvent], bool]]] = None,
+                    fill_cache: bool = False) -> Iterator[GDELTEvent]:
+        """
+        Recorre el archivo y entrega los eventos de a uno (sin guardarlos).
+        Si hay una caché vigente que alcanza, la recorre a ella en su lugar.
+
+        Args:
+            max_rows: Máximo de eventos a entregar (None = todo el archivo)
+            filters: Funciones evento -> bool; solo se entregan los eventos
+                     que pasan todas (max_rows cuenta solo esos)
+            fill_cache: Si es True (y no hay filtros) lo leído se junta para
+                        escribir la caché al final; la memoria deja de ser
+                        constante, por eso está apagado por defecto
+        """
+        filters = list(filters) if filters else []
+
+        # Con caché vigente se recorre la caché en vez del archivo
+        cached = self.load_cached(None if filters else max_rows)
+        if cached is not None:
+            count = 0
+            for event in cached:
+                if max_rows is not None and count >= max_rows:
+                    break
+                if filters and not all(accept(event) for accept in filters):
+                    continue
+                count += 1
+                yield event
+            return
+
+        # Solo si se pide y sin filtros, lo leído alimenta la caché (se escribe al final)
+        writer = CacheWriter(self.filepath, self.classifier.signature) \
+            if self.use_cache and fill_cache and not filters else None
+        count = 0
+        complete = True
+
+        with open(self.filepath, 'r', encoding='utf-8', errors='ignore') as file:
+            # GDELT usa Tabs (\t)
+            for row in csv.reader(file, delimiter='\t'):
+                if max_rows is not None and count >= max_rows:
+                    complete = False
+                    break
+
+                event = _parse_row(row, self.classifier)
+                if event is None:
+                    continue
+                if filters and not all(accept(event) for accept in filters):
+                    continue
+
+                count += 1
+                if writer is not None:
+                    writer.add(event)
+                yield event
+
+        if writer is not None:
+            writer.finish(complete)
+
+    def iter_chunks(self, start: int = 0, end: Optional[int] = None,
+                    chunk_bytes: int = 8 * 1024 * 1024) -> Iterator[Tuple[int, List[GDELTEvent]]]:
+        """
+        Parsea [start, end) del archivo (por defecto hasta el final) en
+        bloques alineados a línea y entrega (offset de fin del bloque,
+        eventos del bloque). start debe ser el comienzo de una línea; no usa
+        la caché. Lo usa la ingesta incremental (data/gdelt_ingest.py).
+        """
+        for byte_range in _byte_ranges(self.filepath, chunk_bytes, start, end):
+            rows = _parse_range(self.filepath, byte_range, self.classifier)
+            yield byte_range[1], [GDELTEvent(*fields) for fields in rows]
+
+    def iter_graph_records(self, max_rows: Optional[int] = None,
+                           filters: Optional[Iterable[Callable[[GDELTEvent], bool]]] = None,
+                           fields: Optional[Sequence[str]] = None) -> Iterator[Dict]:
+        """
+        Como get_data_for_graph() pero perezoso: se puede pasar directamente a
+        Graph.load_from_news_dataset.
+
+        Args:
+            max_rows, filters: Igual que iter_events
+            fields: Campos a incluir (por defecto GRAPH_RECORD_FIELDS); 'id',
+                    'headline' y 'date' son los que necesita el grafo
+        """
+        if fields is not None:
+            unknown = set(fields) - set(GRAPH_RECORD_FIELDS)
+            if unknown:
+                raise ValueError(f"Campos desconocidos: {sorted(unknown)}")
+
+        for event in self.iter_events(max_rows, filters):
+            record = event_to_record(event)
+            if fields is not None:
+                record = {field: record[field] for field in fields}
+            yield record
+
     def get_data_for_graph(self) -> List[Dict]:
         """
         Convierte los eventos al formato diccionario que necesita models/graph.py
         """
-        graph_data = []
-        for e in self.events:
-            graph_data.append({
-                'id': e.event_id,
-                'headline': e.headline,
-                'date': e.date_obj.strftime("%Y-%m-%d"), # Formato string limpio
-                'content': e.content,
-                'url': e.url,
-
-                # --- CORRECCIÓN 3: Exportamos el tono al diccionario ---
-                'tone': e.tone
-            })
-        return graph_data
\ No newline at end of file
+        return [event_to_record(e) for e in self.events]
+
+
+def _byte_ranges(filepath: str, chunk_bytes: int, start: int = 0,
+                 end: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    Rangos [inicio, fin) de ~chunk_bytes que cubren [start, end) del archivo
+    (por defecto todo) y que empiezan y terminan en un límite de línea.
+    start debe ser el comienzo de una línea.
+    """
+    if end is None:
+        end = os.path.getsize(filepath)
+    ranges = []
+    with open(filepath, 'rb') as file:
+        while start < end:
+            stop = start + chunk_bytes
+            if stop < end:
+                file.seek(stop)
+                file.readline()  # Avanzar hasta el final de la línea cortada
+                stop = file.tell()
+            stop = min(stop, end)
+            ranges.append((start, stop))
+            start = stop
+    return ranges
+
+
+# Clasificador de cada proceso worker de parse_parallel (lo fija el initializer)
+_worker_classifier: Optional[ToneClassifier] = None
+
+
+def _init_parse_worker(classifier: ToneClassifier):
+    global _worker_classifier
+    _worker_classifier = classifier
+
+
+def _parse_range_worker(filepath: str, byte_range: Tuple[int, int]) -> List[tuple]:
+    return _parse_range(filepath, byte_range, _worker_classifier)
+
+
+def _parse_range(filepath: str, byte_range: Tuple[int, int], classifier: ToneClassifier) -> List[tuple]:
+    """
+    Parsea las líneas completas de un rango de bytes (se ejecuta en un worker).
+    Retorna los campos de cada evento como tupla: pasar tuplas entre procesos
+    cuesta la mitad que pasar los dataclasses.
+    """
+    start, end = byte_range
+    with open(filepath, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode('utf-8', errors='ignore')
+
+    events = []
+    for row in csv.reader(io.StringIO(text), delimiter='\t'):
+        event = _parse_row(row, classifier)
+        if event is not None:
+            events.append((event.event_id, event.date_obj, event.headline, event.url, event.content,
+                           event.latitude, event.longitude, event.tone))
+    return events
+
+
+def _parse_row(row: List[str], classifier: ToneClassifier) -> Optional[GDELTEvent]:
+    """Convierte una fila del export de GDELT en un evento, o None si no es válida."""
+    # Validación básica de longitud
+    if len(row) < 58:
+        return None
+
+    try:
+        # --- EXTRACCIÓN DE DATOS ---
+        # ID (Col 0)
+        e_id = row[0]
+
+        # Fecha (Col 1: YYYYMMDD)
+        try:
+            date_obj = datetime.datetime.strptime(row[1], "%Y%m%d")
+        except ValueError:
+            return None  # Si no hay fecha válida, saltamos
+
+        # Título/Actor (Col 6 o Col 16) - Truco para tener un texto legible
+        title = row[6] if row[6] else (row[16] if row[16] else "Evento Internacional")
+        title = title.replace("_", " ").title()
+
+        # URL (Col 57)
+        url = row[57]
+
+        return GDELTEvent(
+            event_id=e_id,
+            date_obj=date_obj,
+            headline=title,
+            url=url,
+            content=f"{title} - Fuente: {url}",
+            latitude=float(row[43]) if row[43] else 0,
+            longitude=float(row[44]) if row[44] else 0,
+            tone=classifier.score(title)
+        )
+    except Exception:
+        return None  # Error en una fila, seguimos
+
+
+def event_to_record(e: GDELTEvent) -> Dict:
+    """Registro de un evento en el formato de Graph.load_from_news_dataset."""
+    return {
+        'id': e.event_id,
+        'headline': e.headline,
+        'date': e.date_obj.strftime("%Y-%m-%d"),  # Formato string limpio
+        'content': e.content,
+        'url': e.url,
+        'tone': e.tone
+    }
@@ -0,0 +1,148 @@
+"""
+Clasificador de tono de títulos con un autómata de Aho–Corasick.
+
+Las palabras de los léxicos (positivas y negativas) se compilan una sola
+vez en un trie con enlaces de falla; cada título se recorre en una sola
+pasada, sin importar cuántas palabras tenga el léxico. La regla es la misma
+que usaba el parser: si el título contiene alguna palabra positiva el tono
+es positivo, si no y contiene alguna negativa es negativo, y si no es 0.
+La coincidencia es por subcadena y sin distinguir mayúsculas.
+
+Formato de archivo para from_file (una palabra por línea):
+
+    # comentario
+    +peace
+    -war
+"""
+
+import hashlib
+from collections import deque
+from typing import Dict, Iterable, List
+
+POSITIVE = 1
+NEGATIVE = 2
+
+
+class ToneClassifier:
+
+    def __init__(self, positive_words: Iterable[str], negative_words: Iterable[str],
+                 positive_score: int = 5, negative_score: int = -5, cache_size: int = 100000):
+        """
+        Args:
+            positive_words: Palabras que marcan un título como positivo
+            negative_words: Palabras que lo marcan como negativo
+            positive_score, negative_score: Tono asignado en cada caso
+            cache_size: Títulos distintos que se recuerdan (en GDELT se repiten mucho)
+        """
+        self.positive_score = positive_score
+        self.negative_score = negative_score
+        self.cache_size = cache_size
+        self._cache: Dict[str, int] = {}
+
+        positive_words = [w.lower() for w in positive_words]
+        negative_words = [w.lower() for w in negative_words]
+        # Huella de léxicos y puntajes (la usa la caché de GDELT para invalidarse)
+        lexicon = repr((sorted(positive_words), sorted(negative_words), positive_score, negative_score))
+        self.signature = hashlib.sha1(lexicon.encode('utf-8')).digest()
+
+        # Trie: transiciones, enlace de falla y etiquetas (POSITIVE | NEGATIVE) por estado
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._labels: List[int] = [0]
+        for word in positive_words:
+            self._add_word(word, POSITIVE)
+        for word in negative_words:
+            self._add_word(word, NEGATIVE)
+        self._build_failure_links()
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> 'ToneClassifier':
+        """Carga los léxicos de un archivo de líneas '+palabra' / '-palabra'."""
+        positive, negative = [], []
+        with open(path, 'r', encoding='utf-8') as file:
+            for line_number, line in enumerate(file, 1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                if line[0] == '+':
+                    positive.append(line[1:].strip())
+                elif line[0] == '-':
+                    negative.append(line[1:].strip())
+                else:
+                    raise ValueError(f"Línea {line_number} de '{path}' inválida: debe empezar con '+' o '-'")
+        return cls(positive, negative, **kwargs)
+
+    def score(self, title: str) -> int:
+        """Tono del título: positive_score, negative_score o 0."""
+        cached = self._cache.get(title)
+        if cached is not None:
+            return cached
+
+        labels = self._match(title.lower())
+        if labels & POSITIVE:
+            tone = self.positive_score
+        elif labels & NEGATIVE:
+            tone = self.negative_score
+        else:
+            tone = 0
+
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[title] = tone
+        return tone
+
+    def score_many(self, titles: Iterable[str]) -> List[int]:
+        """Tono de cada título, en el mismo orden."""
+        score = self.score
+        return [score(title) for title in titles]
+
+    def __getstate__(self):
+        # La caché no viaja a los procesos de parse_parallel
+        state = self.__dict__.copy()
+        state['_cache'] = {}
+        return state
+
+    def _add_word(self, word: str, label: int):
+        if not word:
+            return
+        state = 0
+        for char in word:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._labels.append(0)
+            state = next_state
+        self._labels[state] |= label
+
+    def _build_failure_links(self):
+        """BFS por niveles: la falla de cada estado es el sufijo propio más largo que está en el trie."""
+        goto, fail, labels = self._goto, self._fail, self._labels
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in goto[state].items():
+                queue.append(child)
+                f = fail[state]
+                while f and char not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(char, 0)
+                # Una coincidencia en el sufijo también es coincidencia aquí
+                labels[child] |= labels[fail[child]]
+
+    def _match(self, text: str) -> int:
+        """Unión de las etiquetas de todas las palabras que aparecen en text."""
+        goto, fail, labels = self._goto, self._fail, self._labels
+        state = 0
+        found = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if labels[state]:
+                found |= labels[state]
+                if found & POSITIVE:
+                    break  # Lo positivo manda: no hace falta seguir
+        return found
@@ -4,5 +4,7 @@ Contiene las estructuras de datos para representar grafos y nodos.
 """
 
 from .graph import Graph, Node
+from .node_table import NodeTable
+from .compact_graph import CompactGraph
 
-__all__ = ['Graph', 'Node']
+__all__ = ['Graph', 'Node', 'NodeTable', 'CompactGraph']
@@ -0,0 +1,249 @@
+"""
+Representación compacta (CSR - Compressed Sparse Row) de un grafo.
+
+Los IDs de nodo (strings) se internan a enteros 0..n-1 y la lista de
+adyacencia se guarda en tres buffers planos:
+
+    indptr[i] .. indptr[i+1]  -> rango de aristas salientes del nodo i
+    indices[k]                -> destino (entero) de la arista k
+    weights[k]                -> peso de la arista k
+
+La estructura es inmutable: se construye una vez a partir de un Graph y
+los algoritmos trabajan directamente sobre los enteros. Los métodos con
+IDs string (get_neighbors, node_exists, ...) son solo una capa de
+traducción para mantener la misma API que Graph.
+"""
+
+from array import array
+from typing import Dict, List, Tuple, Optional, Iterator, Iterable
+
+from .graph import Graph, Node
+from .node_table import NodeTable
+
+
+class CompactGraph:
+
+    # Inmutable: la versión nunca cambia (misma interfaz que Graph.version)
+    version = 0
+
+    def __init__(self, node_ids: List[str], indptr, indices, weights,
+                 node_table: Optional[NodeTable] = None,
+                 index: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            node_ids: Lista de IDs; la posición es el índice interno del nodo
+            indptr: Buffer de n+1 offsets ('q')
+            indices: Buffer de m destinos ('i')
+            weights: Buffer de m pesos ('d')
+            node_table: Atributos de los nodos en columnas, alineados con node_ids
+                        (opcional; sin ella get_node devuelve nodos vacíos)
+            index: Mapa ID -> índice ya construido (por defecto se arma un dict)
+        """
+        self.node_ids = node_ids
+        self.index: Dict[str, int] = index if index is not None else {
+            node_id: i for i, node_id in enumerate(node_ids)
+        }
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.node_table = node_table
+        self._reverse: Optional['CompactGraph'] = None
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> 'CompactGraph':
+        """Congela un Graph en formato CSR (el Graph original no se modifica)."""
+        node_ids = graph.get_all_nodes()
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+
+        indptr = array('q', [0])
+        indices = array('i')
+        weights = array('d')
+        for node_id in node_ids:
+            for neighbor, weight in graph.get_neighbors(node_id):
+                indices.append(index[neighbor])
+                weights.append(weight)
+            indptr.append(len(indices))
+
+        node_table = NodeTable.from_nodes(graph.nodes[node_id] for node_id in node_ids)
+        return cls(node_ids, indptr, indices, weights, node_table=node_table)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[str, str, float]]) -> 'CompactGraph':
+        """
+        Construye el CSR directamente desde un flujo de aristas (origen, destino, peso).
+        Mientras se lee solo se guardan tres arrays planos; al final se ordenan
+        por origen con un counting sort estable. Igual que Graph.add_edge, si
+        una arista se repite se conserva la primera.
+        """
+        index: Dict[str, int] = {}
+        node_ids: List[str] = []
+        sources = array('i')
+        targets = array('i')
+        edge_weights = array('d')
+
+        for source, destination, weight in edges:
+            s = index.get(source)
+            if s is None:
+                s = index[source] = len(node_ids)
+                node_ids.append(source)
+            t = index.get(destination)
+            if t is None:
+                t = index[destination] = len(node_ids)
+                node_ids.append(destination)
+            sources.append(s)
+            targets.append(t)
+            edge_weights.append(weight)
+
+        n = len(node_ids)
+        degree = [0] * (n + 1)
+        for s in sources:
+            degree[s + 1] += 1
+        for i in range(n):
+            degree[i + 1] += degree[i]
+
+        # Posición de escritura de cada fila (counting sort estable)
+        cursor = degree[:-1]
+        indices = array('i', bytes(4 * len(sources)))
+        weights = array('d', bytes(8 * len(sources)))
+        for k in range(len(sources)):
+            s = sources[k]
+            indices[cursor[s]] = targets[k]
+            weights[cursor[s]] = edge_weights[k]
+            cursor[s] += 1
+        del sources, targets, edge_weights
+
+        # Eliminar duplicados dentro de cada fila conservando la primera aparición
+        indptr = array('q', [0])
+        write = 0
+        for i in range(n):
+            seen = set()
+            for k in range(degree[i], degree[i + 1]):
+                j = indices[k]
+                if j in seen:
+                    continue
+                seen.add(j)
+                indices[write] = j
+                weights[write] = weights[k]
+                write += 1
+            indptr.append(write)
+        del indices[write:]
+        del weights[write:]
+
+        return cls(node_ids, indptr, indices, weights)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices)
+
+    # --- API con índices enteros (la usan los algoritmos) ---
+
+    def index_of(self, node_id: str) -> int:
+        return self.index[node_id]
+
+    def neighbors_of(self, i: int) -> Iterator[Tuple[int, float]]:
+        begin, end = self.indptr[i], self.indptr[i + 1]
+        return zip(self.indices[begin:end], self.weights[begin:end])
+
+    def reverse(self) -> 'CompactGraph':
+        """Grafo transpuesto (aristas invertidas) con los mismos índices. Se cachea."""
+        if self._reverse is None:
+            n, m = self.num_nodes, self.num_edges
+            indptr = array('q', bytes(8 * (n + 1)))
+            for j in self.indices:
+                indptr[j + 1] += 1
+            for i in range(n):
+                indptr[i + 1] += indptr[i]
+
+            cursor = indptr[:-1]
+            indices = array('i', bytes(4 * m))
+            weights = array('d', bytes(8 * m))
+            for i in range(n):
+                for k in range(self.indptr[i], self.indptr[i + 1]):
+                    j = self.indices[k]
+                    indices[cursor[j]] = i
+                    weights[cursor[j]] = self.weights[k]
+                    cursor[j] += 1
+
+            self._reverse = CompactGraph(self.node_ids, indptr, indices, weights,
+                                         node_table=self.node_table, index=self.index)
+            self._reverse._reverse = self
+        return self._reverse
+
+    def to_numpy(self):
+        """Devuelve (indptr, indices, weights) como arrays de NumPy sin copiar."""
+        import numpy as np
+        return (np.frombuffer(self.indptr, dtype=np.int64),
+                np.frombuffer(self.indices, dtype=np.int32),
+                np.frombuffer(self.weights, dtype=np.float64))
+
+    # --- Capa de traducción: misma API que Graph ---
+
+    def node_exists(self, node_id: str) -> bool:
+        return node_id in self.index
+
+    def get_all_nodes(self) -> List[str]:
+        return list(self.node_ids)
+
+    def get_neighbors(self, node_id: str) -> List[Tuple[str, float]]:
+        i = self.index.get(node_id)
+        if i is None:
+            return []
+        node_ids = self.node_ids
+        return [(node_ids[j], w) for j, w in self.neighbors_of(i)]
+
+    def get_predecessors(self, node_id: str) -> List[Tuple[str, float]]:
+        return self.reverse().get_neighbors(node_id)
+
+    def get_node(self, node_id: str) -> Optional[Node]:
+        i = self.index.get(node_id)
+        if i is None:
+            return None
+        if self.node_table is not None:
+            return self.node_table[i]
+        return Node(node_id)
+
+    def get_edge_weight(self, source: str, destination: str) -> Optional[float]:
+        i = self.index.get(source)
+        j = self.index.get(destination)
+        if i is None or j is None:
+            return None
+        for neighbor, weight in self.neighbors_of(i):
+            if neighbor == j:
+                return weight
+        return None
+
+    def get_stats(self) -> Dict:
+        return {
+            'num_nodes': self.num_nodes,
+            'num_edges': self.num_edges,
+            'avg_degree': self.num_edges / self.num_nodes if self.num_nodes else 0
+        }
+
+    def save_snapshot(self, filepath: str, include_nodes: bool = True):
+        """Guarda el grafo en formato binario (ver models/snapshot.py)."""
+        from .snapshot import save_snapshot
+        save_snapshot(self, filepath, include_nodes)
+
+    @classmethod
+    def load_snapshot(cls, filepath: str, mmap: bool = True) -> 'CompactGraph':
+        """Abre un snapshot binario, por defecto mapeado en memoria."""
+        from .snapshot import load_snapshot
+        return load_snapshot(filepath, mmap)
+
+    def to_graph(self) -> Graph:
+        """Reconstruye un Graph mutable con los mismos nodos y aristas."""
+        graph = Graph()
+        for node_id in self.node_ids:
+            node = self.get_node(node_id)
+            graph.add_node(node_id, node.name, node.content, node.date, node.x, node.y, node.tone)
+        node_ids = self.node_ids
+        graph.add_edges(
+            (node_id, node_ids[j], weight)
+            for i, node_id in enumerate(node_ids)
+            for j, weight in self.neighbors_of(i)
+        )
+        return graph
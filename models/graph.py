@@ -1,11 +1,16 @@
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional, Iterable
 import json
 import csv
 import datetime
 import time
+from functools import lru_cache
+from itertools import islice
 
 
 # ### NUEVO: Necesitamos esto para manejar las fechas en el Eje X
+# Las noticias de un mismo día repiten la fecha: se cachea para no llamar
+# a strptime por cada nodo.
+@lru_cache(maxsize=4096)
 def date_to_timestamp(date_str: str) -> float:
     """Convierte string de fecha a timestamp (float) para el eje X"""
     try:
@@ -17,7 +22,48 @@ def date_to_timestamp(date_str: str) -> float:
         return 0.0
 
 
+def iter_edge_csv_chunks(filepath: str, chunk_size: int = 50000) -> Iterable[List[Tuple[str, str, float]]]:
+    """
+    Lee un CSV origen,destino,distancia por bloques de chunk_size filas.
+    La cabecera es opcional. Cada bloque es una lista de (origen, destino, peso),
+    así la memoria usada no depende del tamaño del archivo.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size debe ser al menos 1 (se recibió {chunk_size})")
+    return _read_edge_csv_chunks(filepath, chunk_size)
+
+
+def _read_edge_csv_chunks(filepath: str, chunk_size: int) -> Iterable[List[Tuple[str, str, float]]]:
+    with open(filepath, 'r', newline='', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        first = next(reader, None)
+        if first is None:
+            return
+        try:
+            chunk = [(first[0], first[1], float(first[2]))] if first else []
+        except ValueError:
+            chunk = []  # Era la cabecera
+
+        # Se termina cuando el lector se agota, no cuando un bloque queda
+        # vacío (un tramo de líneas en blanco no es el final del archivo)
+        exhausted = False
+        while not exhausted:
+            wanted = chunk_size - len(chunk)
+            taken = 0
+            for row in islice(reader, wanted):
+                taken += 1
+                if row:
+                    chunk.append((row[0], row[1], float(row[2])))
+            exhausted = taken < wanted
+            if len(chunk) >= chunk_size or (exhausted and chunk):
+                yield chunk
+                chunk = []
+
+
 class Node:
+    # Sin __dict__ por instancia: con 100k+ noticias el ahorro de memoria es grande
+    __slots__ = ('id', 'name', 'content', 'date', 'tone', 'x', 'y')
+
     # ### MODIFICADO: Añadimos 'date' y 'content'
     def __init__(self, node_id: str, name: str = None, content: str = "", date: str = "", x: float = 0, y: float = 0, tone: int = 0):
         self.id = node_id
@@ -56,6 +102,18 @@ class Graph:
         self.nodes: Dict[str, Node] = {}
         self.edges: Dict[str, List[Tuple[str, float]]] = {}
         self.metadata: Dict[str, Dict] = {}
+        # Índice de adyacencia: origen -> {destino: posición en self.edges[origen]}
+        # Se mantiene sincronizado con las listas para buscar aristas en O(1)
+        self._edge_index: Dict[str, Dict[str, int]] = {}
+        # Aristas entrantes (destino -> [(origen, peso)]); se arma bajo demanda
+        self._reverse_edges: Optional[Dict[str, List[Tuple[str, float]]]] = None
+        # Sube con cada cambio de la estructura (nodos o aristas); los cachés
+        # de resultados la comparan para saber si siguen siendo válidos
+        self.version = 0
+        # Funciones llamadas tras cada cambio de arista:
+        # callback(origen, destino, peso_anterior, peso_nuevo), con None en
+        # peso_anterior si la arista es nueva y en peso_nuevo si se eliminó
+        self._listeners: List[Callable[[str, str, Optional[float], Optional[float]], None]] = []
 
         # ### MODIFICADO: Ahora acepta content y date
 
@@ -64,6 +122,8 @@ class Graph:
         if node_id not in self.nodes:
             self.nodes[node_id] = Node(node_id, name, content, date, x, y, tone)
             self.edges[node_id] = []
+            self._edge_index[node_id] = {}
+            self.version += 1
         return self.nodes[node_id]
 
     def add_edge(self, source: str, destination: str, weight: float):
@@ -73,21 +133,158 @@ class Graph:
         if destination not in self.nodes:
             self.add_node(destination)
 
-        # Evitar duplicados
-        for dest, w in self.edges[source]:
-            if dest == destination:
-                return  # Ya existe la arista
+        # Evitar duplicados (búsqueda O(1) en el índice)
+        positions = self._edge_index[source]
+        if destination in positions:
+            return  # Ya existe la arista
 
+        positions[destination] = len(self.edges[source])
         self.edges[source].append((destination, weight))
+        self._reverse_edges = None
+        self.version += 1
+        self._notify(source, destination, None, weight)
         # Si el grafo es no dirigido (similitud A-B es igual a B-A), descomenta esto:
         # self.edges[destination].append((source, weight))
 
+    def add_edges(self, edges: Iterable[Tuple[str, str, float]]) -> int:
+        """
+        Inserta aristas en bloque a partir de tuplas (origen, destino, peso).
+        Mismas reglas que add_edge (la primera arista gana) pero sin el costo
+        de una llamada por arista. Retorna cuántas aristas se insertaron.
+        """
+        nodes, adjacency, edge_index = self.nodes, self.edges, self._edge_index
+        inserted = 0
+        changed = False  # Inserciones todavía no reflejadas en version
+        for source, destination, weight in edges:
+            if source not in nodes:
+                self.add_node(source)
+            if destination not in nodes:
+                self.add_node(destination)
+
+            positions = edge_index[source]
+            if destination in positions:
+                continue
+            neighbors = adjacency[source]
+            positions[destination] = len(neighbors)
+            neighbors.append((destination, weight))
+            inserted += 1
+            if self._listeners:
+                # Igual que add_edge: quien escucha puede consultar el grafo
+                # y tiene que ver el estado ya actualizado
+                self._reverse_edges = None
+                self.version += 1
+                self._notify(source, destination, None, weight)
+            else:
+                changed = True
+        if changed:
+            self._reverse_edges = None
+            self.version += 1
+        return inserted
+
+    def update_edge_weight(self, source: str, destination: str, weight: float):
+        """Cambia el peso de una arista existente en O(1)."""
+        position = self._edge_index.get(source, {}).get(destination)
+        if position is None:
+            raise ValueError(f"La arista '{source}' -> '{destination}' no existe en el grafo")
+        old_weight = self.edges[source][position][1]
+        if old_weight == weight:
+            return
+        self.edges[source][position] = (destination, weight)
+        self._reverse_edges = None
+        self.version += 1
+        self._notify(source, destination, old_weight, weight)
+
+    def remove_edge(self, source: str, destination: str) -> bool:
+        """
+        Elimina una arista en O(1): la última arista de la lista ocupa su lugar
+        y se actualiza su posición en el índice. Retorna False si no existía.
+        """
+        positions = self._edge_index.get(source, {})
+        position = positions.pop(destination, None)
+        if position is None:
+            return False
+
+        neighbors = self.edges[source]
+        old_weight = neighbors[position][1]
+        last = neighbors.pop()
+        if position < len(neighbors):
+            neighbors[position] = last
+            positions[last[0]] = position
+
+        self._reverse_edges = None
+        self.version += 1
+        self._notify(source, destination, old_weight, None)
+        return True
+
+    def subscribe(self, callback: Callable[[str, str, Optional[float], Optional[float]], None]):
+        """Registra callback(origen, destino, peso_anterior, peso_nuevo) para cada cambio de arista."""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str, str, Optional[float], Optional[float]], None]):
+        self._listeners.remove(callback)
+
+    def _notify(self, source: str, destination: str, old_weight: Optional[float], new_weight: Optional[float]):
+        for callback in list(self._listeners):
+            callback(source, destination, old_weight, new_weight)
+
+    @classmethod
+    def from_edge_csv(cls, filepath: str, chunk_size: int = 50000, compact: bool = False):
+        """
+        Carga un CSV de aristas (formato de data/dataset_generator.py) por bloques.
+
+        Args:
+            filepath: Ruta del CSV (origen,destino,distancia)
+            chunk_size: Filas leídas por bloque
+            compact: Si es True se construye directamente un CompactGraph (CSR)
+                     sin pasar por las listas de adyacencia de Graph
+
+        Returns:
+            Graph, o CompactGraph si compact=True
+        """
+        chunks = iter_edge_csv_chunks(filepath, chunk_size)
+        if compact:
+            from .compact_graph import CompactGraph
+            return CompactGraph.from_edges(edge for chunk in chunks for edge in chunk)
+
+        graph = cls()
+        for chunk in chunks:
+            graph.add_edges(chunk)
+        return graph
+
+    def load_node_positions(self, filepath: str) -> int:
+        """
+        Asigna coordenadas x/y desde un CSV nodo,x,y (ver
+        CityGraphGenerator.save_positions_to_csv). Los nodos que no existan
+        se crean. Retorna cuántos nodos se actualizaron.
+        """
+        updated = 0
+        with open(filepath, 'r', newline='', encoding='utf-8') as file:
+            for row in csv.DictReader(file):
+                node = self.add_node(row['nodo'])
+                node.x = float(row['x'])
+                node.y = float(row['y'])
+                updated += 1
+        return updated
+
     def get_neighbors(self, node_id: str) -> List[Tuple[str, float]]:
         return self.edges.get(node_id, [])
 
+    def get_predecessors(self, node_id: str) -> List[Tuple[str, float]]:
+        """Aristas entrantes (origen, peso). El índice inverso se reconstruye tras cada cambio."""
+        if self._reverse_edges is None:
+            reverse: Dict[str, List[Tuple[str, float]]] = {node: [] for node in self.nodes}
+            for source, neighbors in self.edges.items():
+                for destination, weight in neighbors:
+                    reverse[destination].append((source, weight))
+            self._reverse_edges = reverse
+        return self._reverse_edges.get(node_id, [])
+
     def get_node(self, node_id: str) -> Optional[Node]:
         return self.nodes.get(node_id)
 
+    def node_exists(self, node_id: str) -> bool:
+        return node_id in self.nodes
+
     def get_all_nodes(self) -> List[str]:
         return list(self.nodes.keys())
 
@@ -101,10 +298,12 @@ class Graph:
 
     # ### NUEVO: Función genérica para cargar tu dataset de noticias
     # Esta función reemplaza la lógica compleja de GDELT/CSV anterior
-    def load_from_news_dataset(self, data_list: List[Dict]):
+    def load_from_news_dataset(self, data_list: Iterable[Dict]):
         """
         Carga nodos desde una lista de diccionarios (procesada previamente).
         data_list debe ser: [{'id': '1', 'headline': '...', 'date': '...', 'content': '...'}, ...]
+        También acepta un generador (p. ej. GDELTParser.iter_graph_records()):
+        se consume de a un registro, sin armar la lista completa en memoria.
         """
         import random
         for item in data_list:
@@ -123,8 +322,26 @@ class Graph:
 
     # Mantenemos métodos auxiliares por si la GUI los usa
     def get_edge_weight(self, source: str, destination: str) -> Optional[float]:
-        if source in self.edges:
-            for neighbor, weight in self.edges[source]:
-                if neighbor == destination:
-                    return weight
-        return None
\ No newline at end of file
+        position = self._edge_index.get(source, {}).get(destination)
+        if position is None:
+            return None
+        return self.edges[source][position][1]
+
+    def to_compact(self):
+        """Congela el grafo en formato CSR (ver models/compact_graph.py)."""
+        from .compact_graph import CompactGraph
+        return CompactGraph.from_graph(self)
+
+    def save_snapshot(self, filepath: str, include_nodes: bool = True):
+        """Guarda el grafo en formato binario versionado (ver models/snapshot.py)."""
+        from .snapshot import save_snapshot
+        save_snapshot(self, filepath, include_nodes)
+
+    @staticmethod
+    def load_snapshot(filepath: str, mmap: bool = True):
+        """
+        Abre un snapshot guardado con save_snapshot.
+        Retorna un CompactGraph de solo lectura (usar to_graph() para editarlo).
+        """
+        from .snapshot import load_snapshot
+        return load_snapshot(filepath, mmap)
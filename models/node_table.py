@@ -0,0 +1,88 @@
+"""
+Almacenamiento columnar de nodos.
+
+En vez de un objeto Node por nodo, NodeTable guarda arrays paralelos
+(x, y, tone) y columnas de strings. Las fechas se internan (en un export
+diario de GDELT casi todas son iguales) y su conversión a timestamp se hace
+una sola vez por fecha distinta. Los Node se crean bajo demanda como vistas
+ligeras de una fila.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .graph import Node, date_to_timestamp
+
+
+class NodeTable:
+
+    def __init__(self, ids: Sequence[str], x=None, y=None, tone=None,
+                 dates: Optional[Sequence[str]] = None,
+                 names: Optional[Sequence[str]] = None,
+                 contents: Optional[Sequence[str]] = None):
+        """
+        Args:
+            ids: ID de cada fila
+            x, y, tone: Columnas numéricas (array o memoryview); por defecto ceros
+            dates: Fecha (string) de cada fila; por defecto vacía
+            names: Nombre de cada fila; por defecto el propio ID
+            contents: Texto de cada fila; por defecto vacío
+        """
+        n = len(ids)
+        self.ids = ids
+        self.x = x if x is not None else array('d', bytes(8 * n))
+        self.y = y if y is not None else array('d', bytes(8 * n))
+        self.tone = tone if tone is not None else array('i', bytes(4 * n))
+        self.dates = dates
+        self.names = names
+        self.contents = contents
+
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[Node]) -> 'NodeTable':
+        """Pasa objetos Node a columnas, internando fechas repetidas."""
+        ids: List[str] = []
+        names: List[str] = []
+        contents: List[str] = []
+        dates: List[str] = []
+        xs, ys, tones = array('d'), array('d'), array('i')
+        interned: Dict[str, str] = {}
+
+        for node in nodes:
+            ids.append(node.id)
+            names.append(node.name)
+            contents.append(node.content)
+            dates.append(interned.setdefault(node.date, node.date))
+            xs.append(node.x)
+            ys.append(node.y)
+            tones.append(node.tone)
+
+        return cls(ids, xs, ys, tones, dates, names, contents)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i: int) -> Node:
+        """Vista de la fila i como Node (sin reparsear la fecha)."""
+        node_id = self.ids[i]
+        node = Node.__new__(Node)
+        node.id = node_id
+        node.name = self.names[i] if self.names is not None else node_id
+        node.content = self.contents[i] if self.contents is not None else ""
+        node.date = self.dates[i] if self.dates is not None else ""
+        node.tone = self.tone[i]
+        node.x = self.x[i]
+        node.y = self.y[i]
+        return node
+
+    def timestamps(self) -> array:
+        """Timestamp de cada fila, parseando cada fecha distinta una sola vez."""
+        if self.dates is None:
+            return array('d', bytes(8 * len(self)))
+        parsed: Dict[str, float] = {}
+        result = array('d')
+        for date in self.dates:
+            value = parsed.get(date)
+            if value is None:
+                value = parsed[date] = date_to_timestamp(date) if date else 0.0
+            result.append(value)
+        return result
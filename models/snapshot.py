@@ -0,0 +1,232 @@
+"""
+Formato binario de snapshot para grafos (pensado para abrirse con mmap).
+
+Estructura del archivo (little/big endian según la máquina que lo escribió,
+indicado en las flags):
+
+    Cabecera   '<8sIIQQ'  magic, versión, flags, num_nodos, num_aristas
+    Tabla      NUM_SECCIONES x '<QQ'  (offset, bytes) de cada sección
+    Secciones  alineadas a 8 bytes, en el orden de SECTIONS
+
+Las secciones de nodos (x, y, tone, date) son opcionales: si no se guardan
+su tamaño es 0. Al cargar con mmap=True los buffers del CSR son memoryviews
+sobre el archivo mapeado, así varios procesos comparten la misma copia
+física del grafo y la carga no depende del tamaño.
+"""
+
+import mmap as _mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import List, Optional, Sequence
+
+from .compact_graph import CompactGraph
+from .node_table import NodeTable
+
+MAGIC = b'CGSNAP\x00\x00'
+SNAPSHOT_VERSION = 1
+
+FLAG_NODE_COLUMNS = 1
+FLAG_BIG_ENDIAN = 2
+
+SECTIONS = [
+    'id_offsets', 'id_blob', 'id_sorted',
+    'indptr', 'indices', 'weights',
+    'x', 'y', 'tone', 'date_offsets', 'date_blob',
+]
+
+_HEADER = struct.Struct('<8sIIQQ')
+_SECTION = struct.Struct('<QQ')
+
+
+class StringTable(Sequence):
+    """
+    Tabla de strings: offsets ('q', n+1) sobre un blob UTF-8.
+    Los strings se decodifican solo cuando se piden.
+    """
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    @classmethod
+    def build(cls, strings: Sequence[str]) -> 'StringTable':
+        offsets = array('q', [0])
+        parts = []
+        total = 0
+        for value in strings:
+            encoded = value.encode('utf-8')
+            parts.append(encoded)
+            total += len(encoded)
+            offsets.append(total)
+        return cls(offsets, b''.join(parts))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]]).decode('utf-8')
+
+
+class StringIndex:
+    """
+    Índice string -> posición sin construir un dict: búsqueda binaria sobre
+    una permutación ordenada guardada en el propio snapshot.
+    Implementa lo que CompactGraph usa de un dict (get, in, []).
+    """
+
+    def __init__(self, table: StringTable, sorted_order):
+        self.table = table
+        self.sorted_order = sorted_order
+
+    def get(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        table, order = self.table, self.sorted_order
+        pos = bisect_left(range(len(order)), key, key=lambda k: table[order[k]])
+        if pos < len(order) and table[order[pos]] == key:
+            return order[pos]
+        return default
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __getitem__(self, key: str) -> int:
+        i = self.get(key)
+        if i is None:
+            raise KeyError(key)
+        return i
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+
+def save_snapshot(graph, filepath: str, include_nodes: bool = True):
+    """
+    Guarda un Graph o CompactGraph en formato snapshot.
+
+    Args:
+        graph: Graph o CompactGraph
+        filepath: Archivo de salida
+        include_nodes: Guardar también las columnas x/y/tone/date de los nodos
+    """
+    if not isinstance(graph, CompactGraph):
+        graph = graph.to_compact()
+
+    n, m = graph.num_nodes, graph.num_edges
+    ids = StringTable.build(graph.node_ids)
+    id_sorted = array('i', sorted(range(n), key=graph.node_ids.__getitem__))
+
+    sections = {
+        'id_offsets': ids.offsets,
+        'id_blob': ids.blob,
+        'id_sorted': id_sorted,
+        'indptr': graph.indptr,
+        'indices': graph.indices,
+        'weights': graph.weights,
+    }
+
+    flags = FLAG_BIG_ENDIAN if sys.byteorder == 'big' else 0
+    if include_nodes:
+        flags |= FLAG_NODE_COLUMNS
+        table = graph.node_table
+        if table is None:
+            table = NodeTable(graph.node_ids)
+        dates = table.dates if table.dates is not None else [''] * n
+        date_table = StringTable.build(dates)
+        sections.update({
+            'x': table.x, 'y': table.y, 'tone': table.tone,
+            'date_offsets': date_table.offsets, 'date_blob': date_table.blob,
+        })
+
+    with open(filepath, 'wb') as file:
+        write_sections(file, _HEADER.pack(MAGIC, SNAPSHOT_VERSION, flags, n, m),
+                       [sections.get(name, b'') for name in SECTIONS])
+
+
+def load_snapshot(filepath: str, mmap: bool = True) -> CompactGraph:
+    """
+    Abre un snapshot como CompactGraph.
+
+    Args:
+        filepath: Archivo generado por save_snapshot
+        mmap: Si es True el archivo se mapea en memoria (solo lectura y
+              compartido entre procesos); si es False se lee completo
+
+    Raises:
+        ValueError: Si el archivo no es un snapshot válido o es de otra versión
+    """
+    with open(filepath, 'rb') as file:
+        if mmap:
+            buffer = _mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ)
+        else:
+            buffer = file.read()
+
+    view = memoryview(buffer)
+    if len(view) < _HEADER.size:
+        raise ValueError(f"'{filepath}' no es un snapshot de grafo válido")
+    magic, version, flags, n, m = _HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ValueError(f"'{filepath}' no es un snapshot de grafo válido")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Versión de snapshot no soportada: {version} (se esperaba {SNAPSHOT_VERSION})")
+    if bool(flags & FLAG_BIG_ENDIAN) != (sys.byteorder == 'big'):
+        raise ValueError("El snapshot fue escrito con otro orden de bytes")
+
+    sections = dict(zip(SECTIONS, read_sections(view, _HEADER.size, len(SECTIONS))))
+
+    node_ids = StringTable(sections['id_offsets'].cast('q'), sections['id_blob'])
+    index = StringIndex(node_ids, sections['id_sorted'].cast('i'))
+
+    node_table = None
+    if flags & FLAG_NODE_COLUMNS:
+        node_table = NodeTable(
+            node_ids,
+            x=sections['x'].cast('d'),
+            y=sections['y'].cast('d'),
+            tone=sections['tone'].cast('i'),
+            dates=StringTable(sections['date_offsets'].cast('q'), sections['date_blob']),
+        )
+
+    return CompactGraph(
+        node_ids,
+        sections['indptr'].cast('q'),
+        sections['indices'].cast('i'),
+        sections['weights'].cast('d'),
+        node_table=node_table,
+        index=index,
+    )
+
+
+def write_sections(file, header: bytes, buffers: Sequence) -> None:
+    """
+    Escribe header, la tabla (offset, bytes) de cada buffer y los buffers
+    alineados a 8 bytes (así se pueden castear sin copiar al leerlos).
+    """
+    layout = []
+    position = len(header) + _SECTION.size * len(buffers)
+    for buffer in buffers:
+        data = memoryview(buffer).cast('B')
+        position = (position + 7) & ~7
+        layout.append((position, data))
+        position += data.nbytes
+
+    start = file.tell()
+    file.write(header)
+    for offset, data in layout:
+        file.write(_SECTION.pack(offset, data.nbytes))
+    for offset, data in layout:
+        file.write(b'\x00' * (start + offset - file.tell()))
+        file.write(data)
+
+
+def read_sections(view: memoryview, table_offset: int, count: int) -> List[memoryview]:
+    """Vistas (sin copiar) de las count secciones cuya tabla empieza en table_offset."""
+    sections = []
+    for i in range(count):
+        offset, nbytes = _SECTION.unpack_from(view, table_offset + i * _SECTION.size)
+        sections.append(view[offset:offset + nbytes])
+    return sections
@@ -23,22 +23,23 @@ def main():
         print(f"❌ ERROR: No encuentro el archivo {gdelt_file}")
         return
 
-    # 2. Carga de Datos (PARSING)
+    # 2. Carga de Datos (PARSING) y 3. Construcción del Grafo
+    # Los registros pasan del archivo al grafo de a uno (sin listas intermedias).
+    # El límite de 3000 es por la visualización, no por memoria.
     print("\n[PASO 1] Cargando Dataset...")
     parser = GDELTParser(gdelt_file)
-    # OJO: Aquí limitamos a 3000 como dijimos
-    num_noticias = parser.parse(max_rows=3000)
 
-    if num_noticias == 0:
-        print("❌ No se cargaron noticias. Revisa el archivo.")
-        return
-
-    data_list = parser.get_data_for_graph()
-
-    # 3. Construcción del Grafo
     print("\n[PASO 2] Construyendo Grafo Temporal...")
     grafo = Graph()
-    grafo.load_from_news_dataset(data_list)
+    try:
+        grafo.load_from_news_dataset(parser.iter_graph_records(max_rows=3000))
+    except OSError as e:
+        print(f"❌ Error crítico leyendo archivo: {e}")
+        return
+
+    if not grafo.nodes:
+        print("❌ No se cargaron noticias. Revisa el archivo.")
+        return
 
     # Simulamos conexiones (Para la DEMO, conectamos noticias cercanas en la lista)
     # En una versión real usarías TF-IDF, pero esto es para que funcione YA.
@@ -1,11 +1,22 @@
 import sys
 import os
+
+import pytest
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from models.graph import Graph
-from algorithms.dijkstra import dijkstra
-from algorithms.bellman_ford import bellman_ford
+from models.graph import Graph, iter_edge_csv_chunks
+from models.compact_graph import CompactGraph
+from models.node_table import NodeTable
+from algorithms.dijkstra import dijkstra, dijkstra_all_paths, bidirectional_dijkstra
+from algorithms.bellman_ford import bellman_ford, bellman_ford_spfa
+from algorithms.astar import astar
+from algorithms.contraction_hierarchies import ContractionHierarchy
+from algorithms.alt import LandmarkIndex
 from algorithms.floyd_warshall import floyd_warshall, get_path_floyd_warshall
+from algorithms.johnson import johnson
+from algorithms.path_cache import PathCache
+from algorithms.k_shortest_paths import k_shortest_paths
 
 
 def test_dijkstra_simple():
@@ -146,6 +157,807 @@ def test_large_graph_performance():
     print("  ✓ Test pasado\n")
 
 
+def test_compact_graph():
+    """Prueba que los algoritmos den el mismo resultado sobre la forma CSR."""
+    print("Test 7: CompactGraph (CSR) - Mismos resultados que Graph")
+
+    graph = Graph()
+    graph.add_edge('A', 'B', 5)
+    graph.add_edge('A', 'C', 3)
+    graph.add_edge('B', 'D', 2)
+    graph.add_edge('C', 'D', 6)
+    graph.add_edge('C', 'B', 1)
+    graph.add_node('Z')
+
+    compact = graph.to_compact()
+    assert isinstance(compact, CompactGraph)
+    assert compact.get_stats() == graph.get_stats()
+    assert compact.get_neighbors('A') == graph.get_neighbors('A')
+    assert compact.get_edge_weight('C', 'B') == 1
+
+    assert dijkstra(compact, 'A', 'D') == dijkstra(graph, 'A', 'D')
+    assert dijkstra(compact, 'A', 'Z') == (None, None)
+    assert dijkstra_all_paths(compact, 'A') == dijkstra_all_paths(graph, 'A')
+    assert bellman_ford(compact, 'A', 'D') == bellman_ford(graph, 'A', 'D')
+    assert floyd_warshall(compact) == floyd_warshall(graph)
+
+    print("  ✓ Dijkstra, Bellman-Ford y Floyd-Warshall coinciden en CSR")
+    print("  ✓ Test pasado\n")
+
+
+def test_bulk_add_edges():
+    """Prueba la inserción en bloque y el índice de aristas."""
+    print("Test 8: Graph.add_edges - Inserción en bloque")
+
+    graph = Graph()
+    inserted = graph.add_edges([('A', 'B', 5), ('A', 'C', 3), ('A', 'B', 9), ('C', 'B', 1)])
+
+    assert inserted == 3, f"Aristas insertadas esperadas: 3, obtenidas: {inserted}"
+    assert graph.get_edge_weight('A', 'B') == 5, "La primera arista duplicada debe prevalecer"
+    assert graph.get_edge_weight('B', 'A') is None
+    assert graph.get_edge_weight('Z', 'A') is None
+
+    graph.add_edge('A', 'C', 7)
+    assert graph.get_edge_weight('A', 'C') == 3
+    assert graph.get_stats()['num_edges'] == 3
+
+    print("  ✓ Duplicados ignorados y búsqueda de pesos correcta")
+    print("  ✓ Test pasado\n")
+
+
+def test_from_edge_csv():
+    """Prueba la carga por bloques de un CSV de aristas."""
+    print("Test 9: Graph.from_edge_csv - Carga por bloques")
+
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filepath = os.path.join(tmp, 'edges.csv')
+        with open(filepath, 'w', encoding='utf-8') as file:
+            file.write("origen,destino,distancia\n")
+            file.write("A,B,5\nA,C,3\nB,D,2\nC,D,6\nC,B,1\nA,B,8\n")
+
+        graph = Graph.from_edge_csv(filepath, chunk_size=2)
+        compact = Graph.from_edge_csv(filepath, chunk_size=2, compact=True)
+
+    assert graph.get_stats()['num_edges'] == 5, "La arista duplicada A->B no debe cargarse"
+    assert graph.get_edge_weight('A', 'B') == 5
+    assert isinstance(compact, CompactGraph)
+    assert compact.get_stats() == graph.get_stats()
+    assert dijkstra(compact, 'A', 'D') == dijkstra(graph, 'A', 'D') == (6, ['A', 'C', 'B', 'D'])
+
+    # Líneas en blanco que ocupan un bloque entero no cortan la lectura
+    with tempfile.TemporaryDirectory() as tmp:
+        filepath = os.path.join(tmp, 'blank.csv')
+        with open(filepath, 'w', encoding='utf-8') as file:
+            file.write("a,b,1\n\n\n\nc,d,2\n\ne,f,3\n")
+        chunks = list(iter_edge_csv_chunks(filepath, chunk_size=2))
+        blank_graph = Graph.from_edge_csv(filepath, chunk_size=2)
+        blank_compact = Graph.from_edge_csv(filepath, chunk_size=2, compact=True)
+
+    assert chunks == [[('a', 'b', 1.0), ('c', 'd', 2.0)], [('e', 'f', 3.0)]], chunks
+    assert blank_graph.get_stats()['num_edges'] == blank_compact.get_stats()['num_edges'] == 3
+
+    # chunk_size < 1 no entra en un bucle infinito: se rechaza al llamar
+    for bad_size in (0, -1):
+        try:
+            Graph.from_edge_csv(filepath, chunk_size=bad_size)
+            assert False, "chunk_size inválido debería fallar"
+        except ValueError:
+            pass
+
+    print("  ✓ Graph y CompactGraph cargados con los mismos datos")
+    print("  ✓ Líneas en blanco entre bloques no truncan el archivo")
+    print("  ✓ chunk_size < 1 rechazado")
+    print("  ✓ Test pasado\n")
+
+
+def test_snapshot_roundtrip():
+    """Prueba guardar y abrir (con y sin mmap) un snapshot binario."""
+    print("Test 10: Snapshot binario - Guardar y cargar")
+
+    import tempfile
+
+    graph = Graph()
+    graph.add_node('A', x=1.5, y=2.5, tone=5, date='2025-10-04')
+    graph.add_edge('A', 'B', 5)
+    graph.add_edge('A', 'C', 3)
+    graph.add_edge('B', 'D', 2)
+    graph.add_edge('C', 'D', 6)
+    graph.add_edge('C', 'B', 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filepath = os.path.join(tmp, 'graph.snap')
+        graph.save_snapshot(filepath)
+
+        for use_mmap in (True, False):
+            loaded = Graph.load_snapshot(filepath, mmap=use_mmap)
+            assert loaded.get_all_nodes() == graph.get_all_nodes()
+            assert loaded.get_stats() == graph.get_stats()
+            assert dijkstra(loaded, 'A', 'D') == (6, ['A', 'C', 'B', 'D'])
+            assert not loaded.node_exists('Z')
+
+            node = loaded.get_node('A')
+            assert (node.x, node.y, node.tone, node.date) == (1.5, 2.5, 5, '2025-10-04')
+            del loaded, node  # Liberar el mmap antes de borrar el directorio
+
+        with open(filepath, 'r+b') as file:
+            file.write(b'XXXX')
+        try:
+            Graph.load_snapshot(filepath)
+            assert False, "Debería rechazar un archivo corrupto"
+        except ValueError:
+            pass
+
+    print("  ✓ Snapshot cargado con mmap y en memoria")
+    print("  ✓ Test pasado\n")
+
+
+def test_node_table():
+    """Prueba el almacenamiento columnar de nodos."""
+    print("Test 11: NodeTable - Nodos en columnas")
+
+    graph = Graph()
+    graph.add_node('1', name='Peace Treaty', content='texto', date='2025-10-04', y=10, tone=5)
+    graph.add_node('2', date='2025-10-04', tone=-5)
+    graph.add_node('3')
+
+    assert not hasattr(graph.get_node('1'), '__dict__'), "Node debería usar __slots__"
+
+    table = NodeTable.from_nodes(graph.nodes.values())
+    assert len(table) == 3
+    assert table.dates[0] is table.dates[1], "Las fechas repetidas deben internarse"
+
+    node = table[0]
+    original = graph.get_node('1')
+    assert node == original
+    assert (node.name, node.content, node.date, node.x, node.y, node.tone) == \
+        (original.name, original.content, original.date, original.x, original.y, original.tone)
+
+    timestamps = table.timestamps()
+    assert timestamps[0] == timestamps[1] == original.x
+    assert timestamps[2] == 0.0
+
+    print("  ✓ Vistas Node equivalentes a los originales")
+    print("  ✓ Test pasado\n")
+
+
+def test_bidirectional_dijkstra():
+    """Prueba Dijkstra bidireccional contra Dijkstra normal."""
+    print("Test 12: Dijkstra bidireccional")
+
+    graph = Graph()
+    graph.add_edge('A', 'B', 5)
+    graph.add_edge('A', 'C', 3)
+    graph.add_edge('B', 'D', 2)
+    graph.add_edge('C', 'D', 6)
+    graph.add_edge('C', 'B', 1)
+    graph.add_edge('E', 'A', 1)
+
+    for g in (graph, graph.to_compact()):
+        stats = {}
+        assert bidirectional_dijkstra(g, 'A', 'D', stats) == (6, ['A', 'C', 'B', 'D'])
+        assert stats['settled'] > 0
+        assert bidirectional_dijkstra(g, 'D', 'A') == (None, None)
+        assert bidirectional_dijkstra(g, 'A', 'A') == (0, ['A'])
+
+    # Cadena larga: la búsqueda bidireccional cierra menos nodos
+    chain = Graph()
+    for i in range(100):
+        for j in range(i + 1, min(i + 5, 100)):
+            chain.add_edge(f'N{i}', f'N{j}', j - i)
+    forward_stats, bidirectional_stats = {}, {}
+    assert dijkstra(chain, 'N10', 'N20', forward_stats)[0] == \
+        bidirectional_dijkstra(chain, 'N10', 'N20', bidirectional_stats)[0] == 10
+    assert bidirectional_stats['settled'] <= forward_stats['settled']
+
+    print(f"  ✓ Nodos cerrados: {forward_stats['settled']} (Dijkstra) vs {bidirectional_stats['settled']} (bidireccional)")
+    print("  ✓ Test pasado\n")
+
+
+def test_astar():
+    """Prueba A* con la heurística euclidiana sobre el dataset de 50 nodos."""
+    print("Test 13: A* - Heurística euclidiana")
+
+    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+    graph = Graph.from_edge_csv(os.path.join(data_dir, 'city_test_50.csv'))
+    assert graph.load_node_positions(os.path.join(data_dir, 'city_test_50_nodes.csv')) == 50
+
+    nodes = graph.get_all_nodes()
+    total_astar, total_dijkstra = 0, 0
+    for start in nodes[:10]:
+        for end in nodes[-10:]:
+            astar_stats, dijkstra_stats = {}, {}
+            distance, path = astar(graph, start, end, stats=astar_stats)
+            expected, _ = dijkstra(graph, start, end, dijkstra_stats)
+            assert (distance is None) == (expected is None)
+            if distance is not None:
+                assert abs(distance - expected) < 1e-9, f"{start}->{end}: {distance} != {expected}"
+                assert path[0] == start and path[-1] == end
+            total_astar += astar_stats['settled']
+            total_dijkstra += dijkstra_stats['settled']
+
+    assert total_astar < total_dijkstra, "A* debería cerrar menos nodos que Dijkstra"
+    assert astar(graph.to_compact(), nodes[0], nodes[-1]) == astar(graph, nodes[0], nodes[-1])
+
+    # Sin coordenadas (CSR sin tabla de nodos) la heurística vale 0
+    compact = Graph.from_edge_csv(os.path.join(data_dir, 'city_test_50.csv'), compact=True)
+    assert compact.node_table is None
+    assert astar(compact, nodes[0], nodes[-1])[0] == dijkstra(graph, nodes[0], nodes[-1])[0]
+
+    # En un grafo de noticias x es la fecha: la distancia en el plano no es una cota
+    news = Graph()
+    news.load_from_news_dataset([
+        {'id': 'a', 'headline': 'a', 'date': '2024-01-01'},
+        {'id': 'b', 'headline': 'b', 'date': '2020-01-01'},
+        {'id': 'd', 'headline': 'd', 'date': '2024-01-01'},
+    ])
+    news.add_edge('a', 'd', 10.0)
+    news.add_edge('a', 'b', 1.0)
+    news.add_edge('b', 'd', 1.0)
+    assert astar(news, 'a', 'd') == (2.0, ['a', 'b', 'd'])
+
+    print(f"  ✓ Nodos cerrados: {total_astar} (A*) vs {total_dijkstra} (Dijkstra)")
+    print("  ✓ Test pasado\n")
+
+
+def test_contraction_hierarchies():
+    """Prueba Contraction Hierarchies contra Dijkstra y su persistencia."""
+    print("Test 14: Contraction Hierarchies")
+
+    import tempfile
+
+    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+    graph = Graph.from_edge_csv(os.path.join(data_dir, 'city_test_50.csv'))
+    hierarchy = ContractionHierarchy.build(graph)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filepath = os.path.join(tmp, 'city.ch')
+        hierarchy.save(filepath)
+        loaded = ContractionHierarchy.load(filepath)
+
+    nodes = graph.get_all_nodes()
+    for start in nodes[::5]:
+        for end in nodes[::7]:
+            expected, _ = dijkstra(graph, start, end)
+            distance, path = loaded.query(start, end)
+            assert (distance is None) == (expected is None), f"{start}->{end}"
+            if distance is None:
+                continue
+            assert abs(distance - expected) < 1e-9, f"{start}->{end}: {distance} != {expected}"
+            # El camino desempaquetado usa solo aristas originales
+            assert path[0] == start and path[-1] == end
+            total = sum(graph.get_edge_weight(a, b) for a, b in zip(path, path[1:]))
+            assert abs(total - distance) < 1e-9
+
+    print(f"  ✓ {hierarchy.num_shortcuts} atajos, consultas iguales a Dijkstra")
+    print("  ✓ Test pasado\n")
+
+
+def test_alt_landmarks():
+    """Prueba ALT (landmarks) contra Dijkstra y su persistencia."""
+    print("Test 15: ALT - Índice de landmarks")
+
+    import tempfile
+
+    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+    graph = Graph.from_edge_csv(os.path.join(data_dir, 'city_test_50.csv'))
+    graph.add_edge('AISLADO_1', 'AISLADO_2', 1)
+    index = LandmarkIndex.build(graph, k=4, seed=1)
+    assert len(index.landmarks) == 4
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filepath = os.path.join(tmp, 'city.alt')
+        index.save(filepath)
+        loaded = LandmarkIndex.load(filepath, graph)
+
+    nodes = graph.get_all_nodes()
+    total_alt, total_dijkstra = 0, 0
+    for start in nodes[::4]:
+        for end in nodes[::6]:
+            alt_stats, dijkstra_stats = {}, {}
+            distance, path = loaded.query(start, end, alt_stats)
+            expected, _ = dijkstra(graph, start, end, dijkstra_stats)
+            assert (distance is None) == (expected is None), f"{start}->{end}"
+            if distance is not None:
+                assert abs(distance - expected) < 1e-9, f"{start}->{end}: {distance} != {expected}"
+                assert path[0] == start and path[-1] == end
+            total_alt += alt_stats['settled']
+            total_dijkstra += dijkstra_stats['settled']
+
+    assert total_alt < total_dijkstra
+
+    print(f"  ✓ Nodos cerrados: {total_alt} (ALT) vs {total_dijkstra} (Dijkstra)")
+    print("  ✓ Test pasado\n")
+
+
+def test_floyd_warshall_matrix():
+    """Prueba Floyd-Warshall vectorizado (NumPy) contra la versión con diccionarios."""
+    print("Test 16: Floyd-Warshall con matrices NumPy")
+
+    pytest.importorskip('numpy')
+    from algorithms.floyd_warshall_matrix import floyd_warshall_matrix
+
+    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+    graph = Graph.from_edge_csv(os.path.join(data_dir, 'city_test_50.csv'))
+
+    distances, next_nodes = floyd_warshall(graph)
+    matrix_distances, matrix_next_nodes = floyd_warshall_matrix(graph).as_dicts()
+
+    for start, end in distances:
+        assert distances[(start, end)] == matrix_distances[(start, end)]
+        assert get_path_floyd_warshall(next_nodes, start, end) == \
+            get_path_floyd_warshall(matrix_next_nodes, start, end)
+
+    print(f"  ✓ {len(distances)} pares iguales a floyd_warshall()")
+    print("  ✓ Test pasado\n")
+
+
+def test_blocked_floyd_warshall():
+    """Prueba Floyd-Warshall por bloques en disco, incluida la reanudación."""
+    print("Test 17: Floyd-Warshall por bloques (memmap)")
+
+    np = pytest.importorskip('numpy')
+    import algorithms.blocked_floyd_warshall as blocked
+    from algorithms.floyd_warshall_matrix import floyd_warshall_matrix
+
+    import json
+    import tempfile
+
+    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+    graph = Graph.from_edge_csv(os.path.join(data_dir, 'city_test_50.csv'))
+    expected = floyd_warshall_matrix(graph)
+
+    # Simular una interrupción a mitad del cálculo
+    original_relax = blocked._relax_tile
+    calls = [0]
+
+    def interrupted_relax(*args):
+        calls[0] += 1
+        if calls[0] == 100:
+            raise KeyboardInterrupt
+        return original_relax(*args)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        blocked._relax_tile = interrupted_relax
+        try:
+            blocked.blocked_floyd_warshall(graph, tmp, block_size=7)
+            assert False, "Debería haberse interrumpido"
+        except KeyboardInterrupt:
+            pass
+        finally:
+            blocked._relax_tile = original_relax
+
+        with open(os.path.join(tmp, 'meta.json'), 'r', encoding='utf-8') as file:
+            completed = json.load(file)['completed_rounds']
+        assert 0 < completed < 8, f"Rondas completas inesperadas: {completed}"
+
+        result = blocked.blocked_floyd_warshall(graph, tmp, block_size=7)
+        assert np.allclose(result.dist, expected.dist)
+        nodes = graph.get_all_nodes()
+        for start in nodes:
+            for end in nodes:
+                assert result.path(start, end) == expected.path(start, end)
+        del result
+
+    # Corte entre la escritura de next_hop y la de dist de un bloque
+    original_store = blocked._store_tile
+    stores = [0]
+
+    def interrupted_store(dist, next_hop, rows, cols, tile, tile_next):
+        stores[0] += 1
+        if stores[0] == 40:
+            next_hop[rows, cols] = tile_next
+            raise KeyboardInterrupt
+        return original_store(dist, next_hop, rows, cols, tile, tile_next)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        blocked._store_tile = interrupted_store
+        try:
+            blocked.blocked_floyd_warshall(graph, tmp, block_size=7)
+            assert False, "Debería haberse interrumpido"
+        except KeyboardInterrupt:
+            pass
+        finally:
+            blocked._store_tile = original_store
+
+        result = blocked.blocked_floyd_warshall(graph, tmp, block_size=7)
+        assert np.allclose(result.dist, expected.dist)
+        for start in nodes:
+            for end in nodes:
+                path = result.path(start, end)
+                if start == end:
+                    continue
+                if path is None:
+                    assert result.distance(start, end) == float('inf')
+                    continue
+                cost = sum(graph.get_edge_weight(a, b) for a, b in zip(path, path[1:]))
+                assert abs(cost - result.distance(start, end)) < 1e-9, (start, end)
+        del result
+
+    print(f"  ✓ Reanudado desde la ronda {completed}, resultado igual al de memoria")
+    print("  ✓ Corte entre next_hop y dist: caminos y distancias coinciden al reanudar")
+    print("  ✓ Test pasado\n")
+
+
+def test_johnson():
+    """Prueba Johnson (secuencial y con procesos) contra Floyd-Warshall."""
+    print("Test 18: Johnson para todos los pares")
+
+    import math
+    import tempfile
+
+    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+    graph = Graph.from_edge_csv(os.path.join(data_dir, 'city_test_50.csv'))
+    # Una arista negativa (sin crear ciclo negativo) obliga a reponderar
+    graph.add_edge('N0_0', 'N1_1', -0.5)
+    distances, _ = floyd_warshall(graph)
+
+    def check(rows):
+        count = 0
+        for source, row in rows:
+            for target in graph.get_all_nodes():
+                expected = distances[(source, target)]
+                if expected == float('infinity'):
+                    assert target not in row
+                else:
+                    assert math.isclose(row[target], expected, abs_tol=1e-9)
+            count += 1
+        return count
+
+    assert check(johnson(graph, workers=1)) == len(graph.get_all_nodes())
+    assert check(johnson(graph, workers=2, chunk_size=8)) == len(graph.get_all_nodes())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot_path = os.path.join(tmp, 'graph.snap')
+        graph.save_snapshot(snapshot_path)
+        assert check(johnson(graph, sources=['N0_0', 'N2_3'], workers=2, chunk_size=1,
+                             snapshot_path=snapshot_path)) == 2
+
+    cycle = Graph()
+    cycle.add_edge('A', 'B', 1)
+    cycle.add_edge('B', 'A', -2)
+    try:
+        list(johnson(cycle, workers=1))
+        assert False, "Debería detectar el ciclo negativo"
+    except ValueError:
+        pass
+
+    print("  ✓ Filas iguales a floyd_warshall() (1 y 2 procesos, snapshot)")
+    print("  ✓ Ciclo negativo detectado")
+    print("  ✓ Test pasado\n")
+
+
+def test_distance_matrix():
+    """Prueba la matriz origen x destino contra dijkstra por par."""
+    print("Test 19: Matriz de distancias muchos a muchos")
+
+    np = pytest.importorskip('numpy')
+    from algorithms.distance_matrix import distance_matrix
+
+    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+    graph = Graph.from_edge_csv(os.path.join(data_dir, 'city_test_50.csv'))
+    nodes = graph.get_all_nodes()
+    sources, targets = nodes[:20], nodes[10:40:3]
+
+    expected = np.full((len(sources), len(targets)), np.inf)
+    for i, start in enumerate(sources):
+        for j, end in enumerate(targets):
+            distance, _ = dijkstra(graph, start, end)
+            if distance is not None:
+                expected[i, j] = distance
+
+    assert np.allclose(distance_matrix(graph, sources, targets, workers=1), expected)
+    assert np.allclose(distance_matrix(graph, sources, targets), expected)
+    assert np.allclose(distance_matrix(graph, sources, targets, workers=2, chunk_size=4), expected)
+
+    print(f"  ✓ Matriz {expected.shape[0]} x {expected.shape[1]} igual a dijkstra por par (1 y 2 procesos)")
+    print("  ✓ Test pasado\n")
+
+
+def test_bellman_ford_spfa():
+    """Prueba Bellman-Ford con cola: mismos resultados y ciclo negativo explícito."""
+    print("Test 20: Bellman-Ford con cola (SPFA)")
+
+    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+    graph = Graph.from_edge_csv(os.path.join(data_dir, 'city_test_50.csv'))
+    graph.add_edge('N0_0', 'N1_1', -0.5)
+    compact = graph.to_compact()
+    nodes = graph.get_all_nodes()
+
+    for end in nodes:
+        expected = bellman_ford(graph, 'N0_0', end)
+        for result in (bellman_ford_spfa(graph, 'N0_0', end), bellman_ford_spfa(compact, 'N0_0', end)):
+            assert result[2] is False
+            assert (result[0] is None) == (expected[0] is None)
+            if expected[0] is not None:
+                assert abs(result[0] - expected[0]) < 1e-9
+                assert result[1][0] == 'N0_0' and result[1][-1] == end
+
+    cycle_graph = Graph()
+    cycle_graph.add_edge('S', 'A', 1)
+    cycle_graph.add_edge('A', 'B', 2)
+    cycle_graph.add_edge('B', 'C', -4)
+    cycle_graph.add_edge('C', 'A', 1)
+    cycle_graph.add_edge('C', 'T', 1)
+
+    for g in (cycle_graph, cycle_graph.to_compact()):
+        distance, cycle, has_negative_cycle = bellman_ford_spfa(g, 'S', 'T')
+        assert has_negative_cycle and distance is None
+        assert cycle[0] == cycle[-1] and set(cycle) == {'A', 'B', 'C'}
+        total = sum(cycle_graph.get_edge_weight(a, b) for a, b in zip(cycle, cycle[1:]))
+        assert total < 0
+
+    print(f"  ✓ {len(nodes)} destinos iguales a bellman_ford (Graph y CompactGraph)")
+    print(f"  ✓ Ciclo negativo: {' -> '.join(cycle)}")
+    print("  ✓ Test pasado\n")
+
+
+def test_parallel_bellman_ford():
+    """Prueba Bellman-Ford en paralelo (memoria compartida) contra bellman_ford."""
+    print("Test 21: Bellman-Ford en paralelo")
+
+    from algorithms.parallel_bellman_ford import parallel_bellman_ford
+
+    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+    graph = Graph.from_edge_csv(os.path.join(data_dir, 'city_test_50.csv'))
+    graph.add_edge('N0_0', 'N1_1', -0.5)
+    compact = graph.to_compact()
+
+    for end in ('N1_1', 'N4_4', 'N2_3'):
+        expected = bellman_ford(graph, 'N0_0', end)
+        for workers in (1, 2):
+            distance, path, has_negative_cycle = parallel_bellman_ford(compact, 'N0_0', end, workers=workers)
+            assert not has_negative_cycle
+            assert abs(distance - expected[0]) < 1e-9
+            assert path[0] == 'N0_0' and path[-1] == end
+
+    cycle_graph = Graph()
+    cycle_graph.add_edge('S', 'A', 1)
+    cycle_graph.add_edge('A', 'B', 2)
+    cycle_graph.add_edge('B', 'A', -4)
+    cycle_graph.add_edge('B', 'T', 1)
+    assert parallel_bellman_ford(cycle_graph, 'S', 'T', workers=2) == (None, None, True)
+    assert parallel_bellman_ford(cycle_graph, 'S', 'T', workers=1) == bellman_ford(cycle_graph, 'S', 'T')
+
+    print("  ✓ Distancias iguales a bellman_ford (1 y 2 procesos)")
+    print("  ✓ Ciclo negativo detectado")
+    print("  ✓ Test pasado\n")
+
+
+def test_sssp_strategies():
+    """Prueba las estrategias de cola de prioridad de dijkstra_all_paths."""
+    print("Test 22: Estrategias de cola de prioridad")
+
+    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+    graph = Graph.from_edge_csv(os.path.join(data_dir, 'city_test_50.csv'))
+    expected, _ = dijkstra_all_paths(graph, 'N0_0')
+
+    for strategy in ('radix', 'delta', 'indexed'):
+        for g in (graph, graph.to_compact()):
+            distances, previous = dijkstra_all_paths(g, 'N0_0', strategy=strategy)
+            for node, distance in expected.items():
+                assert abs(distances[node] - distance) < 1e-9 or distances[node] == distance
+                if previous[node] is not None:
+                    step = graph.get_edge_weight(previous[node], node)
+                    assert abs(distances[previous[node]] + step - distances[node]) < 1e-9
+
+    try:
+        dijkstra_all_paths(graph, 'N0_0', strategy='fibonacci')
+        assert False, "Debería rechazar una estrategia desconocida"
+    except ValueError:
+        pass
+
+    print("  ✓ radix, delta e indexed iguales a heapq (Graph y CompactGraph)")
+    print("  ✓ Test pasado\n")
+
+
+def test_path_cache():
+    """Prueba el caché de rutas: aciertos, árboles, LRU, TTL y versión del grafo."""
+    print("Test 23: Caché de rutas por versión del grafo")
+
+    import time
+
+    graph = Graph()
+    graph.add_edge('A', 'B', 5)
+    graph.add_edge('A', 'C', 3)
+    graph.add_edge('C', 'B', 1)
+    graph.add_edge('B', 'D', 2)
+
+    cache = PathCache(graph, maxsize=3)
+    assert cache.dijkstra('A', 'D') == dijkstra(graph, 'A', 'D')
+    assert cache.dijkstra('A', 'D') == (6, ['A', 'C', 'B', 'D'])
+    assert cache.hits == 1 and cache.misses == 1
+    assert cache.bellman_ford('A', 'D') == bellman_ford(graph, 'A', 'D')
+
+    # Con el árbol de A guardado, cualquier destino se responde sin recalcular
+    cache.all_paths('A')
+    hits = cache.hits
+    assert cache.dijkstra('A', 'B') == (4, ['A', 'C', 'B'])
+    assert cache.hits == hits + 1
+    assert cache.path('D', 'A') == (None, None)
+    assert len(cache) <= 3
+
+    # Un cambio en el grafo invalida todo
+    version = graph.version
+    graph.add_edge('A', 'D', 1)
+    assert graph.version > version
+    assert cache.dijkstra('A', 'D') == (1, ['A', 'D'])
+    graph.add_edge('A', 'D', 7)  # Arista repetida: no cambia nada
+    assert graph.version == version + 1
+
+    # Quien escucha un add_edges ve el grafo ya actualizado (índice SCC y caché)
+    from algorithms.scc import SCCIndex
+
+    batch = Graph()
+    batch.add_edge('A', 'B', 1.0)
+    batch.add_node('C')
+    SCCIndex.for_graph(batch)
+    batch_cache = PathCache(batch)
+    assert batch_cache.dijkstra('A', 'C') == (None, None)
+    seen = []
+    batch.subscribe(lambda *change: seen.append((dijkstra(batch, 'A', 'C'), batch_cache.dijkstra('A', 'C'))))
+    batch.add_edges([('B', 'C', 1.0)])
+    assert seen == [((2.0, ['A', 'B', 'C']), (2.0, ['A', 'B', 'C']))]
+
+    expiring = PathCache(graph, ttl=0.01)
+    expiring.dijkstra('A', 'B')
+    time.sleep(0.02)
+    expiring.dijkstra('A', 'B')
+    assert expiring.hits == 0 and expiring.misses == 2
+
+    print("  ✓ Aciertos, árboles por origen y límite LRU")
+    print("  ✓ Invalidación por versión y por TTL")
+    print("  ✓ Suscriptores de add_edges ven el grafo actualizado")
+    print("  ✓ Test pasado\n")
+
+
+def test_dynamic_sssp():
+    """Prueba el árbol de caminos dinámico contra recalcular desde cero."""
+    print("Test 24: Caminos más cortos dinámicos")
+
+    import random
+    from algorithms.dynamic_sssp import DynamicSSSP
+
+    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+    graph = Graph.from_edge_csv(os.path.join(data_dir, 'city_test_50.csv'))
+    dynamic = DynamicSSSP(graph, 'N0_0')
+    nodes = graph.get_all_nodes()
+    rng = random.Random(7)
+    touched = []
+
+    for step in range(150):
+        source = rng.choice(nodes)
+        neighbors = graph.get_neighbors(source)
+        action = rng.random()
+        if action < 0.4 and neighbors:
+            destination, weight = rng.choice(neighbors)
+            graph.update_edge_weight(source, destination, round(weight * rng.uniform(0.3, 3), 2))
+        elif action < 0.7 and neighbors:
+            assert graph.remove_edge(source, rng.choice(neighbors)[0])
+        else:
+            graph.add_edge(source, rng.choice(nodes), round(rng.uniform(10, 200), 2))
+        touched.append(dynamic.last_update_touched)
+
+        expected, _ = dijkstra_all_paths(graph, 'N0_0')
+        for node, distance in expected.items():
+            assert abs(dynamic.distances[node] - distance) < 1e-9 or dynamic.distances[node] == distance
+            path = dynamic.path(node)
+            if path is not None:
+                assert path[0] == 'N0_0' and path[-1] == node
+
+    assert graph.remove_edge('N0_0', 'NO_EXISTE') is False
+    dynamic.close()
+
+    print("  ✓ 150 cambios iguales a dijkstra_all_paths desde cero")
+    print(f"  ✓ Nodos revisados por cambio: {sum(touched) / len(touched):.1f} de {len(nodes)}")
+    print("  ✓ Test pasado\n")
+
+
+def test_k_shortest_paths():
+    """Prueba Yen contra la enumeración de todos los caminos simples."""
+    print("Test 25: k caminos más cortos (Yen)")
+
+    graph = Graph()
+    for source, destination, weight in [('C', 'D', 3), ('C', 'E', 2), ('D', 'F', 4), ('E', 'D', 1),
+                                        ('E', 'F', 2), ('E', 'G', 3), ('F', 'G', 2), ('F', 'H', 1),
+                                        ('G', 'H', 2)]:
+        graph.add_edge(source, destination, weight)
+
+    def all_simple_paths(node, path, cost, result):
+        if node == 'H':
+            result.append((cost, list(path)))
+            return
+        for neighbor, weight in graph.get_neighbors(node):
+            if neighbor not in path:
+                path.append(neighbor)
+                all_simple_paths(neighbor, path, cost + weight, result)
+                path.pop()
+        return result
+
+    expected = sorted(all_simple_paths('C', ['C'], 0, []))
+    for g in (graph, graph.to_compact()):
+        paths = k_shortest_paths(g, 'C', 'H', 3)
+        assert paths[0] == (5, ['C', 'E', 'F', 'H'])
+        assert [distance for distance, _ in paths] == [distance for distance, _ in expected[:3]]
+        assert len(k_shortest_paths(g, 'C', 'H', 100)) == len(expected)
+    assert k_shortest_paths(graph, 'H', 'C', 3) == []
+
+    print(f"  ✓ {len(expected)} caminos simples en el orden correcto (Graph y CompactGraph)")
+    print("  ✓ Test pasado\n")
+
+
+def test_scc_index():
+    """Prueba el índice de componentes fuertemente conexas y su uso en los algoritmos."""
+    print("Test 26: Índice de componentes fuertemente conexas")
+
+    from algorithms.scc import SCCIndex
+
+    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+    graph = Graph.from_edge_csv(os.path.join(data_dir, 'city_clustered_1500.csv'))
+    nodes = graph.get_all_nodes()
+
+    # Sin índice: resultados de referencia
+    reference = {}
+    for start in nodes[:40:4]:
+        distances, _ = dijkstra_all_paths(graph, start)
+        reference[start] = distances
+
+    index = SCCIndex.for_graph(graph)
+    assert SCCIndex.for_graph(graph) is index
+    unreachable = 0
+    for start, distances in reference.items():
+        for end in nodes[::50]:
+            reachable = distances[end] != float('infinity')
+            assert index.can_reach(start, end) == reachable
+            if not reachable:
+                stats = {}
+                assert dijkstra(graph, start, end, stats) == (None, None)
+                assert stats['settled'] == 0
+                unreachable += 1
+    assert sum(len(c) for c in index.components()) == len(nodes)
+
+    # Sin clausura precalculada (muchas componentes) las respuestas son las mismas
+    lazy = SCCIndex.build(graph, closure_limit=0)
+    assert lazy.reach is None
+    for start in nodes[:40:4]:
+        for end in nodes[::50]:
+            assert lazy.can_reach(start, end) == index.can_reach(start, end)
+    for c in range(0, index.num_components, max(1, index.num_components // 20)):
+        assert lazy.reachable_nodes(c) == index.reachable_nodes(c)
+        assert sorted(lazy.reaching_nodes(c)) == sorted(
+            i for i in range(len(nodes)) if index._component_reaches(index.component[i], c))
+
+    # Un cambio en el grafo deja el índice viejo sin efecto
+    graph.add_edge(nodes[0], 'NUEVO', 1)
+    assert SCCIndex.cached(graph) is None
+    assert dijkstra(graph, nodes[0], 'NUEVO') == (1, [nodes[0], 'NUEVO'])
+
+    # Sin recursión: una cadena larga no agota la pila
+    chain = Graph()
+    chain.add_edges((f'C{i}', f'C{i + 1}', 1) for i in range(20000))
+    chain.add_edge('C20000', 'C0', 1)
+    assert SCCIndex.build(chain).num_components == 1
+
+    # Floyd-Warshall y Johnson restringidos a las componentes relevantes
+    small = Graph()
+    for source, destination, weight in [('A', 'B', 1), ('B', 'A', 2), ('B', 'C', 4), ('C', 'D', 1),
+                                        ('D', 'C', 1), ('E', 'A', 3), ('X', 'Y', -2), ('Y', 'X', 1)]:
+        small.add_edge(source, destination, weight)
+    expected = floyd_warshall(small)
+    small_index = SCCIndex.for_graph(small)
+    assert small_index.num_components == 4
+    assert floyd_warshall(small) == expected
+    assert floyd_warshall(small.to_compact()) == expected
+    rows = dict(johnson(small, sources=['A', 'E'], workers=1))
+    assert rows['E'] == {'E': 0, 'A': 3, 'B': 4, 'C': 8, 'D': 9}
+
+    print(f"  ✓ {index.num_components} componentes, {unreachable} consultas sin camino respondidas sin explorar")
+    print("  ✓ Invalidación por versión y Tarjan iterativo")
+    print("  ✓ Floyd-Warshall y Johnson restringidos a las componentes relevantes")
+    print("  ✓ Test pasado\n")
+
+
 def run_all_tests():
     """Ejecuta todas las pruebas."""
     print("=" * 60)
@@ -158,16 +970,40 @@ def run_all_tests():
         test_bellman_ford,
         test_floyd_warshall,
         test_graph_operations,
-        test_large_graph_performance
+        test_large_graph_performance,
+        test_compact_graph,
+        test_bulk_add_edges,
+        test_from_edge_csv,
+        test_snapshot_roundtrip,
+        test_node_table,
+        test_bidirectional_dijkstra,
+        test_astar,
+        test_contraction_hierarchies,
+        test_alt_landmarks,
+        test_floyd_warshall_matrix,
+        test_blocked_floyd_warshall,
+        test_johnson,
+        test_distance_matrix,
+        test_bellman_ford_spfa,
+        test_parallel_bellman_ford,
+        test_sssp_strategies,
+        test_path_cache,
+        test_dynamic_sssp,
+        test_k_shortest_paths,
+        test_scc_index
     ]
     
     passed = 0
     failed = 0
+    skipped = 0
     
     for test in tests:
         try:
             test()
             passed += 1
+        except pytest.skip.Exception as e:
+            print(f"  - Omitido: {e}\n")
+            skipped += 1
         except AssertionError as e:
             print(f"  ✗ Test falló: {e}\n")
             failed += 1
@@ -176,7 +1012,7 @@ def run_all_tests():
             failed += 1
     
     print("=" * 60)
-    print(f"RESULTADOS: {passed} pruebas pasadas, {failed} pruebas fallidas")
+    print(f"RESULTADOS: {passed} pruebas pasadas, {failed} pruebas fallidas, {skipped} omitidas")
     print("=" * 60)
     
     return failed == 0
@@ -0,0 +1,408 @@
+import sys
+import os
+import csv
+import json
+import shutil
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.graph import Graph
+from data.gdelt_parser import GDELTParser, POSITIVE_WORDS, NEGATIVE_WORDS
+from data.tone_classifier import ToneClassifier
+from data.gdelt_cache import CacheWriter, cache_path_for
+from data.gdelt_ingest import GDELTIngestor
+
+NUM_COLUMNS = 61  # Columnas de un export diario de GDELT 2.0
+
+
+def make_row(event_id: str, date: str, actor: str, url: str) -> str:
+    """Fila de export GDELT con solo las columnas que usa el parser."""
+    row = [''] * NUM_COLUMNS
+    row[0] = event_id
+    row[1] = date
+    row[6] = actor
+    row[43] = '10.5'
+    row[44] = '-20.25'
+    row[57] = url
+    return '\t'.join(row)
+
+
+def write_export(rows) -> str:
+    """Escribe un export temporal y retorna su ruta."""
+    file = tempfile.NamedTemporaryFile('w', suffix='.export.CSV', delete=False, encoding='utf-8')
+    with file:
+        file.write('\n'.join(rows) + '\n')
+    return file.name
+
+
+def remove_export(path: str):
+    """Borra el export temporal y su caché (si se escribió)."""
+    for file in (path, cache_path_for(path)):
+        if os.path.exists(file):
+            os.remove(file)
+
+
+SAMPLE_ROWS = [
+    make_row('1', '20251004', 'PEACE_TREATY_SIGNED', 'http://a'),
+    make_row('2', '20251004', 'WAR_IN_REGION', 'http://b'),
+    'fila\tcorta',
+    make_row('3', 'sin-fecha', 'ELECTION', 'http://c'),
+    make_row('4', '20251005', 'ELECTION', 'http://d'),
+    make_row('5', '20251005', '', 'http://e'),
+]
+
+
+def test_parse():
+    """Prueba parse() y get_data_for_graph() (filas inválidas se saltan)."""
+    print("Test 1: parse y get_data_for_graph")
+
+    path = write_export(SAMPLE_ROWS)
+    try:
+        parser = GDELTParser(path)
+        assert parser.parse() == 4
+        records = parser.get_data_for_graph()
+        assert [r['id'] for r in records] == ['1', '2', '4', '5']
+        assert records[0] == {'id': '1', 'headline': 'Peace Treaty Signed', 'date': '2025-10-04',
+                              'content': 'Peace Treaty Signed - Fuente: http://a', 'url': 'http://a',
+                              'tone': 5}
+        assert records[1]['tone'] == -5 and records[2]['tone'] == 0
+        assert records[3]['headline'] == 'Evento Internacional'
+        assert parser.events[0].latitude == 10.5
+
+        assert parser.parse(max_rows=2) == 2
+    finally:
+        remove_export(path)
+
+    print("  ✓ 4 eventos válidos de 6 filas")
+    print("  ✓ Test pasado\n")
+
+
+def test_streaming():
+    """Prueba iter_events / iter_graph_records con filtros, proyección y carga en el grafo."""
+    print("Test 2: Lectura en streaming")
+
+    path = write_export(SAMPLE_ROWS)
+    try:
+        parser = GDELTParser(path)
+        events = parser.iter_events()
+        assert not isinstance(events, list)
+        assert next(events).event_id == '1'
+
+        negative = list(parser.iter_events(filters=[lambda e: e.tone < 0]))
+        assert [e.event_id for e in negative] == ['2']
+
+        october_5 = parser.iter_events(max_rows=1, filters=[lambda e: e.date_obj.day == 5])
+        assert [e.event_id for e in october_5] == ['4']
+
+        projected = list(parser.iter_graph_records(fields=['id', 'date']))
+        assert projected[0] == {'id': '1', 'date': '2025-10-04'}
+        try:
+            list(parser.iter_graph_records(fields=['id', 'no_existe']))
+            assert False, "Debería rechazar campos desconocidos"
+        except ValueError:
+            pass
+
+        graph = Graph()
+        graph.load_from_news_dataset(parser.iter_graph_records(fields=['id', 'headline', 'date', 'tone']))
+        assert sorted(graph.get_all_nodes()) == ['1', '2', '4', '5']
+        assert graph.get_node('2').tone == -5
+        assert parser.events == []  # Nada quedó guardado en el parser
+        assert not os.path.exists(cache_path_for(path))  # Ni juntado para la caché
+
+        assert len(list(parser.iter_events(fill_cache=True))) == 4
+        assert parser.load_cached().complete
+    finally:
+        remove_export(path)
+
+    print("  ✓ Filtros, límite y proyección de campos")
+    print("  ✓ Graph.load_from_news_dataset consume el generador")
+    print("  ✓ El streaming solo llena la caché con fill_cache=True")
+    print("  ✓ Test pasado\n")
+
+
+def test_parse_parallel():
+    """Prueba que parse_parallel da los mismos eventos y en el mismo orden que parse()."""
+    print("Test 3: Parseo en paralelo")
+
+    rows = [make_row(str(i), f'202510{1 + i % 28:02d}', 'WAR_IN_REGION' if i % 3 else 'ELECTION',
+                     f'http://n/{i}') for i in range(200)]
+    rows[50] = 'fila\tcorta'
+    path = write_export(rows)
+    try:
+        serial = GDELTParser(path, use_cache=False)
+        assert serial.parse(max_rows=None) == 199
+
+        parallel = GDELTParser(path, use_cache=False)
+        # Rangos chicos: muchas filas quedan cortadas y hay que alinearlas
+        assert parallel.parse_parallel(workers=2, chunk_bytes=1000) == 199
+        assert parallel.events == serial.events
+
+        assert parallel.parse_parallel(workers=2, max_rows=30, chunk_bytes=1000) == 30
+        assert parallel.events == serial.events[:30]
+    finally:
+        remove_export(path)
+
+    # Un rango que falla (campo más largo que csv.field_size_limit) deja
+    # self.events vacío, igual que parse(), aunque otros rangos ya se unieran
+    rows[150] = make_row('150', '20251004', 'X' * (csv.field_size_limit() + 1), 'http://n/150')
+    path = write_export(rows)
+    try:
+        assert GDELTParser(path, use_cache=False).parse(max_rows=None) == 0
+        failing = GDELTParser(path, use_cache=False)
+        assert failing.parse_parallel(workers=2, chunk_bytes=1000) == 0
+        assert failing.events == []
+    finally:
+        remove_export(path)
+
+    print("  ✓ Mismos eventos y mismo orden que parse()")
+    print("  ✓ Un rango con error no deja eventos a medias")
+    print("  ✓ Test pasado\n")
+
+
+def test_tone_classifier():
+    """Prueba el clasificador Aho–Corasick contra la búsqueda palabra por palabra."""
+    print("Test 4: ToneClassifier")
+
+    def brute_force(title):
+        title_lower = title.lower()
+        if any(w.lower() in title_lower for w in POSITIVE_WORDS):
+            return 5
+        if any(w.lower() in title_lower for w in NEGATIVE_WORDS):
+            return -5
+        return 0
+
+    classifier = ToneClassifier(POSITIVE_WORDS, NEGATIVE_WORDS)
+    titles = ['Peace Treaty Signed', 'War In Region', 'Election', 'Window Cleaners',
+              'Fighters Rescued', 'Prisoners', 'Evento Internacional', '', 'DEADLINE']
+    assert classifier.score_many(titles) == [brute_force(t) for t in titles]
+    assert classifier.score('Window Cleaners') == 5  # 'win' por subcadena, igual que antes
+
+    # Palabras que son sufijo de otras ('he' dentro de 'she')
+    overlapping = ToneClassifier(['hers'], ['she', 'he'], positive_score=1, negative_score=-1)
+    assert overlapping.score_many(['ushers', 'ashe', 'her', 'xyz']) == [1, -1, -1, 0]
+
+    lexicon = tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8')
+    with lexicon:
+        lexicon.write('# léxico de prueba\n+calma\n\n-ELECTION\n')
+    try:
+        from_file = ToneClassifier.from_file(lexicon.name)
+        assert from_file.score_many(['Election Day', 'Calma Total', 'War']) == [-5, 5, 0]
+
+        path = write_export(SAMPLE_ROWS)
+        try:
+            parser = GDELTParser(path, classifier=from_file)
+            parser.parse()
+            assert [e.tone for e in parser.events] == [0, 0, -5, 0]
+        finally:
+            remove_export(path)
+    finally:
+        os.remove(lexicon.name)
+
+    print("  ✓ Mismo tono que la búsqueda palabra por palabra")
+    print("  ✓ Léxico desde archivo usado por el parser")
+    print("  ✓ Test pasado\n")
+
+
+def test_cache():
+    """Prueba la caché columnar: se escribe, se reusa y se invalida sola."""
+    print("Test 5: Caché columnar")
+
+    path = write_export(SAMPLE_ROWS)
+    try:
+        parser = GDELTParser(path)
+        assert parser.load_cached() is None
+        assert parser.parse(max_rows=2) == 2
+        expected = parser.events
+
+        # Solo cubre 2 eventos: sirve para max_rows <= 2, no para el archivo completo
+        partial = parser.load_cached(max_rows=2)
+        assert partial is not None and not partial.complete
+        assert partial[:] == expected
+        assert parser.load_cached() is None
+
+        assert parser.parse(max_rows=None) == 4
+        expected = parser.events
+        columns = parser.load_cached()
+        assert columns.complete and len(columns) == 4
+        assert list(columns.days) == [20365, 20365, 20366, 20366]  # días desde 1970-01-01
+        assert list(columns.tones) == [5, -5, 0, 0]
+        assert columns[1] == expected[1]
+
+        # Desde la caché: mismos eventos, también con filtros y en streaming
+        cached_parser = GDELTParser(path)
+        assert cached_parser.parse() == 4 and cached_parser.events == expected
+        negative = list(cached_parser.iter_events(filters=[lambda e: e.tone < 0]))
+        assert [e.event_id for e in negative] == ['2']
+        assert list(cached_parser.iter_graph_records()) == parser.get_data_for_graph()
+
+        # Otro clasificador u otro contenido del archivo invalidan la caché
+        other = ToneClassifier(['election'], [])
+        assert GDELTParser(path, classifier=other).load_cached() is None
+        with open(path, 'a', encoding='utf-8') as file:
+            file.write(make_row('6', '20251006', 'ELECTION', 'http://f') + '\n')
+        assert parser.load_cached() is None
+        assert parser.parse(max_rows=None) == 5
+
+        # Si el archivo crece mientras se parsea, la caché queda vieja
+        writer = CacheWriter(path, parser.classifier.signature)
+        for event in parser.events:
+            writer.add(event)
+        with open(path, 'a', encoding='utf-8') as file:
+            file.write(make_row('7', '20251006', 'ELECTION', 'http://g') + '\n')
+        assert writer.finish(complete=True)
+        assert parser.load_cached() is None
+        assert parser.parse(max_rows=None) == 6
+    finally:
+        remove_export(path)
+
+    print("  ✓ Caché parcial solo para pedidos que cubre")
+    print("  ✓ Mismos eventos desde la caché (parse, filtros, streaming)")
+    print("  ✓ Se invalida al cambiar el archivo o el clasificador")
+    print("  ✓ Un archivo que crece durante el parseo no queda con caché completa")
+    print("  ✓ Test pasado\n")
+
+
+def test_ingest():
+    """Prueba la ingesta incremental: archivos nuevos, bytes agregados y checkpoint."""
+    print("Test 6: Ingesta incremental")
+
+    directory = tempfile.mkdtemp()
+    checkpoint = os.path.join(directory, 'checkpoint.json')
+    first = os.path.join(directory, '20251004000000.export.CSV')
+    try:
+        with open(first, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(SAMPLE_ROWS[:2]) + '\n')
+            # Línea a medio escribir: se lee recién cuando se complete
+            file.write(make_row('3', '20251004', 'ELECTION', 'http://c')[:30])
+
+        graph, store = Graph(), []
+        ingestor = GDELTIngestor(directory, checkpoint_path=checkpoint)
+        assert ingestor.poll(graph, store) == 2
+        assert ingestor.poll(graph, store) == 0
+
+        with open(first, 'a', encoding='utf-8') as file:
+            file.write(make_row('3', '20251004', 'ELECTION', 'http://c')[30:] + '\n')
+        second = os.path.join(directory, '20251004001500.export.CSV')
+        with open(second, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(SAMPLE_ROWS[4:]) + '\n')
+
+        assert ingestor.poll(graph, store) == 3
+        assert [e.event_id for e in store] == ['1', '2', '3', '4', '5']
+        assert sorted(graph.get_all_nodes()) == ['1', '2', '3', '4', '5']
+        assert graph.get_node('1').tone == 5
+
+        # Otro proceso con el mismo checkpoint no repite nada
+        resumed = GDELTIngestor(directory, checkpoint_path=checkpoint)
+        assert resumed.poll() == 0
+        with open(second, 'a', encoding='utf-8') as file:
+            file.write(make_row('6', '20251005', 'PEACE', 'http://f') + '\n')
+        batches = list(resumed.follow(interval=0, max_polls=3))
+        assert [[e.event_id for e in batch] for batch in batches] == [['6']]
+
+        # Reemplazado por otro archivo del mismo tamaño: se relee desde el principio
+        size = os.path.getsize(first)
+        with open(first, 'w', encoding='utf-8') as file:
+            file.write('\n'.join([make_row('7', '20251004', 'PEACE_TREATY_SIGNED', 'http://a'),
+                                  make_row('8', '20251004', 'WAR_IN_REGION', 'http://b'),
+                                  make_row('9', '20251004', 'ELECTION', 'http://c')]) + '\n')
+        assert os.path.getsize(first) == size
+        replaced = []
+        assert resumed.poll(store=replaced) == 3
+        assert [e.event_id for e in replaced] == ['7', '8', '9']
+
+        # Un archivo que desaparece se borra del checkpoint
+        os.remove(second)
+        assert resumed.poll() == 0
+        with open(checkpoint, encoding='utf-8') as file:
+            assert list(json.load(file)['files']) == [os.path.abspath(first)]
+
+        # Por bloques: cada bloque se confirma al pedir el siguiente
+        big = os.path.join(directory, '20251005000000.export.CSV')
+        with open(big, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(make_row(f'B{i}', '20251005', 'ELECTION', f'http://{i}')
+                                 for i in range(10)) + '\n')
+        chunked = GDELTIngestor([big], checkpoint_path=checkpoint, chunk_bytes=300)
+        batches = chunked.iter_batches()
+        first_batch = next(batches)
+        assert 0 < len(first_batch) < 10
+        next(batches)  # Confirma el primer bloque
+        batches.close()
+        again = GDELTIngestor([big], checkpoint_path=checkpoint, chunk_bytes=300)
+        rest = [e.event_id for batch in again.iter_batches() for e in batch]
+        assert rest == [f'B{i}' for i in range(len(first_batch), 10)]
+
+        # Un archivo borrado entre files() y su lectura se saltea sin cortar la pasada
+        vanishing = GDELTIngestor(directory, checkpoint_path=checkpoint)
+        vanishing.poll()
+        third = os.path.join(directory, '20251006000000.export.CSV')
+        with open(third, 'w', encoding='utf-8') as file:
+            file.write(make_row('10', '20251006', 'ELECTION', 'http://g') + '\n')
+        listed = vanishing.files
+
+        def files_then_remove():
+            paths = listed()
+            os.remove(big)
+            return paths
+
+        vanishing.files = files_then_remove
+        store = []
+        assert vanishing.poll(store=store) == 1
+        assert [e.event_id for e in store] == ['10']
+        assert os.path.abspath(big) in vanishing.checkpoint
+        vanishing.files = listed
+        assert vanishing.poll() == 0
+        assert os.path.abspath(big) not in vanishing.checkpoint
+
+        # Lista de archivos en vez de directorio
+        only_first = GDELTIngestor([first])
+        store = []
+        assert only_first.poll(store=store) == 3
+        assert [e.event_id for e in store] == ['7', '8', '9']
+    finally:
+        shutil.rmtree(directory)
+
+    print("  ✓ Solo archivos nuevos y bytes agregados (líneas completas)")
+    print("  ✓ Checkpoint por bloque, detecta archivos reemplazados y borrados")
+    print("  ✓ Archivos borrados durante la pasada se saltean")
+    print("  ✓ Test pasado\n")
+
+
+def run_all_tests():
+    """Ejecuta todas las pruebas."""
+    print("=" * 60)
+    print("EJECUTANDO PRUEBAS DEL PARSER GDELT")
+    print("=" * 60 + "\n")
+
+    tests = [
+        test_parse,
+        test_streaming,
+        test_parse_parallel,
+        test_tone_classifier,
+        test_cache,
+        test_ingest
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  ✗ Test falló: {e}\n")
+            failed += 1
+        except Exception as e:
+            print(f"  ✗ Error inesperado: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULTADOS: {passed} pruebas pasadas, {failed} pruebas fallidas")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)